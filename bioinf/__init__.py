@@ -0,0 +1 @@
+"""Shared sequence helpers used by the lab scripts."""
@@ -0,0 +1,111 @@
+from collections import deque
+
+from bioinf.fasta import iter_fasta
+
+
+class AhoCorasick:
+    """
+    Multi-pattern exact matcher. The automaton is built once from all patterns
+    and a text is then scanned in a single pass, reporting every occurrence of
+    every pattern (overlapping ones included) as (pattern, start, end).
+    """
+
+    def __init__(self, patterns):
+        self.patterns = [p.upper() if isinstance(p, str) else p.decode("latin-1").upper() for p in patterns]
+        if not self.patterns or not all(self.patterns):
+            raise ValueError("Need at least one pattern, and patterns must be non-empty.")
+        self.max_len = max(len(p) for p in self.patterns)
+
+        alphabet = sorted(set("".join(self.patterns)))
+        if len(alphabet) > 255:
+            raise ValueError("Patterns use too many distinct symbols.")
+        self.width = len(alphabet) + 1
+        # byte -> column; every symbol absent from the patterns shares the last column
+        columns = bytearray([len(alphabet)] * 256)
+        for col, ch in enumerate(alphabet):
+            columns[ord(ch)] = col
+        self._columns = bytes(columns)
+        self._build()
+
+    def _build(self):
+        width = self.width
+        goto = [{}]
+        out = [()]
+        for k, pattern in enumerate(self.patterns):
+            node = 0
+            for b in pattern.encode("latin-1").translate(self._columns):
+                if b not in goto[node]:
+                    goto[node][b] = len(goto)
+                    goto.append({})
+                    out.append(())
+                node = goto[node][b]
+            out[node] += (k,)
+
+        # complete transition table, so scanning never follows failure links
+        delta = [0] * (len(goto) * width)
+        fail = [0] * len(goto)
+        for col, child in goto[0].items():
+            delta[col] = child
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            out[node] += out[fail[node]]
+            base = node * width
+            fbase = fail[node] * width
+            for col in range(width):
+                child = goto[node].get(col)
+                if child is None:
+                    delta[base + col] = delta[fbase + col]
+                else:
+                    delta[base + col] = child
+                    fail[child] = delta[fbase + col]
+                    queue.append(child)
+        self._delta = delta
+        self._out = out
+
+    def _scan(self, text, offset, state):
+        if isinstance(text, str):
+            text = text.encode("latin-1")
+        text = bytes(text).upper().translate(self._columns)
+        delta, out, width, patterns = self._delta, self._out, self.width, self.patterns
+        node = state
+        for i, col in enumerate(text):
+            node = delta[node * width + col]
+            if out[node]:
+                end = offset + i + 1
+                for k in out[node]:
+                    yield patterns[k], end - len(patterns[k]), end
+        return node
+
+    def iter_matches(self, text):
+        """
+        Yield (pattern, start, end) for every hit in text, in order of end position.
+        """
+        yield from self._scan(text, 0, 0)
+
+    def find_all(self, text):
+        """
+        List of (pattern, start, end) hits, sorted by start position.
+        """
+        return sorted(self.iter_matches(text), key=lambda h: (h[1], h[2]))
+
+    def scan_chunks(self, chunks):
+        """
+        Scan a text delivered in consecutive chunks (e.g. streamed from disk).
+        The automaton state is carried from one chunk to the next, so hits that
+        span a chunk boundary are still reported, with global coordinates.
+        """
+        offset = 0
+        state = 0
+        for chunk in chunks:
+            state = yield from self._scan(chunk, offset, state)
+            offset += len(chunk)
+
+    def scan_fasta(self, path):
+        """
+        Yield (record, pattern, start, end) for every record of a FASTA file.
+        Matching restarts at each record, so no hit spans two records.
+        """
+        for name, seq in iter_fasta(path):
+            for pattern, start, end in self._scan(seq, 0, 0):
+                yield name, pattern, start, end
@@ -0,0 +1,186 @@
+import numpy as np
+
+# above this many DP cells global alignment switches from the full matrix to Hirschberg
+FULL_MATRIX_MAX_CELLS = 250_000
+
+
+def _as_array(seq):
+    if isinstance(seq, str):
+        seq = seq.encode("latin-1")
+    if isinstance(seq, (bytes, bytearray, memoryview)):
+        return np.frombuffer(seq, dtype=np.uint8)
+    return np.asarray(seq, dtype=np.uint8)
+
+
+def _next_row(prev, a_char, b, i, match, mismatch, gap):
+    """
+    Needleman-Wunsch row i from row i-1 with a linear gap penalty.
+    The left-to-right dependency H[i][j] = H[i][j-1] + gap is resolved as a
+    running maximum of (t[k] - k*gap) instead of a Python loop.
+    """
+    sub = np.where(b == a_char, match, mismatch)
+    t = np.empty_like(prev)
+    t[0] = i * gap
+    t[1:] = np.maximum(prev[:-1] + sub, prev[1:] + gap)
+    steps = np.arange(len(prev)) * gap
+    return np.maximum.accumulate(t - steps) + steps
+
+
+def nw_last_row(seq1, seq2, match=1, mismatch=-1, gap=-1):
+    """
+    Last row of the global alignment score matrix, computed in O(len(seq2)) memory.
+    """
+    a, b = _as_array(seq1), _as_array(seq2)
+    row = np.arange(len(b) + 1, dtype=np.int64) * gap
+    for i in range(1, len(a) + 1):
+        row = _next_row(row, a[i - 1], b, i, match, mismatch, gap)
+    return row
+
+
+def nw_score(seq1, seq2, match=1, mismatch=-1, gap=-1):
+    """
+    Optimal global alignment score in linear memory.
+    """
+    if len(seq1) > len(seq2):
+        seq1, seq2 = seq2, seq1
+    return int(nw_last_row(seq1, seq2, match, mismatch, gap)[-1])
+
+
+def nw_matrix(seq1, seq2, match=1, mismatch=-1, gap=-1):
+    """
+    Full (n+1) x (m+1) score matrix, for small inputs only.
+    """
+    a, b = _as_array(seq1), _as_array(seq2)
+    score = np.empty((len(a) + 1, len(b) + 1), dtype=np.int64)
+    score[0] = np.arange(len(b) + 1) * gap
+    for i in range(1, len(a) + 1):
+        score[i] = _next_row(score[i - 1], a[i - 1], b, i, match, mismatch, gap)
+    return score
+
+
+def nw_traceback(seq1, seq2, score, match=1, mismatch=-1, gap=-1):
+    """
+    Walk back through a full score matrix; prefers diagonal, then up, then left.
+    Returns (aligned1, aligned2, path).
+    """
+    aligned1, aligned2, path = [], [], []
+    i, j = len(seq1), len(seq2)
+    while i > 0 or j > 0:
+        path.append((i, j))
+        current = score[i][j]
+        if i > 0 and j > 0 and current == score[i - 1][j - 1] + (match if seq1[i - 1] == seq2[j - 1] else mismatch):
+            aligned1.append(seq1[i - 1])
+            aligned2.append(seq2[j - 1])
+            i -= 1
+            j -= 1
+        elif i > 0 and current == score[i - 1][j] + gap:
+            aligned1.append(seq1[i - 1])
+            aligned2.append("-")
+            i -= 1
+        else:
+            aligned1.append("-")
+            aligned2.append(seq2[j - 1])
+            j -= 1
+    path.append((0, 0))
+    return "".join(reversed(aligned1)), "".join(reversed(aligned2)), path
+
+
+def needleman_wunsch(seq1, seq2, match=1, mismatch=-1, gap=-1):
+    """
+    Full-matrix global alignment: (score matrix, aligned1, aligned2, path).
+    Meant for inputs small enough to plot the matrix.
+    """
+    if (len(seq1) + 1) * (len(seq2) + 1) > FULL_MATRIX_MAX_CELLS:
+        raise ValueError("Sequences too long for the full score matrix; use hirschberg() instead.")
+    score = nw_matrix(seq1, seq2, match, mismatch, gap)
+    aligned1, aligned2, path = nw_traceback(seq1, seq2, score, match, mismatch, gap)
+    return score, aligned1, aligned2, path
+
+
+def _hirschberg(seq1, seq2, match, mismatch, gap, out1, out2):
+    n, m = len(seq1), len(seq2)
+    if n == 0:
+        out1.append("-" * m)
+        out2.append(seq2)
+        return
+    if m == 0:
+        out1.append(seq1)
+        out2.append("-" * n)
+        return
+    if n == 1 or (n + 1) * (m + 1) <= 4096:
+        score = nw_matrix(seq1, seq2, match, mismatch, gap)
+        a1, a2, _ = nw_traceback(seq1, seq2, score, match, mismatch, gap)
+        out1.append(a1)
+        out2.append(a2)
+        return
+
+    mid = n // 2
+    left = nw_last_row(seq1[:mid], seq2, match, mismatch, gap)
+    right = nw_last_row(seq1[mid:][::-1], seq2[::-1], match, mismatch, gap)[::-1]
+    split = int(np.argmax(left + right))
+    _hirschberg(seq1[:mid], seq2[:split], match, mismatch, gap, out1, out2)
+    _hirschberg(seq1[mid:], seq2[split:], match, mismatch, gap, out1, out2)
+
+
+def hirschberg(seq1, seq2, match=1, mismatch=-1, gap=-1):
+    """
+    Optimal global alignment in linear memory (Hirschberg divide and conquer).
+    Returns (aligned1, aligned2, score).
+    """
+    # each DP row is one vectorized step, so iterate over the shorter sequence
+    swap = len(seq1) > len(seq2)
+    if swap:
+        seq1, seq2 = seq2, seq1
+    out1, out2 = [], []
+    _hirschberg(seq1, seq2, match, mismatch, gap, out1, out2)
+    aligned1, aligned2 = "".join(out1), "".join(out2)
+    if swap:
+        aligned1, aligned2 = aligned2, aligned1
+    return aligned1, aligned2, alignment_score(aligned1, aligned2, match, mismatch, gap)
+
+
+def alignment_score(aligned1, aligned2, match=1, mismatch=-1, gap=-1):
+    a, b = _as_array(aligned1), _as_array(aligned2)
+    gaps = (a == ord("-")) | (b == ord("-"))
+    same = (a == b) & ~gaps
+    return int(same.sum() * match + (~same & ~gaps).sum() * mismatch + gaps.sum() * gap)
+
+
+def global_align(seq1, seq2, match=1, mismatch=-1, gap=-1):
+    """
+    Global alignment that picks the full matrix for small inputs and Hirschberg otherwise.
+    Returns (aligned1, aligned2, score).
+    """
+    if (len(seq1) + 1) * (len(seq2) + 1) <= FULL_MATRIX_MAX_CELLS:
+        score, aligned1, aligned2, _ = needleman_wunsch(seq1, seq2, match, mismatch, gap)
+        return aligned1, aligned2, int(score[-1][-1])
+    return hirschberg(seq1, seq2, match, mismatch, gap)
+
+
+def sw_score(seq1, seq2, match=2, mismatch=-1, gap=-2):
+    """
+    Best Smith-Waterman local alignment score (linear gap penalty).
+
+    The matrix is filled one anti-diagonal at a time: every cell of diagonal
+    i+j=d depends only on diagonals d-1 and d-2, so a whole diagonal is a few
+    NumPy operations and only those two previous diagonals are kept.
+    """
+    a, b = _as_array(seq1), _as_array(seq2)
+    n, m = len(a), len(b)
+    if n == 0 or m == 0:
+        return 0
+    # diagonal d covers cells (i, d - i); with seq2 reversed the characters
+    # s2[d - i - 1] for consecutive i form one contiguous slice
+    b_rev = b[::-1]
+    prev2 = np.zeros(n + 1, dtype=np.int32)
+    prev1 = np.zeros(n + 1, dtype=np.int32)
+    cur = np.zeros(n + 1, dtype=np.int32)
+    best = np.zeros(n + 1, dtype=np.int32)
+    for d in range(2, n + m + 1):
+        lo, hi = max(1, d - m), min(n, d - 1)
+        sub = np.where(a[lo - 1:hi] == b_rev[m - d + lo:m - d + hi + 1], match, mismatch)
+        h = np.maximum(prev2[lo - 1:hi] + sub, np.maximum(prev1[lo - 1:hi], prev1[lo:hi + 1]) + gap)
+        np.maximum(h, 0, out=cur[lo:hi + 1])
+        np.maximum(best[lo:hi + 1], cur[lo:hi + 1], out=best[lo:hi + 1])
+        prev2, prev1, cur = prev1, cur, prev2
+    return int(best.max())
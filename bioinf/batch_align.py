@@ -0,0 +1,188 @@
+"""
+Many-vs-many Smith-Waterman scoring.
+
+    scores = align_all(queries, targets)
+    starts1, starts2, scores = window_scores(influenza, covid, window=200, step=50)
+
+Equal-length targets are stacked and turned into a profile (symbol x target
+position x target -> substitution score), so a query is scored against the
+whole stack at once: one DP row is a handful of NumPy operations.
+Row blocks of the score matrix are spread over a process pool; the sequence
+buffers are placed in shared memory once instead of being pickled per task.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from bioinf.align import _as_array
+from bioinf.windows import window_starts
+
+# targets scored together per DP row; bounds the profile size
+TARGET_CHUNK = 4096
+
+# filled in each worker process by _init_worker
+_shared = {}
+
+
+def target_profile(targets, alphabet_size, match=2, mismatch=-1):
+    """
+    Substitution scores of every query symbol against a stack of equal-length
+    targets, shaped (symbol, target position, target). Built once per stack
+    and shared by all the queries scored against it.
+    """
+    columns = np.ascontiguousarray(targets.T)
+    return np.stack([np.where(columns == c, match, mismatch).astype(np.int32) for c in range(alphabet_size)])
+
+
+def sw_scores_profile(query, profile, gap=-2):
+    """
+    Best local score of one encoded query against every target of a profile.
+    Only the previous DP row (one column per target) is kept.
+
+    With a linear gap penalty H[i][j] = max(t[j], H[i][j-1] + gap), where t
+    already holds the 0/diagonal/up terms, so a row is a running maximum of
+    t[k] - k*gap instead of a loop over j.
+    """
+    _, m, n_targets = profile.shape
+    prev = np.zeros((m + 1, n_targets), dtype=np.int32)
+    best = np.zeros(n_targets, dtype=np.int32)
+    if m == 0:
+        return best
+    t = np.zeros_like(prev)
+    steps = (np.arange(m + 1, dtype=np.int32) * gap)[:, None]
+    for c in query:
+        np.add(prev[:-1], profile[c], out=t[1:])
+        np.maximum(t[1:], prev[1:] + gap, out=t[1:])
+        np.maximum(t[1:], 0, out=t[1:])
+        np.subtract(t, steps, out=t)
+        np.maximum.accumulate(t, axis=0, out=prev)
+        prev += steps
+        np.maximum(best, prev.max(axis=0), out=best)
+    return best
+
+
+def _encode(buffers):
+    """
+    Map the bytes of several buffers onto one compact alphabet 0..k-1.
+    """
+    arrays = [_as_array(b) for b in buffers]
+    alphabet = np.unique(np.concatenate(arrays)) if any(len(a) for a in arrays) else np.zeros(0, np.uint8)
+    lookup = np.zeros(256, dtype=np.uint8)
+    lookup[alphabet] = np.arange(len(alphabet), dtype=np.uint8)
+    return [lookup[a] for a in arrays], max(len(alphabet), 1)
+
+
+def _flatten(seqs):
+    arrays = [_as_array(s) for s in seqs]
+    lengths = np.array([len(a) for a in arrays], dtype=np.int64)
+    starts = np.cumsum(lengths) - lengths
+    buf = np.concatenate(arrays) if arrays else np.zeros(0, dtype=np.uint8)
+    return buf, starts, lengths
+
+
+def _score_rows(rows, qbuf, qstarts, qlengths, tbuf, tstarts, tlengths, alphabet_size, match, mismatch, gap):
+    """
+    Scores of the queries `rows` against all targets.
+
+    Targets are grouped by length and gathered in chunks of TARGET_CHUNK; the
+    profile of a chunk is built once and reused for every query. Overlapping
+    windows are only offsets into one genome buffer until they are gathered.
+    """
+    out = np.zeros((len(rows), len(tstarts)), dtype=np.int32)
+    for length in np.unique(tlengths):
+        same = np.flatnonzero(tlengths == length)
+        for k in range(0, len(same), TARGET_CHUNK):
+            idx = same[k:k + TARGET_CHUNK]
+            profile = target_profile(tbuf[tstarts[idx, None] + np.arange(length)], alphabet_size, match, mismatch)
+            for r, q in enumerate(rows):
+                query = qbuf[qstarts[q]:qstarts[q] + qlengths[q]]
+                out[r, idx] = sw_scores_profile(query, profile, gap)
+    return out
+
+
+def _attach(name, dtype, shape):
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+
+def _init_worker(specs, params):
+    for key, (name, dtype, shape) in specs.items():
+        shm, arr = _attach(name, dtype, shape)
+        _shared[key] = arr
+        _shared[key + "_shm"] = shm
+    _shared["params"] = params
+
+
+def _score_rows_job(rows):
+    s = _shared
+    return rows, _score_rows(rows, s["qbuf"], s["qstarts"], s["qlengths"],
+                             s["tbuf"], s["tstarts"], s["tlengths"], *s["params"])
+
+
+def _score_matrix(qbuf, qstarts, qlengths, tbuf, tstarts, tlengths, alphabet_size,
+                  match, mismatch, gap, workers, block):
+    n_queries, n_targets = len(qstarts), len(tstarts)
+    params = (alphabet_size, match, mismatch, gap)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1 or n_queries <= 1:
+        return _score_rows(np.arange(n_queries), qbuf, qstarts, qlengths,
+                           tbuf, tstarts, tlengths, *params)
+
+    arrays = {"qbuf": qbuf, "qstarts": qstarts, "qlengths": qlengths,
+              "tbuf": tbuf, "tstarts": tstarts, "tlengths": tlengths}
+    blocks = {}
+    specs = {}
+    try:
+        for key, arr in arrays.items():
+            shm = shared_memory.SharedMemory(create=True, size=max(arr.nbytes, 1))
+            blocks[key] = shm
+            np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[...] = arr
+            specs[key] = (shm.name, arr.dtype.str, arr.shape)
+
+        if block is None:
+            block = max(1, -(-n_queries // (workers * 4)))
+        jobs = [np.arange(i, min(i + block, n_queries)) for i in range(0, n_queries, block)]
+        scores = np.zeros((n_queries, n_targets), dtype=np.int32)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(specs, params)) as pool:
+            for rows, part in pool.map(_score_rows_job, jobs):
+                scores[rows] = part
+        return scores
+    finally:
+        for shm in blocks.values():
+            shm.close()
+            shm.unlink()
+
+
+def align_all(queries, targets, match=2, mismatch=-1, gap=-2, workers=1, block=None):
+    """
+    (len(queries), len(targets)) matrix of best Smith-Waterman local scores.
+    Same scores as bioinf.align.sw_score for every pair.
+    workers=None uses all cores.
+    """
+    qbuf, qstarts, qlengths = _flatten(queries)
+    tbuf, tstarts, tlengths = _flatten(targets)
+    (qbuf, tbuf), alphabet_size = _encode([qbuf, tbuf])
+    return _score_matrix(qbuf, qstarts, qlengths, tbuf, tstarts, tlengths, alphabet_size,
+                         match, mismatch, gap, workers, block)
+
+
+def window_scores(seq1, seq2, window=200, step=None, match=2, mismatch=-1, gap=-2, workers=1, block=None):
+    """
+    Local alignment scores of every window of seq1 against every window of seq2.
+    Windows may overlap (step < window); they are taken as offsets into the two
+    encoded genomes rather than copied out as separate strings.
+    Returns (starts1, starts2, scores).
+    """
+    step = window if step is None else step
+    (a, b), alphabet_size = _encode([seq1, seq2])
+    starts1 = window_starts(len(a), window, step)
+    starts2 = window_starts(len(b), window, step)
+    scores = _score_matrix(a, starts1, np.full(len(starts1), window, dtype=np.int64),
+                           b, starts2, np.full(len(starts2), window, dtype=np.int64),
+                           alphabet_size, match, mismatch, gap, workers, block)
+    return starts1, starts2, scores
@@ -0,0 +1,213 @@
+"""
+Codon usage of many genomes, counted in fixed-size arrays.
+
+    python -m bioinf.codons genomes/*.fasta --workers 4 --out usage
+
+Each file is streamed record by record into a (3, 64) array: codon counts
+of the three forward reading frames, codons numbered as in
+bioinf.translate. These arrays simply add up, so files are counted in a
+process pool and merged afterwards. RSCU, CAI, amino-acid usage and the
+pairwise distance matrix are then computed for all genomes at once from
+the stacked (genomes, 64) counts.
+"""
+
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import reduce
+
+import numpy as np
+
+from bioinf.fasta import iter_fasta
+from bioinf.packed import as_codes
+from bioinf.translate import GENETIC_CODES, NO_CODON, codon_codes, codon_names, codon_table
+
+# bases counted per step when streaming a record (a multiple of 3)
+BLOCK = 3 << 20
+
+
+class CodonUsage:
+    """
+    Codon counts of the three forward frames of any number of sequences.
+    Usages of different files can be added together.
+    """
+
+    def __init__(self, name="", counts=None, records=0):
+        self.name = name
+        self.counts = np.zeros((3, 64), dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        self.records = records
+
+    def add(self, seq):
+        """
+        Count one record; frame f holds the codons starting at positions f, f+3, ...
+        Ambiguous codons are skipped.
+        """
+        codes = as_codes(seq)
+        for start in range(0, max(len(codes) - 2, 0), BLOCK):
+            codons = codon_codes(codes[start:start + BLOCK + 2])
+            for frame in range(3):
+                self.counts[frame] += np.bincount(codons[frame::3], minlength=NO_CODON + 1)[:64]
+        self.records += 1
+        return self
+
+    def __add__(self, other):
+        return CodonUsage(self.name or other.name, self.counts + other.counts, self.records + other.records)
+
+    @classmethod
+    def from_fasta(cls, path, name=None):
+        usage = cls(os.path.basename(path) if name is None else name)
+        for _, seq in iter_fasta(path):
+            usage.add(seq)
+        return usage
+
+
+def profile_files(paths, workers=1):
+    """
+    CodonUsage of every FASTA file, counted in a process pool (workers=None: all cores).
+    """
+    paths = list(paths)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 1 or len(paths) <= 1:
+        return [CodonUsage.from_fasta(p) for p in paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(CodonUsage.from_fasta, paths))
+
+
+def merge(usages, name="total"):
+    return reduce(lambda a, b: a + b, usages, CodonUsage(name))
+
+
+def stack(usages, frame=0):
+    """
+    (genomes, 64) counts of one frame.
+    """
+    return np.stack([u.counts[frame] for u in usages]) if usages else np.zeros((0, 64), dtype=np.int64)
+
+
+def synonym_groups(table=1):
+    """
+    (amino acid letters, (64, amino acids) 0/1 matrix) of the table's
+    synonymous codon families; stop codons form their own family '*'.
+    """
+    aa, _, _ = codon_table(table)
+    letters = aa[:64].tobytes().decode("ascii")
+    names = sorted(set(letters))
+    groups = (np.frombuffer(letters.encode(), dtype=np.uint8)[:, None] ==
+              np.frombuffer("".join(names).encode(), dtype=np.uint8)).astype(np.float64)
+    return names, groups
+
+
+def rscu(counts, table=1):
+    """
+    Relative synonymous codon usage: each codon's count divided by the mean
+    count of its synonymous family. counts is (64,) or (genomes, 64);
+    NaN where the family is absent.
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    _, groups = synonym_groups(table)
+    family_mean = (counts @ groups) / groups.sum(axis=0)
+    expected = family_mean @ groups.T
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(expected > 0, counts / expected, np.nan)
+
+
+def relative_adaptiveness(reference, table=1, floor=0.01):
+    """
+    CAI weights w = RSCU / highest RSCU of the family, from reference counts.
+    Weights of unseen codons are raised to `floor` so that they do not zero the CAI.
+    """
+    values = np.nan_to_num(rscu(reference, table))
+    _, groups = synonym_groups(table)
+    best = (values[:, None] * groups).max(axis=0) @ groups.T
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weights = np.where(best > 0, values / best, 0.0)
+    return np.maximum(weights, floor)
+
+
+def cai(counts, weights, table=1):
+    """
+    Codon adaptation index of each row of counts: geometric mean of the
+    weights of its codons. Stop codons and single-codon families (Met, Trp)
+    are left out.
+    """
+    counts = np.atleast_2d(np.asarray(counts, dtype=np.float64))
+    names, groups = synonym_groups(table)
+    excluded = groups.sum(axis=0) == 1
+    excluded[names.index("*")] = True
+    informative = groups @ excluded == 0
+    used = counts[:, informative]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.exp((used @ np.log(weights[informative])) / used.sum(axis=1))
+
+
+def amino_acid_usage(counts, table=1):
+    """
+    (amino acid letters, fractions) of the translated codons, stops excluded.
+    """
+    counts = np.atleast_2d(np.asarray(counts, dtype=np.float64))
+    names, groups = synonym_groups(table)
+    totals = counts @ groups
+    keep = [k for k, name in enumerate(names) if name != "*"]
+    totals = totals[:, keep]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return [names[k] for k in keep], totals / totals.sum(axis=1, keepdims=True)
+
+
+def usage_distance(counts):
+    """
+    (genomes, genomes) Euclidean distances between codon frequency profiles,
+    from one matrix product.
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    freqs = counts / np.maximum(counts.sum(axis=1, keepdims=True), 1)
+    squares = (freqs * freqs).sum(axis=1)
+    dist2 = squares[:, None] + squares[None, :] - 2 * freqs @ freqs.T
+    dist = np.sqrt(np.maximum(dist2, 0))
+    np.fill_diagonal(dist, 0)
+    return dist
+
+
+def _write_table(path, names, columns, values, fmt="{:.4f}"):
+    with open(path, "w") as f:
+        f.write("genome\t" + "\t".join(columns) + "\n")
+        for name, row in zip(names, values.tolist()):
+            f.write(name + "\t" + "\t".join(fmt.format(v) for v in row) + "\n")
+
+
+def write_tables(usages, prefix, table=1, frame=0):
+    """
+    Write <prefix>_counts/_rscu/_aa/_cai/_distance.tsv for the usages.
+    The CAI reference is the merged usage of all genomes.
+    """
+    names = [u.name for u in usages]
+    counts = stack(usages, frame)
+    aa, _, _ = codon_table(table)
+    columns = [c + "(" + chr(a) + ")" for c, a in zip(codon_names(), aa[:64].tolist())]
+    _write_table(prefix + "_counts.tsv", names, columns, counts, "{:.0f}")
+    _write_table(prefix + "_rscu.tsv", names, columns, rscu(counts, table))
+    letters, usage = amino_acid_usage(counts, table)
+    _write_table(prefix + "_aa.tsv", names, letters, usage)
+    weights = relative_adaptiveness(counts.sum(axis=0), table)
+    _write_table(prefix + "_cai.tsv", names, ["cai"], cai(counts, weights, table)[:, None])
+    _write_table(prefix + "_distance.tsv", names, names, usage_distance(counts))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Codon usage tables of many FASTA files.")
+    parser.add_argument("fasta", nargs="+")
+    parser.add_argument("--table", type=int, default=1, choices=sorted(GENETIC_CODES), help="NCBI genetic code")
+    parser.add_argument("--frame", type=int, default=0, choices=(0, 1, 2))
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--out", default="codon_usage", help="prefix of the output tables")
+    args = parser.parse_args(argv)
+
+    usages = profile_files(args.fasta, args.workers)
+    write_tables(usages, args.out, args.table, args.frame)
+    total = merge(usages)
+    print(f"{total.counts[args.frame].sum()} codons in {total.records} records of {len(usages)} files; "
+          f"tables saved to {args.out}_*.tsv")
+
+
+if __name__ == "__main__":
+    main()
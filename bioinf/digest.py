@@ -0,0 +1,153 @@
+import os
+import re
+from collections import namedtuple
+from itertools import product
+
+import numpy as np
+
+from bioinf.ahocorasick import AhoCorasick
+
+ENZYME_TABLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "enzymes.txt")
+
+IUPAC = {
+    "A": "A", "C": "C", "G": "G", "T": "T",
+    "R": "AG", "Y": "CT", "S": "CG", "W": "AT", "K": "GT", "M": "AC",
+    "B": "CGT", "D": "AGT", "H": "ACT", "V": "ACG", "N": "ACGT",
+}
+COMPLEMENT = str.maketrans("ACGTRYSWKMBDHVN", "TGCAYRSWMKVHDBN")
+
+# cut = top-strand cut and bottom_cut = bottom-strand cut, both counted from the
+# start of the site on the top strand (they may fall outside the site).
+Enzyme = namedtuple("Enzyme", ["name", "site", "cut", "bottom_cut"])
+
+_OFFSET_SITE = re.compile(r"^([A-Z]+)\((-?\d+)/(-?\d+)\)$")
+
+
+def reverse_complement(site):
+    return site.translate(COMPLEMENT)[::-1]
+
+
+def parse_site(name, text):
+    """
+    Build an Enzyme from 'G^AATTC' or 'GGTCTC(1/5)' notation.
+    """
+    text = text.strip().upper()
+    m = _OFFSET_SITE.match(text)
+    if m:
+        site = m.group(1)
+        cut, bottom_cut = len(site) + int(m.group(2)), len(site) + int(m.group(3))
+    elif text.count("^") == 1:
+        site = text.replace("^", "")
+        cut = text.index("^")
+        bottom_cut = len(site) - cut
+    else:
+        raise ValueError(f"Cannot parse recognition site '{text}' for {name}.")
+    if not site or any(ch not in IUPAC for ch in site):
+        raise ValueError(f"Invalid recognition site '{text}' for {name}.")
+    return Enzyme(name, site, cut, bottom_cut)
+
+
+def load_enzymes(path=ENZYME_TABLE):
+    """
+    Read a REBASE-style table (name, whitespace, site) into a dict name -> Enzyme.
+    """
+    enzymes = {}
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            name, site = line.split()[:2]
+            enzymes[name] = parse_site(name, site)
+    return enzymes
+
+
+def expand_site(site):
+    """
+    All concrete A/C/G/T sequences matched by a degenerate IUPAC site.
+    """
+    return ["".join(p) for p in product(*(IUPAC[ch] for ch in site))]
+
+
+class Digester:
+    """
+    Finds the cut sites of many enzymes in one pass over a sequence.
+
+    Every enzyme site and its reverse complement are expanded to concrete
+    sequences and loaded into a single Aho-Corasick automaton, so each scan
+    reports the cuts of all enzymes, on both strands, together.
+    """
+
+    def __init__(self, enzymes):
+        if isinstance(enzymes, dict):
+            enzymes = list(enzymes.values())
+        self.enzymes = list(enzymes)
+        self.names = [e.name for e in self.enzymes]
+        self.max_site = max(len(e.site) for e in self.enzymes)
+
+        self._targets = {}
+        for k, e in enumerate(self.enzymes):
+            # a hit of the site at p cuts the top strand at p + cut; a hit of its
+            # reverse complement at p cuts the top strand at p + len - bottom_cut
+            offsets = {(k, e.cut)}
+            rc_offsets = {(k, len(e.site) - e.bottom_cut)}
+            for concrete in expand_site(e.site):
+                self._targets.setdefault(concrete, set()).update(offsets)
+            for concrete in expand_site(reverse_complement(e.site)):
+                self._targets.setdefault(concrete, set()).update(rc_offsets)
+        self._automaton = AhoCorasick(list(self._targets))
+
+    def cut_sites(self, seq, circular=False):
+        """
+        Dict enzyme name -> sorted array of top-strand cut positions.
+        A cut at position p falls between seq[p-1] and seq[p].
+        """
+        n = len(seq)
+        text = seq + seq[:self.max_site - 1] if circular else seq
+        cuts = [[] for _ in self.enzymes]
+        for pattern, start, _ in self._automaton.iter_matches(text):
+            if start >= n:
+                continue
+            for k, offset in self._targets[pattern]:
+                cuts[k].append(start + offset)
+
+        result = {}
+        for name, positions in zip(self.names, cuts):
+            positions = np.asarray(positions, dtype=np.int64)
+            if circular:
+                positions = positions % n if n else positions
+            else:
+                positions = positions[(positions > 0) & (positions < n)]
+            result[name] = np.unique(positions)
+        return result
+
+
+def combine_cuts(cut_sites, names=None):
+    """
+    Sorted union of the cut positions of the chosen enzymes (all by default).
+    """
+    chosen = [cut_sites[n] for n in (names if names is not None else cut_sites)]
+    if not chosen:
+        return np.zeros(0, dtype=np.int64)
+    return np.unique(np.concatenate(chosen))
+
+
+def fragment_lengths(length, cuts, circular=False):
+    """
+    Fragment sizes produced by cutting a sequence of `length` at `cuts`.
+    """
+    cuts = np.unique(np.asarray(cuts, dtype=np.int64))
+    if circular:
+        if len(cuts) == 0:
+            return np.array([length], dtype=np.int64)
+        return np.append(np.diff(cuts), length - cuts[-1] + cuts[0])
+    return np.diff(np.concatenate(([0], cuts, [length])))
+
+
+def digest(seq, enzymes, circular=False):
+    """
+    Cut positions and fragment lengths for seq digested by all `enzymes` together.
+    """
+    sites = Digester(enzymes).cut_sites(seq, circular)
+    cuts = combine_cuts(sites)
+    return cuts, fragment_lengths(len(seq), cuts, circular)
@@ -0,0 +1,128 @@
+import mmap
+import os
+
+from bioinf.fasta import clean_sequence, is_gzip, record_spans
+
+
+def index_path(fasta_path):
+    """
+    The index lives in <fasta>.bfai, not .fai: its names are full header lines,
+    which samtools would cut at the first space and write back over a .fai.
+    """
+    return fasta_path + ".bfai"
+
+
+def _record_layout(body, name):
+    """
+    (length, line_bases, line_width) of one record body, checking that every
+    line except the last has the same width.
+    """
+    if not body:
+        return 0, 0, 0
+    lines = body.split(b"\n")
+    if lines[-1] == b"":
+        lines.pop()
+    line_width = len(lines[0]) + 1
+    line_bases = len(lines[0].rstrip(b"\r"))
+    length = 0
+    for k, line in enumerate(lines):
+        bases = len(line.rstrip(b"\r"))
+        if k < len(lines) - 1 and (len(line) + 1 != line_width or bases != line_bases):
+            raise ValueError(f"Record '{name}' has lines of different lengths; cannot index it.")
+        if k == len(lines) - 1 and bases > line_bases:
+            raise ValueError(f"Record '{name}' has lines of different lengths; cannot index it.")
+        length += bases
+    return length, line_bases, line_width
+
+
+def build_index(fasta_path):
+    """
+    Scan the FASTA file once and write its index next to it, in the samtools
+    .fai column layout: name (the full header), length, byte offset of the
+    sequence, bases per line, bytes per line. Returns the rows as a list of tuples.
+    """
+    if is_gzip(fasta_path):
+        raise ValueError("Gzip-compressed FASTA files cannot be indexed; decompress them first.")
+
+    entries = []
+    with open(fasta_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for name, start, end in record_spans(mm):
+                    length, line_bases, line_width = _record_layout(mm[start:end], name)
+                    entries.append((name, length, start, line_bases, line_width))
+
+    with open(index_path(fasta_path), "w", encoding="latin-1") as out:
+        for entry in entries:
+            out.write("\t".join(str(x) for x in entry) + "\n")
+    return entries
+
+
+def read_index(fasta_path):
+    """
+    Load the index of fasta_path, (re)building it when missing or older than the FASTA.
+    """
+    fai = index_path(fasta_path)
+    if not os.path.exists(fai) or os.path.getmtime(fai) < os.path.getmtime(fasta_path):
+        return build_index(fasta_path)
+
+    entries = []
+    with open(fai, "r", encoding="latin-1") as f:
+        for line in f:
+            name, length, offset, line_bases, line_width = line.rstrip("\n").split("\t")
+            entries.append((name, int(length), int(offset), int(line_bases), int(line_width)))
+    return entries
+
+
+class FastaIndex:
+    """
+    Random access into a multi-record FASTA file through its .bfai index.
+    Only the bytes that cover the requested region are read from disk.
+    """
+
+    def __init__(self, fasta_path):
+        self.path = fasta_path
+        self.entries = read_index(fasta_path)
+        self.names = [e[0] for e in self.entries]
+        self._by_name = {}
+        for e in self.entries:
+            self._by_name.setdefault(e[0], e)
+        self._file = open(fasta_path, "rb")
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def length(self, name):
+        return self._entry(name)[1]
+
+    def _entry(self, name):
+        if name not in self._by_name:
+            raise KeyError(f"No record named '{name}' in {self.path}")
+        return self._by_name[name]
+
+    def fetch(self, name, start=None, end=None):
+        """
+        Sequence of record `name`, or its [start, end) slice (0-based, like Python slicing).
+        """
+        _, length, offset, line_bases, line_width = self._entry(name)
+        start, end, _ = slice(start, end).indices(length)
+        if end <= start:
+            return ""
+
+        first = offset + (start // line_bases) * line_width + start % line_bases
+        last = offset + ((end - 1) // line_bases) * line_width + (end - 1) % line_bases
+        self._file.seek(first)
+        raw = self._file.read(last - first + 1)
+        return clean_sequence(raw).decode("latin-1")
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,103 @@
+import gzip
+import mmap
+import os
+
+import numpy as np
+
+_UPPER = bytes.maketrans(b"abcdefghijklmnopqrstuvwxyz", b"ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_WHITESPACE = b"\r\n \t"
+
+
+def is_gzip(path):
+    with open(path, "rb") as f:
+        return f.read(2) == b"\x1f\x8b"
+
+
+def clean_sequence(raw, upper=True):
+    """
+    Drop line breaks from a raw record body in one C-level pass.
+    """
+    return bytes(raw).translate(_UPPER if upper else None, _WHITESPACE)
+
+
+def record_spans(buf):
+    """
+    Yield (header, body_start, body_end) byte spans for every record in buf.
+    Text before the first '>' is returned as a record with an empty header,
+    unless it is only whitespace.
+    """
+    n = len(buf)
+    pos = 0
+    if n and buf[0:1] != b">":
+        nxt = buf.find(b"\n>")
+        end = n if nxt == -1 else nxt + 1
+        if bytes(buf[0:end]).strip():
+            yield "", 0, end
+        pos = end
+
+    while pos < n:
+        eol = buf.find(b"\n", pos)
+        if eol == -1:
+            eol = n
+        header = bytes(buf[pos + 1:eol]).decode("latin-1").strip()
+        nxt = buf.find(b"\n>", eol)
+        end = n if nxt == -1 else nxt + 1
+        yield header, min(eol + 1, n), end
+        pos = end
+
+
+def _iter_mmap(path, upper):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for header, start, end in record_spans(mm):
+                yield header, clean_sequence(mm[start:end], upper)
+
+
+def _iter_stream(path, upper):
+    header = None
+    chunks = []
+    with gzip.open(path, "rb") as f:
+        for line in f:
+            if line.startswith(b">"):
+                if header is not None or b"".join(chunks).strip():
+                    yield header or "", clean_sequence(b"".join(chunks), upper)
+                header = line[1:].decode("latin-1").strip()
+                chunks = []
+            else:
+                chunks.append(line)
+    if header is not None or b"".join(chunks).strip():
+        yield header or "", clean_sequence(b"".join(chunks), upper)
+
+
+def iter_fasta(path, upper=True):
+    """
+    Lazily yield (header, sequence) for every record of a FASTA file.
+    Plain files are memory-mapped so only one record is materialised at a time;
+    gzip files are decompressed as a stream. The sequence is returned as bytes.
+    """
+    if is_gzip(path):
+        return _iter_stream(path, upper)
+    return _iter_mmap(path, upper)
+
+
+def seq_array(seq):
+    """
+    Zero-copy uint8 view over a bytes sequence returned by iter_fasta.
+    """
+    return np.frombuffer(seq, dtype=np.uint8)
+
+
+def read_fasta(path):
+    """
+    All records of the file concatenated into one uppercase string.
+    """
+    return b"".join(seq for _, seq in iter_fasta(path)).decode("latin-1")
+
+
+def read_fasta_multi(path):
+    """
+    Dictionary header -> uppercase sequence string, in file order.
+    """
+    return {name: seq.decode("latin-1") for name, seq in iter_fasta(path)}
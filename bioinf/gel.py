@@ -0,0 +1,142 @@
+"""
+Agarose gel simulation.
+
+    model = GelModel.from_ladder(LADDER_1KB, measured_distances)   # or GelModel.from_range(100, 10000)
+    lanes = [ladder_bands(model)] + [lane_bands(f, model) for f in digests]
+    image, columns = render_gel(lanes, model)
+
+Migration follows the usual log-linear model, distance = intercept -
+slope * log10(size), fitted to a ladder. Band intensity is proportional to
+the DNA mass (length x copies) and fragments that land closer than the
+gel's resolution are merged into one band. The whole gel is rendered as one
+NumPy image: each lane is a sum of Gaussian band profiles, spread across
+the lane's columns with a single outer product.
+"""
+
+import numpy as np
+
+# GeneRuler / NEB style 1 kb ladder (bp)
+LADDER_1KB = (10000, 8000, 6000, 5000, 4000, 3000, 2000, 1500, 1000, 750, 500, 250)
+
+BAND_DTYPE = np.dtype([("distance", np.float64), ("size", np.float64), ("mass", np.float64),
+                       ("fragments", np.int32)])
+
+
+class GelModel:
+    """
+    Log-linear mobility: distance = intercept - slope * log10(size), kept
+    between the well (0) and the end of the gel (length).
+    """
+
+    def __init__(self, slope, intercept, length=1.0):
+        self.slope = float(slope)
+        self.intercept = float(intercept)
+        self.length = float(length)
+
+    @classmethod
+    def from_ladder(cls, sizes, distances, length=None):
+        """
+        Least-squares fit of the model to measured ladder bands.
+        """
+        slope, intercept = np.polyfit(np.log10(np.asarray(sizes, dtype=np.float64)),
+                                      np.asarray(distances, dtype=np.float64), 1)
+        if length is None:
+            length = max(distances) * 1.1
+        return cls(-slope, intercept, length)
+
+    @classmethod
+    def from_range(cls, min_size=100, max_size=10000, length=1.0, margin=0.05):
+        """
+        Model of a gel that spreads min_size..max_size over its length, leaving
+        `margin` (fraction of the length) free at both ends.
+        """
+        top, bottom = margin * length, (1 - margin) * length
+        slope = (bottom - top) / (np.log10(max_size) - np.log10(min_size))
+        return cls(slope, top + slope * np.log10(max_size), length)
+
+    def distance(self, sizes):
+        sizes = np.maximum(np.asarray(sizes, dtype=np.float64), 1)
+        return np.clip(self.intercept - self.slope * np.log10(sizes), 0, self.length)
+
+    def size(self, distances):
+        return 10 ** ((self.intercept - np.asarray(distances, dtype=np.float64)) / self.slope)
+
+
+def lane_bands(lengths, model, copies=1, resolution=0.01):
+    """
+    Bands of one lane as a BAND_DTYPE array ordered by distance.
+    Fragments closer than `resolution` (fraction of the gel length) to their
+    neighbour co-migrate: they become one band at their mass-weighted mean
+    position, carrying their total mass.
+    """
+    lengths = np.asarray(lengths, dtype=np.float64)
+    if len(lengths) == 0:
+        return np.zeros(0, dtype=BAND_DTYPE)
+    mass = lengths * np.broadcast_to(np.asarray(copies, dtype=np.float64), lengths.shape)
+    distance = model.distance(lengths)
+    order = np.argsort(distance, kind="stable")
+    distance, lengths, mass = distance[order], lengths[order], mass[order]
+
+    new_band = np.concatenate(([True], np.diff(distance) > resolution * model.length))
+    band = np.cumsum(new_band) - 1
+    total = np.bincount(band, weights=mass)
+    bands = np.zeros(len(total), dtype=BAND_DTYPE)
+    bands["mass"] = total
+    bands["distance"] = np.bincount(band, weights=mass * distance) / total
+    bands["size"] = np.bincount(band, weights=mass * lengths) / total
+    bands["fragments"] = np.bincount(band)
+    return bands
+
+
+def ladder_bands(model, sizes=LADDER_1KB, resolution=0.01):
+    """
+    Ladder lane with the same mass in every band, as commercial ladders are mixed.
+    """
+    sizes = np.asarray(sizes, dtype=np.float64)
+    return lane_bands(sizes, model, copies=sizes.max() / sizes, resolution=resolution)
+
+
+def render_gel(lanes, model, height=600, lane_width=40, gap=14, sigma=2.0, saturation=0.6, gamma=0.5):
+    """
+    Grey-level image (height, width) of the gel, 1.0 = brightest band, and
+    the column slice of every lane.
+
+    Bands are Gaussians of `sigma` pixels along the run. Intensity is scaled
+    so that the strongest band over all lanes reaches 1 / saturation, raised
+    to `gamma` (camera response, so that faint bands stay visible) and
+    clipped to 1, as an overexposed photo would be.
+    """
+    n_lanes = len(lanes)
+    width = gap + n_lanes * (lane_width + gap)
+    rows = np.arange(height, dtype=np.float64)[:, None]
+
+    # (height, lanes): summed Gaussian profile of each lane's bands
+    profiles = np.zeros((height, n_lanes))
+    for k, bands in enumerate(lanes):
+        if len(bands):
+            centre = bands["distance"] / model.length * (height - 1)
+            profiles[:, k] = (np.exp(-0.5 * ((rows - centre) / sigma) ** 2) * bands["mass"]).sum(axis=1)
+    peak = profiles.max()
+    if peak > 0:
+        profiles /= saturation * peak
+
+    # column -> lane, with softened lane edges
+    lane_of = np.full(width, -1)
+    shape = np.zeros(width)
+    edge = np.minimum(np.arange(lane_width) + 1, lane_width - np.arange(lane_width)) / 3
+    columns = []
+    for k in range(n_lanes):
+        left = gap + k * (lane_width + gap)
+        lane_of[left:left + lane_width] = k
+        shape[left:left + lane_width] = np.minimum(edge, 1)
+        columns.append(slice(left, left + lane_width))
+
+    image = np.where(lane_of >= 0, profiles[:, np.maximum(lane_of, 0)], 0.0) ** gamma * shape
+    return np.minimum(image, 1.0).astype(np.float32), columns
+
+
+def band_rows(bands, model, height):
+    """
+    Image row of each band centre, for labelling a rendered gel.
+    """
+    return bands["distance"] / model.length * (height - 1)
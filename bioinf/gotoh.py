@@ -0,0 +1,224 @@
+"""
+Affine-gap alignment (Gotoh), global or local, with an optional diagonal band.
+
+A gap of length L scores gap_open + (L - 1) * gap_extend. Three score rows
+are kept: M (last column aligns two bases), X (gap in seq2) and Y (gap in
+seq1). Only the traceback pointers are stored, one byte per cell.
+
+Cells are stored by diagonal offset j - i, so with band=k only the
+offsets within k of the main diagonal (widened by the length difference)
+are computed: O(n*k) time and memory instead of O(n*m).
+"""
+
+import numpy as np
+
+from bioinf.align import _as_array
+
+NEG = -(1 << 40)
+
+# pointer byte: bits 0-1 where M came from, bits 2-3 X, bits 4-5 Y
+FROM_M, FROM_X, FROM_Y, START = 0, 1, 2, 3
+
+
+def _band_limits(n, m, band):
+    if band is None:
+        return -n, m
+    lo = max(-n, min(0, m - n) - band)
+    hi = min(m, max(0, m - n) + band)
+    return lo, hi
+
+
+def _fill(a, b, lo, hi, match, mismatch, gap_open, gap_extend, local):
+    """
+    Fill the banded matrices row by row; returns (pointers, end state, end cell, score).
+    Column c of row i is cell (i, i + lo + c).
+    """
+    n, m = len(a), len(b)
+    width = hi - lo + 1
+    cols = np.arange(width, dtype=np.int64)
+    ext_steps = cols * gap_extend
+    ptr = np.zeros((n + 1, width), dtype=np.uint8)
+
+    def gap_row(open_from):
+        # Y[c] = max over c' < c of open_from[c'] + gap_open + (c - 1 - c') * gap_extend
+        run = np.maximum.accumulate(open_from + gap_open - ext_steps)
+        y = np.full(width, NEG, dtype=np.int64)
+        y[1:] = run[:-1] + ext_steps[:-1]
+        return np.maximum(y, NEG)
+
+    def y_pointers(M, X, Y):
+        y_ptr = np.where(M >= X, FROM_M, FROM_X).astype(np.uint8)
+        extend = np.zeros(width, dtype=bool)
+        extend[1:] = (Y[1:] == Y[:-1] + gap_extend) & (Y[:-1] > NEG // 2)
+        shifted = np.empty(width, dtype=np.uint8)
+        shifted[0] = FROM_M
+        shifted[1:] = y_ptr[:-1]
+        return np.where(extend, FROM_Y, shifted).astype(np.uint8)
+
+    j = lo + cols
+    valid = (j >= 0) & (j <= m)
+    M = np.full(width, NEG, dtype=np.int64)
+    X = np.full(width, NEG, dtype=np.int64)
+    if not local:
+        M[j == 0] = 0
+    Y = gap_row(np.where(valid, np.maximum(M, X), NEG)) if not local else np.full(width, NEG, dtype=np.int64)
+    Y[~valid] = NEG
+    ptr[0] = y_pointers(M, X, Y) << 4
+
+    best, best_cell = 0, (0, 0)
+    for i in range(1, n + 1):
+        j = i + lo + cols
+        valid = (j >= 0) & (j <= m)
+        inner = valid & (j >= 1)
+
+        # M from the diagonal neighbour, which sits in the same column c
+        stacked = np.stack((M, X, Y))
+        m_from = np.argmax(stacked, axis=0).astype(np.uint8)
+        diag = stacked.max(axis=0)
+        bj = b[np.clip(j - 1, 0, max(m - 1, 0))] if m else np.zeros(width, dtype=np.uint8)
+        sub = np.where(bj == a[i - 1], match, mismatch)
+        new_M = diag + sub
+        if local:
+            start = diag <= 0
+            new_M = np.where(start, sub, new_M)
+            m_from[start] = START
+        new_M[~inner] = NEG
+
+        # X from the cell above, which sits in column c + 1
+        up_M = np.append(M[1:], NEG)
+        up_X = np.append(X[1:], NEG)
+        up_Y = np.append(Y[1:], NEG)
+        open_up = np.maximum(up_M, up_Y) + gap_open
+        x_from = np.where(up_M >= up_Y, FROM_M, FROM_Y).astype(np.uint8)
+        ext_up = up_X + gap_extend
+        new_X = np.maximum(open_up, ext_up)
+        x_from = np.where(ext_up > open_up, FROM_X, x_from).astype(np.uint8)
+        new_X[~valid] = NEG
+
+        # Y from the cell to the left (column c - 1), as a running maximum
+        new_Y = gap_row(np.where(valid, np.maximum(new_M, new_X), NEG))
+        new_Y[~inner] = NEG
+
+        M, X, Y = np.maximum(new_M, NEG), np.maximum(new_X, NEG), new_Y
+        ptr[i] = m_from | (x_from << 2) | (y_pointers(M, X, Y) << 4)
+
+        if local:
+            c = int(np.argmax(M))
+            if M[c] > best:
+                best, best_cell = int(M[c]), (i, c)
+
+    if local:
+        return ptr, FROM_M, best_cell, best
+    c = m - n - lo
+    finals = (M[c], X[c], Y[c])
+    state = int(np.argmax(finals))
+    return ptr, state, (n, c), int(finals[state])
+
+
+def _traceback(seq1, seq2, ptr, state, cell, lo, local):
+    i, c = cell
+    width = ptr.shape[1]
+    out1, out2 = [], []
+    touched = False
+    while True:
+        j = i + lo + c
+        if not local and i == 0 and j == 0:
+            break
+        if local and (i == 0 or j == 0):
+            break
+        if c == 0 or c == width - 1:
+            touched = True
+        p = int(ptr[i, c])
+        if state == FROM_M:
+            out1.append(seq1[i - 1])
+            out2.append(seq2[j - 1])
+            state = p & 3
+            i -= 1
+            if state == START:
+                break
+        elif state == FROM_X:
+            out1.append(seq1[i - 1])
+            out2.append("-")
+            state = (p >> 2) & 3
+            i -= 1
+            c += 1
+        else:
+            out1.append("-")
+            out2.append(seq2[j - 1])
+            state = (p >> 4) & 3
+            c -= 1
+    return "".join(reversed(out1)), "".join(reversed(out2)), touched, (i, i + lo + c)
+
+
+def gotoh(seq1, seq2, match=2, mismatch=-1, gap_open=-4, gap_extend=-1, local=False, band=None):
+    """
+    Affine-gap alignment of seq1 and seq2. Returns (aligned1, aligned2, score).
+
+    band=None fills the whole matrix; band=k keeps only the diagonals within k
+    of the main one; band="auto" starts narrow and doubles the band while the
+    best path runs along its edge.
+    """
+    if isinstance(seq1, (bytes, bytearray)):
+        seq1 = seq1.decode("latin-1")
+    if isinstance(seq2, (bytes, bytearray)):
+        seq2 = seq2.decode("latin-1")
+    a, b = _as_array(seq1), _as_array(seq2)
+    n, m = len(a), len(b)
+
+    if band == "auto":
+        width = max(16, (n + m) // 100)
+        while True:
+            lo, hi = _band_limits(n, m, width)
+            aligned1, aligned2, score, touched = _align_band(seq1, seq2, a, b, lo, hi, match, mismatch,
+                                                             gap_open, gap_extend, local)
+            if not touched or (lo == -n and hi == m):
+                return aligned1, aligned2, score
+            width *= 2
+
+    lo, hi = _band_limits(n, m, band)
+    aligned1, aligned2, score, _ = _align_band(seq1, seq2, a, b, lo, hi, match, mismatch,
+                                               gap_open, gap_extend, local)
+    return aligned1, aligned2, score
+
+
+def _align_band(seq1, seq2, a, b, lo, hi, match, mismatch, gap_open, gap_extend, local):
+    ptr, state, cell, score = _fill(a, b, lo, hi, match, mismatch, gap_open, gap_extend, local)
+    aligned1, aligned2, touched, _ = _traceback(seq1, seq2, ptr, state, cell, lo, local)
+    # the band edge only matters where it is not also the edge of the matrix
+    touched = touched and (lo > -len(a) or hi < len(b))
+    return aligned1, aligned2, score, touched
+
+
+def local_hit(seq1, seq2, match=2, mismatch=-1, gap_open=-4, gap_extend=-1, band=None):
+    """
+    Best local alignment with its coordinates:
+    (score, start1, end1, start2, end2, aligned1, aligned2), ends exclusive.
+    """
+    if isinstance(seq1, (bytes, bytearray)):
+        seq1 = seq1.decode("latin-1")
+    if isinstance(seq2, (bytes, bytearray)):
+        seq2 = seq2.decode("latin-1")
+    a, b = _as_array(seq1), _as_array(seq2)
+    lo, hi = _band_limits(len(a), len(b), band)
+    ptr, state, (end1, c), score = _fill(a, b, lo, hi, match, mismatch, gap_open, gap_extend, True)
+    if score == 0:
+        return 0, 0, 0, 0, 0, "", ""
+    aligned1, aligned2, _, (start1, start2) = _traceback(seq1, seq2, ptr, state, (end1, c), lo, True)
+    return score, start1, end1, start2, end1 + lo + c, aligned1, aligned2
+
+
+def affine_score(aligned1, aligned2, match=2, mismatch=-1, gap_open=-4, gap_extend=-1):
+    """
+    Score of a given alignment under the affine gap model.
+    """
+    score = 0
+    prev = None
+    for x, y in zip(aligned1, aligned2):
+        if x == "-" or y == "-":
+            kind = 1 if x == "-" else 2
+            score += gap_extend if kind == prev else gap_open
+            prev = kind
+        else:
+            score += match if x == y else mismatch
+            prev = None
+    return score
@@ -0,0 +1,125 @@
+"""
+Similarity scores of already-aligned sequences, for all pairs at once.
+
+Per pair of aligned rows of length L:
+    identity          100 * identical columns / L
+    mismatch_penalty  (identical - different columns) / L
+    weighted          (match, mismatch or gap score per column) / L
+    gap_identity      100 * identical residues / columns where neither row has a gap
+"""
+
+import numpy as np
+
+from bioinf.align import _as_array
+
+GAP = ord("-")
+
+
+def encode_alignment(seqs):
+    """
+    Stack equal-length aligned sequences into an (n, L) uint8 matrix.
+    """
+    rows = [_as_array(s.upper() if isinstance(s, str) else s) for s in seqs]
+    lengths = {len(r) for r in rows}
+    if len(lengths) > 1:
+        raise ValueError(f"Sequences are not aligned (lengths {sorted(lengths)}).")
+    if not rows:
+        return np.zeros((0, 0), dtype=np.uint8)
+    return np.stack(rows)
+
+
+def _column_counts(a, b):
+    """
+    For every pair (a[i], b[j]) of rows: identical columns, identical gap
+    columns, and columns with a gap in at least one row.
+    One-hot rows turn every count into a single matrix product.
+    """
+    symbols = np.union1d(np.unique(a), np.unique(b))
+    onehot_a = (a[:, :, None] == symbols).reshape(len(a), -1).astype(np.float64)
+    onehot_b = (b[:, :, None] == symbols).reshape(len(b), -1).astype(np.float64)
+    same = onehot_a @ onehot_b.T
+    gap_a = (a == GAP).astype(np.float64)
+    gap_b = (b == GAP).astype(np.float64)
+    both_gap = gap_a @ gap_b.T
+    any_gap = gap_a.sum(axis=1)[:, None] + gap_b.sum(axis=1)[None, :] - both_gap
+    return same, both_gap, any_gap
+
+
+def pairwise_scores(seqs, others=None, match=1, mismatch=-1, gap=-1):
+    """
+    Dict of (n, m) score matrices for every row of seqs against every row of
+    `others` (seqs itself by default); see the module docstring.
+    """
+    a = encode_alignment(seqs)
+    b = a if others is None else encode_alignment(others)
+    if a.shape[1] != b.shape[1]:
+        raise ValueError("Both sets must come from the same alignment.")
+    length = a.shape[1]
+    same, both_gap, any_gap = _column_counts(a, b)
+    # a column with a gap on one side only is scored as a gap
+    one_gap = any_gap - both_gap
+    different = length - same
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return {
+            "identity": 100 * same / length,
+            "mismatch_penalty": (same - different) / length,
+            "weighted": (match * same + mismatch * (different - one_gap) + gap * one_gap) / length,
+            "gap_identity": 100 * (same - both_gap) / (length - any_gap),
+        }
+
+
+def score_pairs(pairs, match=1, mismatch=-1, gap=-1):
+    """
+    Same scores for a list of (aligned1, aligned2) pairs; pairs may differ in
+    length. Returns a dict of 1-D arrays, one value per pair.
+    """
+    if not pairs:
+        return {key: np.zeros(0) for key in ("identity", "mismatch_penalty", "weighted", "gap_identity")}
+    for x, y in pairs:
+        if len(x) != len(y):
+            raise ValueError(f"Sequences are not aligned (lengths {len(x)} and {len(y)}).")
+    lengths = np.array([len(x) for x, _ in pairs], dtype=np.float64)
+    width = int(lengths.max())
+    a = np.zeros((len(pairs), width), dtype=np.uint8)
+    b = np.zeros((len(pairs), width), dtype=np.uint8)
+    for k, (x, y) in enumerate(pairs):
+        a[k, :len(x)] = _as_array(x.upper() if isinstance(x, str) else x)
+        b[k, :len(y)] = _as_array(y.upper() if isinstance(y, str) else y)
+    used = np.arange(width) < lengths[:, None]
+
+    equal = (a == b) & used
+    gap_a, gap_b = (a == GAP) & used, (b == GAP) & used
+    same = equal.sum(axis=1)
+    both_gap = (gap_a & gap_b).sum(axis=1)
+    any_gap = (gap_a | gap_b).sum(axis=1)
+    one_gap = any_gap - both_gap
+    different = lengths - same
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return {
+            "identity": 100 * same / lengths,
+            "mismatch_penalty": (same - different) / lengths,
+            "weighted": (match * same + mismatch * (different - one_gap) + gap * one_gap) / lengths,
+            "gap_identity": 100 * (same - both_gap) / (lengths - any_gap),
+        }
+
+
+def distance_matrix(seqs, metric="identity"):
+    """
+    (n, n) distance matrix from one of the identity scores, ready for clustering:
+    1 - identity/100 for the percentage scores, (1 - score) / 2 for the others.
+    """
+    score = pairwise_scores(seqs)[metric]
+    if metric in ("identity", "gap_identity"):
+        dist = 1 - score / 100
+    else:
+        dist = (1 - score) / 2
+    np.fill_diagonal(dist, 0)
+    return dist
+
+
+def match_line(aligned1, aligned2, symbol="I"):
+    """
+    Marker line with `symbol` under identical columns and a space elsewhere.
+    """
+    equal = _as_array(aligned1) == _as_array(aligned2)
+    return np.where(equal, ord(symbol), ord(" ")).astype(np.uint8).tobytes().decode("latin-1")
@@ -0,0 +1,102 @@
+import numpy as np
+
+from bioinf.packed import as_codes, decode_kmers, kmer_codes
+
+TSV_HEADER = "arm_length\trepeat\tleft_start\tleft_end\tright_start\tright_end\tspacer\n"
+
+
+def reverse_complement_codes(codes, k):
+    """
+    For every position i, the k-mer code of the reverse complement of seq[i:i+k].
+    """
+    rev = (3 - (codes & 3))[::-1].astype(np.uint8)
+    rev[(codes == 4)[::-1]] = 4
+    rc, valid = kmer_codes(rev, k)
+    return rc[::-1], valid[::-1]
+
+
+def _arm_hits(codes, k, max_spacer, block):
+    """
+    Yield (left_start, right_start, left codes) arrays for arm length k,
+    ordered by left then right.
+
+    All k-mers are sorted once by (code, position). For each left arm the
+    matching right arms are the positions holding its reverse-complement code
+    inside the spacer window, found with two binary searches.
+    """
+    n = len(codes)
+    fwd, fwd_ok = kmer_codes(codes, k)
+    if len(fwd) < 2:
+        return
+    rc, _ = reverse_complement_codes(codes, k)
+    positions = np.arange(len(fwd), dtype=np.int64)
+
+    span = np.int64(n + 1)
+    if 4 ** k * int(span) >= 2 ** 63:
+        raise ValueError("Arm length too large for this genome size.")
+    keys = fwd.astype(np.int64) * span + positions
+    keys = np.sort(keys[fwd_ok])
+    order = keys % span
+
+    for lo_i in range(0, n - k, block):
+        left = np.arange(lo_i, min(lo_i + block, n - k), dtype=np.int64)
+        left = left[fwd_ok[left]]
+        target = rc[left].astype(np.int64) * span
+        first_j = left + k
+        last_j = np.minimum(n - k, left + k + max_spacer)
+        lo = np.searchsorted(keys, target + first_j, side="left")
+        hi = np.searchsorted(keys, target + last_j, side="right")
+
+        counts = hi - lo
+        total = int(counts.sum())
+        if total == 0:
+            continue
+        hit_left = np.repeat(left, counts)
+        offsets = np.repeat(lo - np.concatenate(([0], np.cumsum(counts)[:-1])), counts)
+        hit_right = order[offsets + np.arange(total)]
+        yield hit_left, hit_right, fwd[hit_left]
+
+
+def iter_inverted_repeats(genome, min_len=4, max_len=6, max_spacer=500, block=100000):
+    """
+    Stream inverted repeats as NumPy blocks (arm_length, left_start, right_start, repeat codes).
+    Arms containing a non-ACGT symbol are skipped.
+    """
+    codes = as_codes(genome)
+    for k in range(min_len, max_len + 1):
+        for left, right, repeat in _arm_hits(codes, k, max_spacer, block):
+            yield k, left, right, repeat
+
+
+def write_inverted_repeats(genome, out_path, min_len=4, max_len=6, max_spacer=500):
+    """
+    Write the inverted-repeat TSV directly to disk and return the number of hits.
+    """
+    found = 0
+    with open(out_path, "w") as f:
+        f.write(TSV_HEADER)
+        for k, left, right, repeat in iter_inverted_repeats(genome, min_len, max_len, max_spacer):
+            f.writelines(map(f"{k}\t{{}}\t{{}}\t{{}}\t{{}}\t{{}}\t{{}}\n".format,
+                             decode_kmers(repeat, k), left.tolist(), (left + k - 1).tolist(),
+                             right.tolist(), (right + k - 1).tolist(), (right - left - k).tolist()))
+            found += len(left)
+    return found
+
+
+def find_inverted_repeats(genome, min_len=4, max_len=6, max_spacer=500):
+    """
+    Same result as the lab8 list-of-dicts version, for small genomes.
+    """
+    results = []
+    for k, left, right, repeat in iter_inverted_repeats(genome, min_len, max_len, max_spacer):
+        for rep, i, j in zip(decode_kmers(repeat, k), left.tolist(), right.tolist()):
+            results.append({
+                "arm_length": k,
+                "repeat": rep,
+                "left_start": i,
+                "left_end": i + k - 1,
+                "right_start": j,
+                "right_end": j + k - 1,
+                "spacer": j - (i + k)
+            })
+    return results
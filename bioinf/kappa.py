@@ -0,0 +1,40 @@
+import numpy as np
+
+from bioinf.windows import _as_bytes_array, window_starts
+
+
+def kappa_ic_windows(seq, window, step=1, starts=None):
+    """
+    Kappa index of coincidence (in %) of every sliding window of seq.
+
+    For each shift s the window score averages matches(s) / (window - s), where
+    matches(s) counts positions i with w[i] == w[i + s]. One prefix sum of the
+    shifted-equality array per shift gives matches(s) for all windows at once,
+    so each shift costs O(n) instead of O(n * window).
+    `starts` gives explicit window starts instead of every step-th position.
+    Returns (starts, ic).
+    """
+    if window < 2:
+        raise ValueError("Window size must be at least 2.")
+    arr = _as_bytes_array(seq)
+    starts = window_starts(len(arr), window, step) if starts is None else np.asarray(starts, dtype=np.int64)
+    total = np.zeros(len(starts), dtype=np.float64)
+    if len(starts) == 0:
+        return starts, total
+
+    dtype = np.int32 if len(arr) < 2 ** 31 else np.int64
+    prefix = np.zeros(len(arr) + 1, dtype=dtype)
+    for shift in range(1, window):
+        span = window - shift
+        eq = arr[:-shift] == arr[shift:]
+        np.cumsum(eq, dtype=dtype, out=prefix[1:len(eq) + 1])
+        matches = prefix[starts + span] - prefix[starts]
+        total += matches / span
+    return starts, total * 100 / (window - 1)
+
+
+def kappa_ic(win):
+    """
+    Kappa index of coincidence of a single window.
+    """
+    return float(kappa_ic_windows(win, len(win))[1][0])
@@ -0,0 +1,243 @@
+"""
+Motif libraries: many PWMs scanned against many sequences in one pass.
+
+    python -m bioinf.motifs JASPAR_CORE.txt promoters.fasta --pvalue 1e-4 --out hits.tsv
+
+Motifs are read from JASPAR (.jaspar / .pfm) or MEME minimal-format files,
+converted to log-likelihood matrices and grouped by length into stacked
+weight matrices. Every block of a sequence is one-hot encoded once and
+scored against all the motifs of a length group, on both strands, with one
+matrix product.
+"""
+
+import argparse
+import re
+from collections import namedtuple
+
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+from bioinf.fasta import iter_fasta
+from bioinf.packed import encode
+from bioinf.pwm import (_invalid_windows, log_likelihood_matrix, reverse_complement_matrix,
+                        threshold_for_pvalue, weight_matrix)
+
+Motif = namedtuple("Motif", ["id", "name", "matrix"])
+
+HIT_DTYPE = np.dtype([("motif", np.int32), ("record", np.int32), ("pos", np.int64),
+                      ("strand", np.int8), ("score", np.float32)])
+
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
+
+
+def read_jaspar(path, pseudocount=1, background=0.25):
+    """
+    Motifs from a JASPAR count-matrix file (one or many '>ID name' blocks of
+    four A/C/G/T rows, with or without the 'A [ ... ]' labels).
+    """
+    motifs = []
+    header, rows = None, []
+
+    def flush():
+        if header is not None and rows:
+            if len(rows) != 4:
+                raise ValueError(f"Motif {header[0]} in {path} does not have 4 rows.")
+            counts = np.array(rows, dtype=np.float64)
+            matrix = log_likelihood_matrix(weight_matrix(counts, pseudocount), background)
+            motifs.append(Motif(header[0], header[1], matrix))
+
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if line.startswith(">"):
+                flush()
+                parts = line[1:].split(None, 1)
+                header = (parts[0], parts[1] if len(parts) > 1 else parts[0])
+                rows = []
+            else:
+                if header is None:
+                    header = (str(len(motifs) + 1), str(len(motifs) + 1))
+                rows.append([float(x) for x in _NUMBER.findall(line)])
+    flush()
+    return motifs
+
+
+def read_meme(path, pseudocount=1, background=0.25):
+    """
+    Motifs from a MEME minimal-format file. Probabilities are turned back into
+    counts with the motif's nsites (20 if absent) before the pseudocount is added.
+    A MOTIF without a letter-probability matrix is skipped; the width is taken
+    from the matrix rows when the header has no w=.
+    """
+    motifs = []
+    with open(path, "r") as f:
+        lines = [line.strip() for line in f]
+    i = 0
+    while i < len(lines):
+        if not lines[i].startswith("MOTIF"):
+            i += 1
+            continue
+        parts = lines[i].split()
+        motif_id = parts[1] if len(parts) > 1 else str(len(motifs) + 1)
+        name = parts[2] if len(parts) > 2 else motif_id
+        i += 1
+        while i < len(lines) and not lines[i].startswith(("letter-probability matrix", "MOTIF")):
+            i += 1
+        if i == len(lines) or lines[i].startswith("MOTIF"):
+            continue
+        info = dict(re.findall(r"(\w+)=\s*(\S+)", lines[i]))
+        width = int(info["w"]) if "w" in info else None
+        nsites = float(info.get("nsites", 20))
+        rows = []
+        i += 1
+        while i < len(lines) and (width is None or len(rows) < width):
+            values = lines[i].split()
+            if not values:
+                if rows and width is None:
+                    break
+                i += 1
+                continue
+            if not _NUMBER.fullmatch(values[0]):
+                break
+            rows.append([float(x) for x in values[:4]])
+            i += 1
+        if not rows or (width is not None and len(rows) < width) or any(len(r) != 4 for r in rows):
+            raise ValueError(f"Motif {motif_id} in {path} has a truncated or malformed letter-probability matrix.")
+        counts = np.array(rows, dtype=np.float64).T * nsites
+        matrix = log_likelihood_matrix(weight_matrix(counts, pseudocount), background)
+        motifs.append(Motif(motif_id, name, matrix))
+    return motifs
+
+
+def load_motifs(paths, pseudocount=1, background=0.25):
+    """
+    Read every file in `paths`, choosing the MEME or JASPAR reader from its contents.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    motifs = []
+    for path in paths:
+        with open(path, "r") as f:
+            head = f.read(4096)
+        if "MEME version" in head or "letter-probability matrix" in head:
+            motifs.extend(read_meme(path, pseudocount, background))
+        else:
+            motifs.extend(read_jaspar(path, pseudocount, background))
+    return motifs
+
+
+class MotifLibrary:
+    """
+    A set of motifs prepared for batched scanning.
+
+    Motifs of the same length are stacked, with their reverse complements,
+    into one (4L, 2 * motifs) weight matrix. A block of sequence is one-hot
+    encoded once; its windows are strided views of that encoding, so scoring
+    every window against every motif of a group is a single matrix product.
+    """
+
+    def __init__(self, motifs, pvalue=1e-4, thresholds=None, block=1 << 15):
+        self.motifs = list(motifs)
+        if not self.motifs:
+            raise ValueError("The motif library is empty.")
+        self.block = block
+        if thresholds is None:
+            thresholds = [threshold_for_pvalue(m.matrix, pvalue) for m in self.motifs]
+        self.thresholds = np.broadcast_to(np.asarray(thresholds, dtype=np.float64), (len(self.motifs),)).copy()
+
+        self.groups = []
+        lengths = np.array([m.matrix.shape[1] for m in self.motifs])
+        for length in np.unique(lengths):
+            members = np.flatnonzero(lengths == length)
+            matrices = [self.motifs[k].matrix for k in members]
+            matrices += [reverse_complement_matrix(self.motifs[k].matrix) for k in members]
+            # column k*4 + b holds the weight of base b at motif position k
+            weights = np.stack([m.T.ravel() for m in matrices], axis=1)
+            cutoff = np.concatenate((self.thresholds[members], self.thresholds[members]))
+            self.groups.append((int(length), members, weights, cutoff))
+        self.min_length, self.max_length = int(lengths.min()), int(lengths.max())
+
+    def scan_sequence(self, seq, record=0):
+        """
+        Hit table (HIT_DTYPE) of all motifs on both strands of one sequence.
+        pos is the 0-based window start on the forward strand; strand is +1 or -1.
+        """
+        codes = encode(seq)
+        invalid = {length: _invalid_windows(codes, length)
+                   for length, _, _, _ in self.groups if len(codes) >= length}
+        windows_total = len(codes) - self.min_length + 1
+        parts = []
+        for start in range(0, max(windows_total, 0), self.block):
+            chunk = codes[start:start + self.block + self.max_length - 1]
+            onehot = np.zeros((len(chunk), 4))
+            ok = chunk < 4
+            onehot[np.flatnonzero(ok), chunk[ok]] = 1.0
+            flat = onehot.ravel()
+            for length, members, weights, cutoff in self.groups:
+                n = min(self.block, len(codes) - length + 1 - start)
+                if n <= 0:
+                    continue
+                windows = as_strided(flat, shape=(n, 4 * length), strides=(4 * flat.itemsize, flat.itemsize))
+                scores = windows @ weights
+                scores[invalid[length][start:start + n]] = -np.inf
+                col, row = np.nonzero(scores >= cutoff)
+                if len(row) == 0:
+                    continue
+                hits = np.empty(len(row), dtype=HIT_DTYPE)
+                hits["motif"] = members[row % len(members)]
+                hits["record"] = record
+                hits["pos"] = start + col
+                hits["strand"] = np.where(row < len(members), 1, -1)
+                hits["score"] = scores[col, row]
+                parts.append(hits)
+        if not parts:
+            return np.zeros(0, dtype=HIT_DTYPE)
+        hits = np.concatenate(parts)
+        return hits[np.lexsort((hits["motif"], hits["pos"]))]
+
+    def scan_records(self, records):
+        """
+        Hits for an iterable of (name, sequence); returns (hit table, record names).
+        """
+        names, parts = [], []
+        for name, seq in records:
+            parts.append(self.scan_sequence(seq, len(names)))
+            names.append(name)
+        hits = np.concatenate(parts) if parts else np.zeros(0, dtype=HIT_DTYPE)
+        return hits, names
+
+    def scan_fasta(self, path):
+        return self.scan_records(iter_fasta(path))
+
+    def write_hits(self, hits, names, out_path):
+        with open(out_path, "w") as f:
+            f.write("motif_id\tmotif_name\trecord\tpos\tstrand\tscore\n")
+            ids = [m.id for m in self.motifs]
+            labels = [m.name for m in self.motifs]
+            f.writelines(map("{}\t{}\t{}\t{}\t{}\t{:.3f}\n".format,
+                             [ids[k] for k in hits["motif"].tolist()],
+                             [labels[k] for k in hits["motif"].tolist()],
+                             [names[k] for k in hits["record"].tolist()],
+                             (hits["pos"] + 1).tolist(),
+                             ["+" if s > 0 else "-" for s in hits["strand"].tolist()],
+                             hits["score"].tolist()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Scan FASTA records with a whole motif library.")
+    parser.add_argument("library", nargs="+", help="JASPAR or MEME motif files")
+    parser.add_argument("fasta", help="sequences to scan")
+    parser.add_argument("--pvalue", type=float, default=1e-4, help="per-motif p-value threshold")
+    parser.add_argument("--out", default="motif_hits.tsv")
+    args = parser.parse_args(argv)
+
+    library = MotifLibrary(load_motifs(args.library), pvalue=args.pvalue)
+    hits, names = library.scan_fasta(args.fasta)
+    library.write_hits(hits, names, args.out)
+    print(f"{len(hits)} hits of {len(library.motifs)} motifs in {len(names)} records; saved to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
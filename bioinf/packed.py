@@ -0,0 +1,130 @@
+import numpy as np
+
+BASES = "ACGT"
+INVALID = 4
+
+_CODE = np.full(256, INVALID, dtype=np.uint8)
+for _i, _b in enumerate(BASES):
+    _CODE[ord(_b)] = _i
+    _CODE[ord(_b.lower())] = _i
+_CODE[ord("U")] = _CODE[ord("u")] = 3
+
+_LETTERS = np.frombuffer(BASES.encode(), dtype=np.uint8)
+
+# above this k a dense 4**k vector gets too large and counts are returned sparse
+DENSE_MAX_K = 12
+
+
+def encode(seq):
+    """
+    Map a DNA/RNA sequence (str, bytes or uint8 array) to codes A=0, C=1, G=2, T/U=3.
+    Any other symbol becomes INVALID (4).
+    """
+    if isinstance(seq, str):
+        seq = seq.encode("latin-1")
+    return _CODE[np.frombuffer(seq, dtype=np.uint8) if isinstance(seq, (bytes, bytearray, memoryview)) else seq]
+
+
+def decode(codes):
+    codes = np.asarray(codes)
+    out = np.full(len(codes), ord("N"), dtype=np.uint8)
+    ok = codes < 4
+    out[ok] = _LETTERS[codes[ok]]
+    return out.tobytes().decode("ascii")
+
+
+class PackedSeq:
+    """
+    DNA sequence stored as 2-bit codes, four bases per byte.
+    Positions holding anything other than A/C/G/T are kept in a separate bit mask.
+    """
+
+    def __init__(self, seq):
+        codes = encode(seq)
+        self.length = len(codes)
+        invalid = codes == INVALID
+        self.has_invalid = bool(invalid.any())
+        self.invalid = np.packbits(invalid) if self.has_invalid else None
+
+        padded = np.zeros((self.length + 3) // 4 * 4, dtype=np.uint8)
+        padded[:self.length] = codes & 3
+        quads = padded.reshape(-1, 4)
+        self.data = (quads[:, 0] << 6) | (quads[:, 1] << 4) | (quads[:, 2] << 2) | quads[:, 3]
+
+    def __len__(self):
+        return self.length
+
+    def codes(self):
+        """
+        Unpacked uint8 codes, one per base, with INVALID restored where needed.
+        """
+        shifts = np.array([6, 4, 2, 0], dtype=np.uint8)
+        codes = ((self.data[:, None] >> shifts) & 3).ravel()[:self.length]
+        if self.has_invalid:
+            codes[np.unpackbits(self.invalid)[:self.length].astype(bool)] = INVALID
+        return codes
+
+    def __str__(self):
+        return decode(self.codes())
+
+
+def as_codes(seq):
+    if isinstance(seq, PackedSeq):
+        return seq.codes()
+    if isinstance(seq, np.ndarray) and seq.dtype == np.uint8 and (seq.size == 0 or seq.max() <= INVALID):
+        return seq
+    return encode(seq)
+
+
+def kmer_codes(seq, k):
+    """
+    Rolling integer encoding of every k-mer: code = sum(base_j * 4**(k-1-j)).
+    Returns (codes, valid) where valid is False for k-mers containing a non-ACGT symbol.
+    """
+    if k < 1 or k > 32:
+        raise ValueError("k must be between 1 and 32.")
+    codes = as_codes(seq)
+    n = len(codes) - k + 1
+    if n <= 0:
+        return np.zeros(0, dtype=np.uint64), np.zeros(0, dtype=bool)
+
+    bad = np.concatenate(([0], np.cumsum(codes == INVALID)))
+    valid = bad[k:] - bad[:n] == 0
+
+    base = (codes & 3).astype(np.uint64)
+    out = np.zeros(n, dtype=np.uint64)
+    for j in range(k):
+        out <<= np.uint64(2)
+        out |= base[j:j + n]
+    return out, valid
+
+
+def count_kmers(seq, k, sparse=None):
+    """
+    Count all k-mers of seq.
+    Dense mode returns a 4**k vector indexed by k-mer code (lexicographic ACGT order).
+    Sparse mode returns (codes, counts) for the k-mers that occur, sorted by code.
+    By default counts are dense up to DENSE_MAX_K and sparse above it.
+    """
+    if sparse is None:
+        sparse = k > DENSE_MAX_K
+    codes, valid = kmer_codes(seq, k)
+    codes = codes[valid]
+    if sparse:
+        return np.unique(codes, return_counts=True)
+    return np.bincount(codes.astype(np.int64), minlength=4 ** k)
+
+
+def decode_kmers(codes, k):
+    """
+    List of k-mer strings for an array of k-mer codes.
+    """
+    codes = np.asarray(codes, dtype=np.uint64)
+    shifts = np.arange(2 * (k - 1), -1, -2, dtype=np.uint64)
+    digits = ((codes[:, None] >> shifts) & np.uint64(3)).astype(np.uint8)
+    letters = np.ascontiguousarray(_LETTERS[digits])
+    return letters.view(f"S{k}").ravel().astype(f"U{k}").tolist()
+
+
+def all_kmers(k):
+    return decode_kmers(np.arange(4 ** k), k)
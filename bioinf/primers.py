@@ -0,0 +1,212 @@
+"""
+PCR primer design over a template.
+
+    pairs = design_primers(genome, region=(1000, 5000), product_range=(200, 600))
+
+Every window of every allowed length in the region is a candidate primer
+on both strands. Each filter is a whole-array test over all windows of one
+length: nearest-neighbour Tm, GC%, GC clamp, homopolymer runs, hairpins and
+3' self-dimers (found with the reverse-complement k-mer codes used for the
+lab8 inverted repeats) and uniqueness of the 3' end on both strands of the
+whole template (one binary search per candidate in a sorted k-mer array).
+Surviving left and right primers are paired by product size and ranked.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from bioinf.inverted_repeats import reverse_complement_codes
+from bioinf.packed import INVALID, as_codes, decode, kmer_codes
+from bioinf.tm import _prefix_sums, _window_tm, sodium_equivalent
+
+PRIMER_DTYPE = np.dtype([("start", np.int64), ("length", np.int32), ("strand", np.int8),
+                         ("tm", np.float64), ("gc", np.float64), ("penalty", np.float64)])
+
+PrimerPair = namedtuple("PrimerPair", ["left", "right", "left_start", "right_end",
+                                       "left_tm", "right_tm", "product", "penalty"])
+
+# left primers paired per step; bounds the size of the pair arrays
+PAIR_BLOCK = 4096
+
+
+def _sorted_keys(codes, valid, span):
+    """
+    Sorted code * span + position of the valid k-mers: all positions of one
+    code form a contiguous, position-ordered slice.
+    """
+    positions = np.flatnonzero(valid)
+    return np.sort(codes[positions].astype(np.int64) * span + positions)
+
+
+def _count_between(keys, span, codes, lo, hi):
+    """
+    Number of positions in [lo, hi] holding each code.
+    """
+    codes = codes.astype(np.int64) * span
+    return np.searchsorted(keys, codes + hi, side="right") - np.searchsorted(keys, codes + lo, side="left")
+
+
+def _next_hairpin_arm(codes, arm, min_loop):
+    """
+    For every position i, the first j >= i + arm + min_loop whose k-mer is the
+    reverse complement of the k-mer at i (the other arm of a hairpin), or a
+    value past the end of the sequence.
+    """
+    n = len(codes)
+    span = np.int64(n + 1)
+    fwd, valid = kmer_codes(codes, arm)
+    rc, _ = reverse_complement_codes(codes, arm)
+    keys = _sorted_keys(rc, valid, span)
+    target = fwd.astype(np.int64) * span + np.arange(len(fwd)) + arm + min_loop
+    at = np.searchsorted(keys, target)
+    found = keys[np.minimum(at, len(keys) - 1)] if len(keys) else np.zeros(len(fwd), dtype=np.int64)
+    hit = (at < len(keys)) & (found // span == fwd.astype(np.int64)) & valid
+    return np.where(hit, found % span, n)
+
+
+def primer_candidates(template, region=None, lengths=range(18, 26), tm_range=(57, 63), opt_tm=60,
+                      opt_length=20, gc_range=(40, 60), max_end_gc=3, max_poly=4, hairpin_arm=5,
+                      min_loop=3, dimer_k=4, unique_k=12, na=50, mg=1.5, dntp=0.6, dnac=50):
+    """
+    All primers passing the filters, as a PRIMER_DTYPE array. start/length
+    give the window on the forward strand; strand -1 primers are the reverse
+    complement of that window (right primers).
+
+    A primer must have its Tm in tm_range, GC% in gc_range, a G or C at the
+    3' end but at most max_end_gc G/C among its last five bases, no run of
+    more than max_poly identical bases, no hairpin (two reverse-complementary
+    hairpin_arm-mers at least min_loop apart), no 3' self-dimer (the reverse
+    complement of its 3' dimer_k-mer inside the primer) and a 3' unique_k-mer
+    found nowhere else on either strand of the template.
+    penalty = |Tm - opt_tm| + 0.5 * |length - opt_length|.
+    """
+    codes = as_codes(template)
+    n = len(codes)
+    lo_region, hi_region = (0, n) if region is None else (max(region[0], 0), min(region[1], n))
+    span = np.int64(n + 1)
+
+    # whole-template tables shared by every length
+    sums = _prefix_sums(codes)
+    bad = sums[2]
+    salt = sodium_equivalent(na, mg, dntp)
+    gc_prefix = np.concatenate(([0], np.cumsum((codes == 1) | (codes == 2))))
+    is_gc = (codes == 1) | (codes == 2)
+    same = np.concatenate(((codes[:-1] == codes[1:]) & (codes[1:] != INVALID), [False]))
+    # run_prefix counts positions starting a run of max_poly + 1 identical bases
+    not_same = np.concatenate(([0], np.cumsum(~same)))
+    long_run = np.zeros(n, dtype=bool)
+    if n > max_poly:
+        long_run[:n - max_poly] = not_same[max_poly:n] - not_same[:n - max_poly] == 0
+    run_prefix = np.concatenate(([0], np.cumsum(long_run)))
+
+    next_arm = _next_hairpin_arm(codes, hairpin_arm, min_loop)
+    fwd_d, valid_d = kmer_codes(codes, dimer_k)
+    rc_d, _ = reverse_complement_codes(codes, dimer_k)
+    dimer_keys = _sorted_keys(fwd_d, valid_d, span)
+    fwd_u, valid_u = kmer_codes(codes, unique_k)
+    rc_u, _ = reverse_complement_codes(codes, unique_k)
+    # k-mers of both strands: a 3' end is unique when its code occurs once
+    unique_keys = np.sort(np.concatenate((fwd_u[valid_u], rc_u[valid_u])))
+
+    def occurrences(anchor):
+        return np.searchsorted(unique_keys, anchor, side="right") - np.searchsorted(unique_keys, anchor, side="left")
+
+    parts = []
+    for length in np.atleast_1d(np.asarray(lengths)).tolist():
+        if length < max(hairpin_arm, dimer_k, unique_k, 5) or hi_region - lo_region < length:
+            continue
+        w = np.arange(lo_region, hi_region - length + 1)
+        end = w + length
+        tm = _window_tm(codes, sums, length, salt, dnac)[w]
+        gc = 100 * (gc_prefix[end] - gc_prefix[w]) / length
+        ok = (bad[end] - bad[w] == 0) & (tm >= tm_range[0]) & (tm <= tm_range[1])
+        ok &= (gc >= gc_range[0]) & (gc <= gc_range[1])
+        if length > max_poly:
+            ok &= run_prefix[end - max_poly] - run_prefix[w] == 0
+        hairpin = sliding_window_view(next_arm, length - hairpin_arm + 1).min(axis=1)[w]
+        ok &= hairpin > end - hairpin_arm
+
+        for strand in (1, -1):
+            if strand == 1:
+                three_prime, clamp_gc = end - 1, gc_prefix[end] - gc_prefix[end - 5]
+                dimer_code, anchor = rc_d[end - dimer_k], fwd_u[end - unique_k]
+            else:
+                three_prime, clamp_gc = w, gc_prefix[w + 5] - gc_prefix[w]
+                dimer_code, anchor = rc_d[w], rc_u[w]
+            keep = ok & is_gc[three_prime] & (clamp_gc <= max_end_gc)
+            keep &= _count_between(dimer_keys, span, dimer_code, w, end - dimer_k) == 0
+            keep &= occurrences(anchor) == 1
+
+            found = np.zeros(int(keep.sum()), dtype=PRIMER_DTYPE)
+            found["start"] = w[keep]
+            found["length"] = length
+            found["strand"] = strand
+            found["tm"] = tm[keep]
+            found["gc"] = gc[keep]
+            found["penalty"] = np.abs(tm[keep] - opt_tm) + 0.5 * abs(length - opt_length)
+            parts.append(found)
+    if not parts:
+        return np.zeros(0, dtype=PRIMER_DTYPE)
+    primers = np.concatenate(parts)
+    return primers[np.lexsort((primers["length"], primers["start"], -primers["strand"]))]
+
+
+def pair_primers(primers, product_range=(100, 1000), max_tm_diff=2.0, top_n=20):
+    """
+    Best top_n (left index, right index, product size, penalty) rows over all
+    left/right primer pairs with a product size in product_range and Tms
+    within max_tm_diff. Pair penalty = both primer penalties + Tm difference.
+    """
+    left = np.flatnonzero(primers["strand"] == 1)
+    right = np.flatnonzero(primers["strand"] == -1)
+    right_end = primers["start"][right] + primers["length"][right]
+    order = np.argsort(right_end, kind="stable")
+    right, right_end = right[order], right_end[order]
+
+    best = np.zeros((0, 4))
+    for block in range(0, len(left), PAIR_BLOCK):
+        lefts = left[block:block + PAIR_BLOCK]
+        start = primers["start"][lefts]
+        lo = np.searchsorted(right_end, start + product_range[0], side="left")
+        hi = np.searchsorted(right_end, start + product_range[1], side="right")
+        counts = hi - lo
+        total = int(counts.sum())
+        if total == 0:
+            continue
+        li = np.repeat(lefts, counts)
+        offsets = np.repeat(lo - (np.cumsum(counts) - counts), counts) + np.arange(total)
+        ri = right[offsets]
+        product = right_end[offsets] - primers["start"][li]
+        # the right primer must lie past the left one
+        ok = primers["start"][ri] >= primers["start"][li] + primers["length"][li]
+        tm_diff = np.abs(primers["tm"][li] - primers["tm"][ri])
+        ok &= tm_diff <= max_tm_diff
+        penalty = primers["penalty"][li] + primers["penalty"][ri] + tm_diff
+        rows = np.column_stack((li, ri, product, penalty))[ok]
+        best = np.concatenate((best, rows))
+        if len(best) > top_n:
+            best = best[np.argpartition(best[:, 3], top_n)[:top_n]]
+    best = best[np.lexsort((best[:, 2], best[:, 3]))]
+    return best[:top_n]
+
+
+def design_primers(template, region=None, product_range=(100, 1000), max_tm_diff=2.0, top_n=20, **filters):
+    """
+    Ranked PrimerPair list (best first). Sequences are written 5' to 3';
+    left_start / right_end are the 0-based product bounds (end exclusive).
+    `filters` are passed on to primer_candidates.
+    """
+    codes = as_codes(template)
+    primers = primer_candidates(codes, region, **filters)
+    rows = pair_primers(primers, product_range, max_tm_diff, top_n)
+    pairs = []
+    for li, ri, product, penalty in rows.tolist():
+        l, r = primers[int(li)], primers[int(ri)]
+        left_seq = decode(codes[l["start"]:l["start"] + l["length"]])
+        r_end = int(r["start"] + r["length"])
+        right_seq = decode((3 - codes[r["start"]:r_end])[::-1])
+        pairs.append(PrimerPair(left_seq, right_seq, int(l["start"]), r_end,
+                                round(float(l["tm"]), 2), round(float(r["tm"]), 2), int(product), round(penalty, 3)))
+    return pairs
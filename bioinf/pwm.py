@@ -0,0 +1,281 @@
+"""
+Position weight matrices: building them from motif instances, scanning
+sequences on both strands, and turning p-values into score thresholds.
+
+Matrices are (4, L) NumPy arrays with rows in A, C, G, T order.
+"""
+
+import numpy as np
+
+from bioinf.packed import INVALID, encode
+
+# score granularity of the p-value distribution (in log-likelihood units)
+RESOLUTION = 1e-3
+
+
+def count_matrix(motifs):
+    """
+    (4, L) counts of each base at each position of equal-length motifs.
+    """
+    codes = np.stack([encode(m) for m in motifs])
+    if (codes == INVALID).any():
+        raise ValueError("Motifs may only contain A, C, G and T.")
+    return np.stack([(codes == b).sum(axis=0) for b in range(4)])
+
+
+def weight_matrix(counts, pseudocount=1):
+    """
+    Column probabilities with `pseudocount` added to every cell.
+    """
+    counts = np.asarray(counts, dtype=np.float64) + pseudocount
+    return counts / counts.sum(axis=0)
+
+
+def log_likelihood_matrix(probs, background=0.25):
+    """
+    ln(p / background); background is a scalar or one value per base.
+    """
+    background = np.broadcast_to(np.asarray(background, dtype=np.float64).reshape(-1, 1), (4, 1))
+    return np.log(np.asarray(probs, dtype=np.float64) / background)
+
+
+def pwm_from_motifs(motifs, pseudocount=1, background=0.25):
+    return log_likelihood_matrix(weight_matrix(count_matrix(motifs), pseudocount), background)
+
+
+def reverse_complement_matrix(matrix):
+    """
+    Matrix that scores the reverse strand when slid along the forward strand.
+    """
+    return np.asarray(matrix)[::-1, ::-1]
+
+
+def _triplets(codes):
+    """
+    Code of the three bases starting at every position (5 symbols each, so 0..124).
+    """
+    padded = np.concatenate((codes, np.full(2, INVALID, dtype=np.uint8))).astype(np.intp)
+    return padded[:-2] * 25 + padded[1:-1] * 5 + padded[2:]
+
+
+def _invalid_windows(codes, length):
+    bad = np.concatenate(([0], np.cumsum(codes == INVALID)))
+    n = len(codes) - length + 1
+    return bad[length:] - bad[:n] > 0
+
+
+def _score_triplets(triplets, matrix, n, starts=None):
+    """
+    Window scores accumulated three matrix columns per lookup: for columns
+    g..g+2 a 125-entry table gives the summed score of every base triplet.
+    Scores the first n windows, or only the windows at `starts`.
+    """
+    length = matrix.shape[1]
+    # extra zero row for the invalid code and zero columns past the motif end
+    table = np.zeros((5, length + 2))
+    table[:4, :length] = matrix
+    first, second, third = np.meshgrid(range(5), range(5), range(5), indexing="ij")
+    scores = np.zeros(n if starts is None else len(starts), dtype=np.float64)
+    for g in range(0, length, 3):
+        lookup = (table[first, g] + table[second, g + 1] + table[third, g + 2]).ravel()
+        scores += lookup[triplets[g:g + n] if starts is None else triplets[starts + g]]
+    return scores
+
+
+def score_windows(seq, matrix):
+    """
+    Score of every length-L window of seq (forward strand); NaN for windows
+    holding a non-ACGT base.
+    """
+    return scan(seq, matrix, strands="+")[0]
+
+
+def scan(seq, matrix, strands="+-"):
+    """
+    (forward, reverse) window scores. Both are indexed by the window's start
+    on the forward strand; NaN marks windows with ambiguous bases.
+    The sequence is encoded once and shared by both strands.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    codes = encode(seq)
+    length = matrix.shape[1]
+    n = len(codes) - length + 1
+    if n <= 0:
+        return tuple(np.zeros(0, dtype=np.float64) for _ in strands)
+    triplets = _triplets(codes)
+    invalid = _invalid_windows(codes, length)
+    result = []
+    for strand in strands:
+        m = matrix if strand == "+" else reverse_complement_matrix(matrix)
+        scores = _score_triplets(triplets, m, n)
+        scores[invalid] = np.nan
+        result.append(scores)
+    return tuple(result)
+
+
+def find_hits(seq, matrix, threshold):
+    """
+    Windows scoring at least `threshold` on either strand, ordered by position.
+    Returns (positions, strands, scores); strands are "+" or "-".
+    """
+    fwd, rev = scan(seq, matrix)
+    with np.errstate(invalid="ignore"):
+        pos_f = np.flatnonzero(fwd >= threshold)
+        pos_r = np.flatnonzero(rev >= threshold)
+    positions = np.concatenate((pos_f, pos_r))
+    strands = np.array(["+"] * len(pos_f) + ["-"] * len(pos_r), dtype="<U1")
+    scores = np.concatenate((fwd[pos_f], rev[pos_r]))
+    order = np.lexsort((strands, positions))
+    return positions[order], strands[order], scores[order]
+
+
+def best_suffix_scores(matrix, order=None):
+    """
+    bound[i] = highest score the columns order[i:] can still add (bound[L] = 0).
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if order is None:
+        order = np.arange(matrix.shape[1])
+    best = matrix.max(axis=0)[order]
+    return np.concatenate((np.cumsum(best[::-1])[::-1], [0.0]))
+
+
+def _lookahead(codes, triplets, invalid, matrix, threshold):
+    """
+    Window starts and scores >= threshold for one matrix, the number of
+    column lookups spent and the number of windows that reached the end.
+    Columns are visited most-informative first and a window is dropped once
+    its partial score plus the best possible score of the remaining columns
+    falls below the threshold.
+    """
+    order = np.argsort(-(matrix.max(axis=0) - matrix.min(axis=0)), kind="stable")
+    bound = best_suffix_scores(matrix, order)
+    # keep a rounding margin: the final check below is the exact one
+    slack = 1e-9 * (1 + np.abs(matrix).sum())
+    table = np.vstack((matrix, np.full((1, matrix.shape[1]), -np.inf)))
+
+    alive = np.flatnonzero(~invalid)
+    partial = np.zeros(len(alive))
+    evaluated = 0
+    for k, col in enumerate(order):
+        if len(alive) == 0:
+            break
+        partial += table[codes[alive + col], col]
+        evaluated += len(alive)
+        keep = partial + bound[k + 1] >= threshold - slack
+        alive, partial = alive[keep], partial[keep]
+
+    # exact scores of the survivors, summed exactly as score_windows does
+    scores = _score_triplets(triplets, matrix, 0, alive)
+    hit = scores >= threshold
+    return alive[hit], scores[hit], evaluated, len(alive)
+
+
+def find_hits_lookahead(seq, matrix, threshold):
+    """
+    Same hits as find_hits, found by branch and bound.
+    Returns (positions, strands, scores, stats); stats counts the windows,
+    the windows pruned before their last column, and the column lookups
+    done versus a full scan. Windows with ambiguous bases are skipped outright.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    codes = encode(seq)
+    length = matrix.shape[1]
+    n = len(codes) - length + 1
+    stats = {"windows": 0, "pruned": 0, "evaluated": 0, "full": 0}
+    if n <= 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype="<U1"), np.zeros(0), stats
+    triplets = _triplets(codes)
+    invalid = _invalid_windows(codes, length)
+
+    positions, strands, scores = [], [], []
+    for strand, m in (("+", matrix), ("-", reverse_complement_matrix(matrix))):
+        pos, sc, evaluated, completed = _lookahead(codes, triplets, invalid, np.ascontiguousarray(m), threshold)
+        positions.append(pos)
+        strands.append(np.full(len(pos), strand, dtype="<U1"))
+        scores.append(sc)
+        stats["evaluated"] += evaluated
+        stats["pruned"] += int((~invalid).sum()) - completed
+    stats["windows"] = 2 * n
+    stats["full"] = 2 * n * length
+
+    positions = np.concatenate(positions)
+    strands = np.concatenate(strands)
+    scores = np.concatenate(scores)
+    order = np.lexsort((strands, positions))
+    return positions[order], strands[order], scores[order], stats
+
+
+def _background_probs(background):
+    if background is None:
+        return np.full(4, 0.25)
+    return np.broadcast_to(np.asarray(background, dtype=np.float64), (4,)).copy()
+
+
+def score_distribution(matrix, background=None, resolution=RESOLUTION):
+    """
+    Distribution of the window score of a random background sequence, by
+    dynamic programming over the matrix columns. Every column is rounded to
+    the resolution grid first, so the grid score of a window can differ from
+    its float score by up to L * resolution / 2 (L = number of columns).
+    Returns (lowest integer score, probabilities); grid score k*resolution has
+    probability probs[k - lowest].
+    """
+    steps = np.rint(np.asarray(matrix, dtype=np.float64) / resolution).astype(np.int64)
+    probs = _background_probs(background)
+    lowest = int(steps.min(axis=0).sum())
+    size = int((steps.max(axis=0) - steps.min(axis=0)).sum()) + 1
+    dist = np.zeros(size)
+    dist[0] = 1.0
+    span = 0
+    for col in steps.T:
+        shifted = col - col.min()
+        new = np.zeros(size)
+        for shift, p in zip(shifted, probs):
+            new[shift:shift + span + 1] += p * dist[:span + 1]
+        dist = new
+        span += int(shifted.max())
+    return lowest, dist
+
+
+def _grid_margin(matrix):
+    # largest gap, in grid steps, between a window's float score and its grid score
+    return np.asarray(matrix).shape[1] / 2
+
+
+def pvalue(matrix, score, background=None, resolution=RESOLUTION):
+    """
+    P(score of a random background window >= score), approximate to the
+    resolution: every grid score within L * resolution / 2 below `score` is
+    counted, so the result is never below the true p-value and a window
+    always lies inside its own tail.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    best = matrix.max(axis=0).sum()
+    if score > best:
+        return 0.0
+    if score == best:
+        # only the best word(s): exact
+        return float((_background_probs(background) @ (matrix == matrix.max(axis=0))).prod())
+    lowest, dist = score_distribution(matrix, background, resolution)
+    k = int(np.ceil(score / resolution - _grid_margin(matrix) - 1e-9)) - lowest
+    if k <= 0:
+        return 1.0
+    return float(dist[k:].sum())
+
+
+def threshold_for_pvalue(matrix, p, background=None, resolution=RESOLUTION):
+    """
+    Lowest float score t with pvalue(matrix, t) <= p (one strand). The true
+    p-value of t is at most p; t can be up to L * resolution above the
+    exact cutoff.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    lowest, dist = score_distribution(matrix, background, resolution)
+    tail = np.cumsum(dist[::-1])[::-1]
+    ok = np.flatnonzero(tail <= p)
+    if len(ok) == 0:
+        return np.inf
+    threshold = (lowest + int(ok[0]) + _grid_margin(matrix)) * resolution
+    # only the best word(s) score above the top grid value, and they are counted in it
+    return min(threshold, float(matrix.max(axis=0).sum()))
@@ -0,0 +1,216 @@
+"""
+BLAST-like seed-and-extend search of a query against a target genome.
+
+    hsps = find_hsps(influenza, covid, k=11)
+
+The target's k-mers are indexed once (KmerIndex). Every exact k-mer hit of
+the query is a seed; seeds are extended without gaps until the running
+score drops xdrop below its best, and the extensions that score well
+enough are re-aligned with a banded local alignment (same match / mismatch /
+gap scheme as the L11 Smith-Waterman) around the ungapped hit.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from bioinf.align import _as_array
+from bioinf.gotoh import local_hit
+from bioinf.packed import kmer_codes
+from bioinf.windows import window_starts
+
+HSP = namedtuple("HSP", ["query_start", "query_end", "target_start", "target_end", "score"])
+
+_OUTSIDE = -(1 << 40)
+
+
+class KmerIndex:
+    """
+    Sorted k-mer codes of a sequence with their positions, so all positions
+    of any k-mer are one binary search away. Build once per target, reuse
+    for many queries.
+    """
+
+    def __init__(self, seq, k=11):
+        self.k = k
+        self.length = len(seq)
+        codes, valid = kmer_codes(seq, k)
+        positions = np.flatnonzero(valid)
+        order = np.argsort(codes[positions], kind="stable")
+        self.positions = positions[order]
+        self.codes = codes[self.positions]
+
+    def lookup(self, codes):
+        """
+        (lo, hi) ranges into self.positions for each k-mer code.
+        """
+        lo = np.searchsorted(self.codes, codes, side="left")
+        hi = np.searchsorted(self.codes, codes, side="right")
+        return lo, hi
+
+    def seeds(self, query):
+        """
+        (query positions, target positions) of every exact k-mer match.
+        """
+        codes, valid = kmer_codes(query, self.k)
+        qpos = np.flatnonzero(valid)
+        lo, hi = self.lookup(codes[qpos])
+        counts = hi - lo
+        total = int(counts.sum())
+        q = np.repeat(qpos, counts)
+        first = np.repeat(lo - (np.cumsum(counts) - counts), counts)
+        t = self.positions[first + np.arange(total)]
+        return q, t
+
+
+def xdrop_extend(a, b, qpos, tpos, step, match=2, mismatch=-1, xdrop=20, chunk=64, cells=1 << 22):
+    """
+    Ungapped X-drop extension of many seeds at once, moving by `step` (+1 or -1)
+    from a[qpos] / b[tpos]. Returns (length, score) of the best extension of each.
+
+    All seeds are first scored over `chunk` positions; the ones that have not
+    dropped by then are retried over twice the span, and so on. Seeds are
+    handled in blocks of at most `cells` positions.
+    """
+    lengths = np.zeros(len(qpos), dtype=np.int64)
+    scores = np.zeros(len(qpos), dtype=np.int64)
+    todo = np.arange(len(qpos))
+    span = chunk
+    while len(todo):
+        offsets = np.arange(span, dtype=np.int64) * step
+        rows = max(1, cells // span)
+        unfinished = []
+        for block in range(0, len(todo), rows):
+            seeds = todo[block:block + rows]
+            qi = qpos[seeds, None] + offsets
+            ti = tpos[seeds, None] + offsets
+            inside = (qi >= 0) & (qi < len(a)) & (ti >= 0) & (ti < len(b))
+            same = a[np.clip(qi, 0, len(a) - 1)] == b[np.clip(ti, 0, len(b) - 1)]
+            gain = np.where(inside, np.where(same, match, mismatch), _OUTSIDE)
+            total = np.cumsum(gain, axis=1)
+            best = np.maximum.accumulate(np.maximum(total, 0), axis=1)
+            dropped = (total < best - xdrop) | ~inside
+            stop = np.where(dropped.any(axis=1), dropped.argmax(axis=1), span)
+
+            # best prefix before the drop point
+            masked = np.where(offsets * step < stop[:, None], total, _OUTSIDE)
+            at = masked.argmax(axis=1)
+            peak = masked[np.arange(len(seeds)), at]
+            good = peak > 0
+            lengths[seeds] = np.where(good, at + 1, 0)
+            scores[seeds] = np.where(good, peak, 0)
+            unfinished.append(seeds[stop == span])
+        todo = np.concatenate(unfinished)
+        span *= 2
+    return lengths, scores
+
+
+def first_seeds(q, t):
+    """
+    Keep only the first seed of every run of consecutive seeds on one diagonal;
+    the rest lie inside the same ungapped extension.
+    """
+    order = np.lexsort((q, t - q))
+    q, t = q[order], t[order]
+    follows = np.zeros(len(q), dtype=bool)
+    follows[1:] = (t[1:] - q[1:] == t[:-1] - q[:-1]) & (q[1:] == q[:-1] + 1)
+    return q[~follows], t[~follows]
+
+
+def ungapped_hits(a, b, q, t, k, match=2, mismatch=-1, xdrop=20):
+    """
+    Extend seeds both ways; returns unique (query start, query end, target start, score) rows.
+    """
+    right_len, right_score = xdrop_extend(a, b, q + k, t + k, 1, match, mismatch, xdrop)
+    left_len, left_score = xdrop_extend(a, b, q - 1, t - 1, -1, match, mismatch, xdrop)
+    same = a[q[:, None] + np.arange(k)] == b[t[:, None] + np.arange(k)]
+    seed_score = np.where(same, match, mismatch).sum(axis=1)
+    hits = np.stack((q - left_len, q + k + right_len, t - left_len, left_score + seed_score + right_score), axis=1)
+    return np.unique(hits, axis=0)
+
+
+def _gapped(a_str, b_str, qs, qe, ts, match, mismatch, gap, band, flank):
+    """
+    Banded local alignment of the region around one ungapped hit, `flank`
+    bases beyond it on both sides.
+    """
+    te = ts + (qe - qs)
+    left = min(flank, qs, ts)
+    right = min(flank, len(a_str) - qe, len(b_str) - te)
+    q0, t0 = qs - left, ts - left
+    score, s1, e1, s2, e2, _, _ = local_hit(a_str[q0:qe + right], b_str[t0:te + right],
+                                            match, mismatch, gap, gap, band)
+    return HSP(q0 + s1, q0 + e1, t0 + s2, t0 + e2, score)
+
+
+def find_hsps(query, target, k=11, match=2, mismatch=-1, gap=-2, xdrop=20,
+              ungapped_min=30, min_score=40, band=16, flank=64, index=None):
+    """
+    High-scoring segment pairs of query vs target, best first.
+
+    Seeds are extended without gaps; those reaching ungapped_min are aligned
+    again with gaps in a band of +-band diagonals, and the gapped hits scoring
+    at least min_score are reported. Hits lying inside a better hit are dropped.
+    """
+    if isinstance(query, (bytes, bytearray)):
+        query = query.decode("latin-1")
+    if isinstance(target, (bytes, bytearray)):
+        target = target.decode("latin-1")
+    query, target = query.upper(), target.upper()
+    if index is None:
+        index = KmerIndex(target, k)
+    k = index.k
+    a, b = _as_array(query), _as_array(target)
+
+    q, t = first_seeds(*index.seeds(query))
+    if len(q) == 0:
+        return []
+    hits = ungapped_hits(a, b, q, t, k, match, mismatch, xdrop)
+    hits = hits[hits[:, 3] >= ungapped_min]
+    hits = hits[np.argsort(-hits[:, 3], kind="stable")]
+
+    hsps = []
+    for qs, qe, ts, _ in hits.tolist():
+        te = ts + (qe - qs)
+        # an ungapped hit already covered by a reported HSP would give the same alignment
+        if any(h.query_start <= qs and qe <= h.query_end and h.target_start <= ts and te <= h.target_end
+               for h in hsps):
+            continue
+        hsp = _gapped(query, target, qs, qe, ts, match, mismatch, gap, band, flank)
+        if hsp.score >= min_score and hsp not in hsps:
+            hsps.append(hsp)
+
+    hsps.sort(key=lambda h: (-h.score, h.query_start, h.target_start))
+    kept = []
+    for h in hsps:
+        if not any(g.query_start <= h.query_start and h.query_end <= g.query_end and
+                   g.target_start <= h.target_start and h.target_end <= g.target_end for g in kept):
+            kept.append(h)
+    return kept
+
+
+def hsp_density(hsps, len1, len2, window=200, step=None):
+    """
+    Summed HSP scores per (query window, target window), binned by HSP midpoint.
+    Same window layout as bioinf.batch_align.window_scores.
+    """
+    step = window if step is None else step
+    starts1 = window_starts(len1, window, step)
+    starts2 = window_starts(len2, window, step)
+    density = np.zeros((len(starts1), len(starts2)))
+    if not hsps or not len(starts1) or not len(starts2):
+        return density
+    mid1 = np.array([(h.query_start + h.query_end) // 2 for h in hsps])
+    mid2 = np.array([(h.target_start + h.target_end) // 2 for h in hsps])
+    score = np.array([h.score for h in hsps], dtype=float)
+    covers = -(-window // step)
+    for d1 in range(covers):
+        w1 = mid1 // step - d1
+        ok1 = (w1 >= 0) & (w1 < len(starts1))
+        ok1 &= mid1 < np.where(ok1, starts1[np.clip(w1, 0, len(starts1) - 1)], 0) + window
+        for d2 in range(covers):
+            w2 = mid2 // step - d2
+            ok = ok1 & (w2 >= 0) & (w2 < len(starts2))
+            ok &= mid2 < np.where(ok, starts2[np.clip(w2, 0, len(starts2) - 1)], 0) + window
+            np.add.at(density, (w1[ok], w2[ok]), score[ok])
+    return density
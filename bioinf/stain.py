@@ -0,0 +1,219 @@
+"""
+Batch "digital stain" (C+G% vs Kappa IC) for many FASTA files.
+
+    python -m bioinf.stain influenza_fastas/ --window 30 --out ODS --workers 8 --plots
+
+Every input file is handled by its own worker process. For each file the
+per-window table is written as <name>_ODS.npz and <name>_ODS.csv, and the
+centers of weight of all records go to centers.csv / centers.npz. Files
+with the same name in different folders get the folder name as a prefix.
+Plots are an optional separate stage (--plots or render_plots()).
+"""
+
+import argparse
+import csv
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from bioinf.fasta import iter_fasta
+from bioinf.kappa import kappa_ic_windows
+from bioinf.windows import gc_percent_windows
+
+FASTA_EXTENSIONS = (".fasta", ".fa", ".fna", ".fasta.gz", ".fa.gz", ".fna.gz")
+
+
+def expand_inputs(inputs):
+    """
+    Turn a mix of directories, glob patterns and file names into a sorted list of FASTA paths.
+    """
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(os.path.join(item, f) for f in os.listdir(item) if f.lower().endswith(FASTA_EXTENSIONS))
+        elif glob.has_magic(item):
+            paths.extend(glob.glob(item))
+        else:
+            paths.append(item)
+    return sorted(set(paths))
+
+
+def file_stem(path):
+    name = os.path.basename(path)
+    for ext in sorted(FASTA_EXTENSIONS, key=len, reverse=True):
+        if name.lower().endswith(ext):
+            return name[:-len(ext)]
+    return os.path.splitext(name)[0]
+
+
+def output_stems(paths):
+    """
+    Output name of every input file: its file stem, prefixed with the parent
+    folder when several inputs share the same stem.
+    """
+    stems = [file_stem(p) for p in paths]
+    seen = {}
+    for stem in stems:
+        seen[stem] = seen.get(stem, 0) + 1
+    stems = [f"{os.path.basename(os.path.dirname(os.path.abspath(p)))}_{stem}" if seen[stem] > 1 else stem
+             for p, stem in zip(paths, stems)]
+    if len(set(stems)) != len(stems):
+        raise ValueError("Several input files would write the same output tables; rename or split them.")
+    return stems
+
+
+def stain_sequence(seq, window, step=1, starts=None):
+    """
+    (starts, CG%, IC) for every window of one sequence (or the windows at `starts`).
+    """
+    starts, cg = gc_percent_windows(seq, window, step, starts)
+    _, ic = kappa_ic_windows(seq, window, step, starts)
+    return starts, cg, ic
+
+
+def stain_file(path, out_dir, window=30, step=1, write_csv=True, stem=None):
+    """
+    Stain every record of one FASTA file and write its ODS table (NPZ, plus CSV unless write_csv=False).
+    The records are joined and scored in a single pass over the windows of
+    each record (every step-th start, none straddling two records).
+    Returns the list of (file, record, windows, CG center, IC center) rows;
+    records shorter than the window have no center and are left out.
+    """
+    names, seqs = [], []
+    for name, seq in iter_fasta(path):
+        names.append(name)
+        seqs.append(seq)
+    lengths = np.array([len(s) for s in seqs], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+
+    windows = np.maximum((lengths - window) // step + 1, 0)
+    record = np.repeat(np.arange(len(names), dtype=np.int32), windows)
+    first = np.concatenate(([0], np.cumsum(windows)))[:-1]
+    start = (np.arange(len(record)) - np.repeat(first, windows)) * step
+    _, cg, ic = stain_sequence(b"".join(seqs), window, step, offsets[:-1][record] + start)
+
+    cg_sum = np.bincount(record, weights=cg, minlength=len(names))
+    ic_sum = np.bincount(record, weights=ic, minlength=len(names))
+    file = os.path.basename(path)
+    stem = file_stem(path) if stem is None else stem
+    if stem != file_stem(path):
+        file = os.path.join(os.path.basename(os.path.dirname(os.path.abspath(path))), file)
+    centers = [(file, names[k], int(windows[k]), float(cg_sum[k] / windows[k]), float(ic_sum[k] / windows[k]))
+               for k in np.flatnonzero(windows).tolist()]
+
+    np.savez(os.path.join(out_dir, f"{stem}_ODS.npz"),
+             record=record, start=start, cg=cg, ic=ic, names=np.array(names, dtype=str),
+             window=window, step=step)
+    if write_csv:
+        with open(os.path.join(out_dir, f"{stem}_ODS.csv"), "w", newline="") as f:
+            out = csv.writer(f)
+            out.writerow(["record", "start", "CG%", "IC"])
+            out.writerows(zip(np.array(names, dtype=object)[record].tolist(), start.tolist(),
+                              np.round(cg, 3).tolist(), np.round(ic, 3).tolist()))
+    return centers
+
+
+def _stain_file_job(args):
+    return stain_file(*args)
+
+
+def write_centers(centers, out_dir):
+    with open(os.path.join(out_dir, "centers.csv"), "w", newline="") as f:
+        out = csv.writer(f)
+        out.writerow(["file", "record", "windows", "CG%_center", "IC_center"])
+        out.writerows((file, record, n, round(cx, 3), round(cy, 3)) for file, record, n, cx, cy in centers)
+    np.savez_compressed(os.path.join(out_dir, "centers.npz"),
+                        files=np.array([c[0] for c in centers], dtype=str),
+                        record=np.array([c[1] for c in centers], dtype=str),
+                        windows=np.array([c[2] for c in centers], dtype=np.int64),
+                        cg=np.array([c[3] for c in centers]),
+                        ic=np.array([c[4] for c in centers]))
+
+
+def run_batch(inputs, out_dir, window=30, step=1, workers=None, write_csv=True):
+    """
+    Stain all input files across a process pool; returns the centers of weight.
+    """
+    paths = expand_inputs(inputs)
+    if not paths:
+        raise RuntimeError(f"No FASTA files found in {inputs}.")
+    os.makedirs(out_dir, exist_ok=True)
+
+    jobs = [(path, out_dir, window, step, write_csv, stem) for path, stem in zip(paths, output_stems(paths))]
+    centers = []
+    if workers == 1:
+        for job in jobs:
+            centers.extend(_stain_file_job(job))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for rows in pool.map(_stain_file_job, jobs):
+                centers.extend(rows)
+    write_centers(centers, out_dir)
+    return centers
+
+
+def _plot_file(npz_path):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    data = np.load(npz_path)
+    stem = os.path.basename(npz_path)[:-len("_ODS.npz")]
+    fig, ax = plt.subplots()
+    ax.scatter(data["cg"], data["ic"], s=5)
+    ax.set_title(f"Digital Stain — {stem}")
+    ax.set_xlabel("C+G %")
+    ax.set_ylabel("Kappa IC")
+    fig.tight_layout()
+    fig.savefig(npz_path[:-len("_ODS.npz")] + "_plot.png")
+    plt.close(fig)
+
+
+def render_plots(out_dir, workers=None):
+    """
+    Draw the per-file stains and the centers chart from the tables written by run_batch.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    tables = sorted(glob.glob(os.path.join(out_dir, "*_ODS.npz")))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(_plot_file, tables))
+
+    data = np.load(os.path.join(out_dir, "centers.npz"))
+    fig, ax = plt.subplots()
+    ax.scatter(data["cg"], data["ic"])
+    for name, cx, cy in zip(data["record"], data["cg"], data["ic"]):
+        ax.text(cx + 0.3, cy + 0.3, name, fontsize=7)
+    ax.set_title("Centers of Digital Stains")
+    ax.set_xlabel("C+G % (center)")
+    ax.set_ylabel("Kappa IC (center)")
+    ax.grid(True)
+    fig.tight_layout()
+    fig.savefig(os.path.join(out_dir, "centers_plot.png"))
+    plt.close(fig)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch C+G% / Kappa IC digital stain for FASTA files.")
+    parser.add_argument("inputs", nargs="+", help="FASTA files, directories or glob patterns")
+    parser.add_argument("--out", default="ODS", help="output folder (default: ODS)")
+    parser.add_argument("--window", type=int, default=30)
+    parser.add_argument("--step", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--no-csv", action="store_true", help="only write the NPZ tables")
+    parser.add_argument("--plots", action="store_true", help="also render PNG plots")
+    args = parser.parse_args(argv)
+
+    centers = run_batch(args.inputs, args.out, args.window, args.step, args.workers, not args.no_csv)
+    print(f"Stained {len(centers)} records; tables saved in {args.out}")
+    if args.plots:
+        render_plots(args.out, args.workers)
+        print(f"Plots saved in {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Suffix array + LCP index of a genome, built once and kept on disk.
+
+    index = open_index("sequence.fasta")        # builds sequence.fasta.sa.npz on first use
+    index.repeats(6, 10)                        # {substring: count} for lengths 6..10
+    index.maximal_repeats(20)
+    index.count("GAATTC")
+
+The suffix array is built by prefix doubling with NumPy sorts. The ranks of
+every doubling round are kept, so the LCP of neighbouring suffixes is found
+by binary lifting over those ranks, again as whole-array operations.
+"""
+
+import os
+
+import numpy as np
+
+from bioinf.fasta import read_fasta
+from bioinf.packed import INVALID, encode
+
+
+def _doubling(text):
+    """
+    Suffix array of text (uint8 array) and the rank arrays of every round:
+    ranks[k][i] identifies the first 2**k symbols of suffix i (suffixes
+    shorter than that compare as if padded with a symbol below all others).
+
+    Memory: one int32 rank array per round, about 4n * log2(longest repeat)
+    bytes, on top of the int64 key / sa temporaries of the current round.
+    The levels are only needed by _lcp and are dropped once it is done.
+    """
+    n = len(text)
+    # dense ranks 0..n-1, so that rank * (n + 1) + following never collides
+    rank = np.unique(text, return_inverse=True)[1].astype(np.int64)
+    ranks = [rank.astype(np.int32)]
+    sa = np.argsort(rank, kind="stable")
+    step = 1
+    while n and len(np.unique(rank)) < n:
+        following = np.full(n, -1, dtype=np.int64)
+        following[:n - step] = rank[step:]
+        key = rank * (n + 1) + following + 1
+        sa = np.argsort(key, kind="stable")
+        sorted_key = key[sa]
+        new_rank = np.empty(n, dtype=np.int64)
+        new_rank[sa] = np.concatenate(([0], np.cumsum(sorted_key[1:] != sorted_key[:-1])))
+        rank = new_rank
+        ranks.append(rank.astype(np.int32))
+        step *= 2
+    return sa, ranks
+
+
+def _lcp(sa, ranks, n):
+    """
+    lcp[j] = longest common prefix of suffixes sa[j-1] and sa[j] (lcp[0] = 0).
+    """
+    if n < 2:
+        return np.zeros(n, dtype=np.int32)
+    a, b = sa[:-1].astype(np.int64), sa[1:].astype(np.int64)
+    lcp = np.zeros(n - 1, dtype=np.int64)
+    for k in range(len(ranks) - 1, -1, -1):
+        ia, ib = a + lcp, b + lcp
+        ok = (ia < n) & (ib < n)
+        ia, ib = np.minimum(ia, n - 1), np.minimum(ib, n - 1)
+        # equal ranks at level k: the next 2**k symbols agree (and both fit in the text)
+        ok &= ranks[k][ia] == ranks[k][ib]
+        lcp += ok * (1 << k)
+    return np.concatenate(([0], lcp)).astype(np.int32)
+
+
+class SuffixIndex:
+    """
+    Suffix array and LCP array of one sequence, with repeat queries that are
+    single passes over the LCP array.
+    """
+
+    def __init__(self, seq, sa=None, lcp=None):
+        if isinstance(seq, str):
+            seq = seq.encode("latin-1")
+        # bytes kept once for the pattern comparisons of find / count
+        self._bytes = bytes(seq)
+        self.text = np.frombuffer(self._bytes, dtype=np.uint8)
+        self.n = len(self.text)
+        if sa is None or lcp is None:
+            sa, ranks = _doubling(self.text)
+            lcp = _lcp(sa, ranks, self.n)
+            del ranks
+        self.sa = np.asarray(sa, dtype=np.int64)
+        self.lcp = np.asarray(lcp, dtype=np.int32)
+        # prefix count of non-ACGT symbols, to skip repeats that contain them
+        bad = encode(self.text) == INVALID
+        self._bad = np.concatenate(([0], np.cumsum(bad)))
+
+    def save(self, path):
+        np.savez(path, text=self.text, sa=self.sa, lcp=self.lcp)
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        return cls(data["text"].tobytes(), data["sa"], data["lcp"])
+
+    def substring(self, start, length):
+        return self.text[start:start + length].tobytes().decode("latin-1")
+
+    def _clean(self, starts, length):
+        return self._bad[starts + length] - self._bad[starts] == 0
+
+    def find(self, pattern):
+        """
+        Sorted start positions of every occurrence of pattern.
+        """
+        lo, hi = self._range(pattern)
+        return np.sort(self.sa[lo:hi])
+
+    def count(self, pattern):
+        lo, hi = self._range(pattern)
+        return hi - lo
+
+    def _range(self, pattern):
+        if isinstance(pattern, str):
+            pattern = pattern.encode("latin-1")
+        m = len(pattern)
+        text = self._bytes
+
+        def prefix(j):
+            start = int(self.sa[j])
+            return text[start:start + m]
+
+        lo, hi = 0, self.n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if prefix(mid) < pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        first = lo
+        hi = self.n
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if prefix(mid) <= pattern:
+                lo = mid + 1
+            else:
+                hi = mid
+        return first, lo
+
+    def repeated(self, length):
+        """
+        (start of one occurrence, count) of every substring of exactly `length`
+        ACGT bases occurring at least twice. Neighbouring suffixes with
+        lcp >= length share that substring, so each run of them is one repeat.
+        """
+        starts = np.flatnonzero(self.lcp < length)
+        counts = np.diff(np.append(starts, self.n))
+        keep = counts > 1
+        first, counts = self.sa[starts[keep]], counts[keep]
+        clean = self._clean(first, length)
+        return first[clean], counts[clean]
+
+    def repeats(self, min_len=6, max_len=10):
+        """
+        {substring: count} of all repeated substrings with min_len..max_len bases.
+        """
+        result = {}
+        for length in range(min_len, max_len + 1):
+            first, counts = self.repeated(length)
+            result.update((self.substring(s, length), c) for s, c in zip(first.tolist(), counts.tolist()))
+        return result
+
+    def top_repeats(self, length, top_n=20):
+        """
+        The top_n most frequent substrings of one length, as (substring, count).
+        """
+        first, counts = self.repeated(length)
+        order = np.argsort(-counts, kind="stable")[:top_n]
+        return [(self.substring(int(first[k]), length), int(counts[k])) for k in order]
+
+    def repeats_at_least(self, min_len):
+        """
+        Every repeat of length >= min_len as (substring, count), one entry per
+        maximal run of suffixes sharing at least min_len symbols; the substring
+        reported is the longest prefix they all share.
+        """
+        shared = self.lcp >= min_len
+        edges = np.diff(np.concatenate(([0], shared.astype(np.int8), [0])))
+        run_starts = np.flatnonzero(edges == 1) - 1
+        run_ends = np.flatnonzero(edges == -1)
+        out = []
+        for s, e in zip(run_starts.tolist(), run_ends.tolist()):
+            length = int(self.lcp[s + 1:e].min())
+            out.append((self.substring(int(self.sa[s]), length), e - s))
+        return out
+
+    def maximal_repeats(self, min_len=2):
+        """
+        Maximal repeats (cannot be extended left or right without losing an
+        occurrence) of at least min_len symbols, as (substring, positions).
+        Uses the usual stack walk over the LCP intervals.
+        """
+        text = self.text
+        sa = self.sa
+        lcp = np.append(self.lcp, 0).tolist()
+        before = np.where(sa > 0, text[np.maximum(sa - 1, 0)].astype(np.int16), -1).tolist()
+        out = []
+        stack = [(0, 0)]  # (lcp value, left boundary)
+        for j in range(1, self.n + 1):
+            left = j - 1
+            while lcp[j] < stack[-1][0]:
+                value, left = stack.pop()
+                if value >= min_len:
+                    lo, hi = left, j
+                    # left-maximal: not every occurrence is preceded by the same symbol
+                    if len(set(before[lo:hi])) > 1 or -1 in before[lo:hi]:
+                        out.append((self.substring(int(sa[lo]), value), np.sort(sa[lo:hi])))
+            if lcp[j] > stack[-1][0]:
+                stack.append((lcp[j], left))
+        return out
+
+
+def index_path(fasta_path):
+    return fasta_path + ".sa.npz"
+
+
+def open_index(fasta_path):
+    """
+    SuffixIndex of a FASTA file (all records joined), loaded from the .sa.npz
+    next to it or built and saved there when missing or older than the FASTA.
+    """
+    path = index_path(fasta_path)
+    if os.path.exists(path) and os.path.getmtime(path) >= os.path.getmtime(fasta_path):
+        return SuffixIndex.load(path)
+    index = SuffixIndex(read_fasta(fasta_path))
+    index.save(path)
+    return index
@@ -0,0 +1,143 @@
+"""
+Tandem repeats (microsatellites and minisatellites) of a genome.
+
+    hits = find_tandem_repeats(genome)                  # periods 1..64
+    write_tandem_repeats(genome, hits, "tandem.tsv")
+
+For every period p the whole sequence is compared with itself shifted by p
+(one vectorized equality test), so a tandem array is a run of matches.
+Runs broken by a substitution (which leaves mismatches p positions apart)
+are joined again; an insertion or deletion still splits an array. Arrays
+found at several periods, or overlapping each other, are resolved by
+keeping the one with the most matching positions.
+"""
+
+import numpy as np
+
+from bioinf.packed import INVALID, as_codes, decode
+
+# periods up to this are microsatellites, longer ones minisatellites
+MICRO_MAX_PERIOD = 10
+
+TANDEM_DTYPE = np.dtype([("start", np.int64), ("end", np.int64), ("period", np.int32),
+                         ("copies", np.float32), ("purity", np.float32), ("matches", np.int64)])
+
+TSV_HEADER = "start\tend\tperiod\tcopies\tpurity\tunit\n"
+
+
+def _runs(mask):
+    """
+    (starts, ends) of the runs of True in a boolean array; ends are exclusive.
+    """
+    edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
+
+def period_repeats(codes, period, min_copies=3, min_length=12, min_purity=0.8):
+    """
+    Tandem arrays of one period (TANDEM_DTYPE), before resolving overlaps
+    with other periods. purity is the fraction of positions i in the array
+    with seq[i] == seq[i + period].
+    """
+    p = period
+    if len(codes) <= p:
+        return np.zeros(0, dtype=TANDEM_DTYPE)
+    same = (codes[:-p] == codes[p:]) & (codes[p:] != INVALID)
+    starts, ends = _runs(same)
+    # single matches are mostly chance; the runs between mismatches of a real array are longer
+    keep = ends - starts >= 2
+    starts, ends = starts[keep], ends[keep]
+    if len(starts) == 0:
+        return np.zeros(0, dtype=TANDEM_DTYPE)
+
+    # a substitution at x gives mismatches at x - p and x: join runs separated
+    # by at most two mismatches within p + 1 positions
+    total = np.concatenate(([0], np.cumsum(same, dtype=np.int64)))
+    gap = starts[1:] - ends[:-1]
+    mismatches = gap - (total[starts[1:]] - total[ends[:-1]])
+    first = np.concatenate(([True], (gap > p + 1) | (mismatches > 2)))
+    last = np.concatenate((first[1:], [True]))
+    starts, ends = starts[first], ends[last]
+
+    matches = total[ends] - total[starts]
+    purity = matches / (ends - starts)
+    length = ends - starts + p
+    ok = (length >= max(min_length, min_copies * p)) & (purity >= min_purity)
+
+    hits = np.zeros(int(ok.sum()), dtype=TANDEM_DTYPE)
+    hits["start"] = starts[ok]
+    hits["end"] = ends[ok] + p
+    hits["period"] = p
+    hits["copies"] = length[ok] / p
+    hits["purity"] = purity[ok]
+    hits["matches"] = matches[ok]
+    return hits
+
+
+def _primitive(codes, start, period):
+    """
+    False when the first copy is itself periodic (e.g. ATAT at period 4),
+    i.e. the array is better described by a shorter period.
+    """
+    unit = codes[start:start + period].tobytes()
+    return unit not in (unit + unit)[1:-1]
+
+
+def find_tandem_repeats(seq, min_period=1, max_period=64, min_copies=3, min_length=12,
+                        min_purity=0.8, max_shared=0.5):
+    """
+    Tandem repeats of seq as a TANDEM_DTYPE array ordered by start
+    (0-based, end exclusive).
+
+    Candidates of all periods are taken best first (most matching positions,
+    then shortest period); a candidate is dropped when more than max_shared
+    of it lies inside repeats already kept.
+    """
+    codes = as_codes(seq)
+    parts = [period_repeats(codes, p, min_copies, min_length, min_purity)
+             for p in range(min_period, max_period + 1)]
+    hits = np.concatenate(parts) if parts else np.zeros(0, dtype=TANDEM_DTYPE)
+    if len(hits) == 0:
+        return hits
+    hits = hits[np.lexsort((hits["period"], -hits["matches"]))]
+
+    covered = np.zeros(len(codes), dtype=bool)
+    kept = []
+    for k, (start, end, period) in enumerate(zip(hits["start"].tolist(), hits["end"].tolist(),
+                                                 hits["period"].tolist())):
+        if period > 1 and not _primitive(codes, start, period):
+            continue
+        if covered[start:end].sum() > max_shared * (end - start):
+            continue
+        covered[start:end] = True
+        kept.append(k)
+    hits = hits[kept]
+    return hits[np.argsort(hits["start"], kind="stable")]
+
+
+def repeat_units(seq, hits):
+    """
+    Consensus unit of every hit: the most common base at each unit position
+    over all its copies.
+    """
+    codes = as_codes(seq)
+    units = []
+    for start, end, period in zip(hits["start"].tolist(), hits["end"].tolist(), hits["period"].tolist()):
+        region = codes[start:end]
+        columns = np.arange(len(region)) % period
+        counts = np.zeros((period, 5), dtype=np.int64)
+        np.add.at(counts, (columns, region), 1)
+        units.append(decode(counts[:, :4].argmax(axis=1)))
+    return units
+
+
+def write_tandem_repeats(seq, hits, out_path):
+    """
+    Write the hits as TSV (1-based, inclusive coordinates) and return how many.
+    """
+    with open(out_path, "w") as f:
+        f.write(TSV_HEADER)
+        f.writelines(map("{}\t{}\t{}\t{:.1f}\t{:.3f}\t{}\n".format,
+                         (hits["start"] + 1).tolist(), hits["end"].tolist(), hits["period"].tolist(),
+                         hits["copies"].tolist(), hits["purity"].tolist(), repeat_units(seq, hits)))
+    return len(hits)
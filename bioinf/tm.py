@@ -0,0 +1,127 @@
+"""
+Nearest-neighbour melting temperatures (SantaLucia 1998 unified parameters).
+
+    tm_nn("AGCGGATAACAATTTCACACAGGA", na=50, mg=1.5, dntp=0.2)
+    lengths, tm = tm_windows(genome, range(18, 31))     # tm[k, i]: window of lengths[k] at i
+
+Every dinucleotide step gets its dH / dS from a 16-entry table indexed by the
+2-bit codes of its two bases. Prefix sums of those values give the stacking
+terms of any window in O(1), so all windows of all requested lengths are
+scored with a few array operations per length.
+
+Concentrations: na, mg and dntp in mM, primer (dnac) in nM.
+"""
+
+import math
+
+import numpy as np
+
+from bioinf.packed import INVALID, as_codes
+
+R = 1.987  # cal / (K mol)
+
+# dH (kcal/mol), dS (cal/K/mol) of each 5'-XY-3' step, identical for XY and its reverse complement
+NN_PARAMS = {
+    "AA": (-7.9, -22.2), "AC": (-8.4, -22.4), "AG": (-7.8, -21.0), "AT": (-7.2, -20.4),
+    "CA": (-8.5, -22.7), "CC": (-8.0, -19.9), "CG": (-10.6, -27.2), "CT": (-7.8, -21.0),
+    "GA": (-8.2, -22.2), "GC": (-9.8, -24.4), "GG": (-8.0, -19.9), "GT": (-8.4, -22.4),
+    "TA": (-7.2, -21.3), "TC": (-8.2, -22.2), "TG": (-8.5, -22.7), "TT": (-7.9, -22.2),
+}
+
+# initiation, by the base at each end of the duplex
+INIT_GC = (0.1, -2.8)
+INIT_AT = (2.3, 4.1)
+SYMMETRY_DS = -1.4
+
+_BASES = "ACGT"
+_STEP_DH = np.array([NN_PARAMS[a + b][0] for a in _BASES for b in _BASES])
+_STEP_DS = np.array([NN_PARAMS[a + b][1] for a in _BASES for b in _BASES])
+# indexed by base code; A/T ends and G/C ends
+_END_DH = np.array([INIT_AT[0], INIT_GC[0], INIT_GC[0], INIT_AT[0], 0.0])
+_END_DS = np.array([INIT_AT[1], INIT_GC[1], INIT_GC[1], INIT_AT[1], 0.0])
+
+
+def sodium_equivalent(na=50, mg=0, dntp=0):
+    """
+    Monovalent-equivalent salt in M (von Ahsen et al. 2001): Mg2+ counts as
+    120 * sqrt(free Mg2+), free Mg2+ being what the dNTPs do not bind.
+    """
+    free_mg = max(mg - dntp, 0)
+    return (na + 120 * math.sqrt(free_mg)) / 1000
+
+
+def _prefix_sums(codes):
+    steps = codes[:-1].astype(np.intp) * 4 + codes[1:]
+    steps[(codes[:-1] == INVALID) | (codes[1:] == INVALID)] = 0
+    dh = np.concatenate(([0.0], np.cumsum(_STEP_DH[steps])))
+    ds = np.concatenate(([0.0], np.cumsum(_STEP_DS[steps])))
+    bad = np.concatenate(([0], np.cumsum(codes == INVALID)))
+    return dh, ds, bad
+
+
+def _self_complementary(codes, length, n):
+    """
+    Starts of the windows equal to their own reverse complement. Pairs of
+    bases are checked from the ends inwards; each check keeps about a quarter
+    of the candidates.
+    """
+    candidates = np.arange(n if length % 2 == 0 else 0)
+    for j in range(length // 2):
+        a, b = codes[candidates + j], codes[candidates + length - 1 - j]
+        candidates = candidates[(a != INVALID) & (a + b == 3)]
+        if len(candidates) == 0:
+            break
+    return candidates
+
+
+def _window_tm(codes, sums, length, salt, dnac):
+    """
+    Tm of every window of one length (NaN for windows with a non-ACGT base).
+    """
+    dh_sum, ds_sum, bad = sums
+    n = len(codes) - length + 1
+    if n <= 0 or length < 2:
+        return np.full(max(n, 0), np.nan)
+    first, last = codes[:n], codes[length - 1:]
+    dh = dh_sum[length - 1:length - 1 + n] - dh_sum[:n] + _END_DH[first] + _END_DH[last]
+    ds = ds_sum[length - 1:length - 1 + n] - ds_sum[:n] + _END_DS[first] + _END_DS[last]
+    ds = ds + 0.368 * (length - 1) * math.log(salt)
+
+    # self-complementary windows: symmetry term and no strand-concentration factor 4
+    factor = np.full(n, dnac * 1e-9 / 4)
+    symmetric = _self_complementary(codes, length, n)
+    ds[symmetric] += SYMMETRY_DS
+    factor[symmetric] = dnac * 1e-9
+
+    tm = 1000 * dh / (ds + R * np.log(factor)) - 273.15
+    tm[bad[length:length + n] - bad[:n] > 0] = np.nan
+    return tm
+
+
+def tm_windows(seq, lengths=range(18, 31), na=50, mg=0, dntp=0, dnac=250):
+    """
+    (lengths, tm) where tm[k, i] is the Tm of seq[i:i + lengths[k]], NaN past
+    the end of seq or over a non-ACGT base. float32, one row per length.
+    """
+    codes = as_codes(seq)
+    lengths = np.atleast_1d(np.asarray(lengths, dtype=np.int64))
+    tm = np.full((len(lengths), len(codes)), np.nan, dtype=np.float32)
+    if len(codes) < 2:
+        return lengths, tm
+    sums = _prefix_sums(codes)
+    salt = sodium_equivalent(na, mg, dntp)
+    for k, length in enumerate(lengths.tolist()):
+        row = _window_tm(codes, sums, length, salt, dnac)
+        tm[k, :len(row)] = row
+    return lengths, tm
+
+
+def tm_nn(seq, na=50, mg=0, dntp=0, dnac=250):
+    """
+    Nearest-neighbour Tm (deg C) of one oligo against its perfect complement.
+    """
+    codes = as_codes(seq)
+    if len(codes) < 2:
+        return float("nan")
+    tm = _window_tm(codes, _prefix_sums(codes), len(codes), sodium_equivalent(na, mg, dntp), dnac)
+    return float(tm[0])
@@ -0,0 +1,205 @@
+"""
+Translation of DNA/RNA in all six reading frames, and ORF finding.
+
+    translate("AUGGCCUAA")                 # 'MA*'
+    frames = six_frames(genome, table=11)
+    orfs = find_orfs(genome, min_length=100, table=11)
+
+Codons are numbered 0..63 from the 2-bit base codes (A=0, C=1, G=2, T/U=3),
+codon = 16 * first + 4 * second + third, and 64 for a codon holding any
+other symbol. A genetic code is then a 65-entry lookup array, so a whole
+frame is translated by one indexing operation.
+"""
+
+import numpy as np
+
+from bioinf.packed import INVALID, as_codes
+
+# NCBI translation tables: name, amino acids in the usual TCAG codon order, start codons
+GENETIC_CODES = {
+    1: ("Standard",
+        "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        ("TTG", "CTG", "ATG")),
+    2: ("Vertebrate Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSS**VVVVAAAADDEEGGGG",
+        ("ATT", "ATC", "ATA", "ATG", "GTG")),
+    3: ("Yeast Mitochondrial",
+        "FFLLSSSSYY**CCWWTTTTPPPPHHQQRRRRIIMMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        ("ATA", "ATG", "GTG")),
+    4: ("Mold, Protozoan and Coelenterate Mitochondrial; Mycoplasma/Spiroplasma",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        ("TTA", "TTG", "CTG", "ATT", "ATC", "ATA", "ATG", "GTG")),
+    5: ("Invertebrate Mitochondrial",
+        "FFLLSSSSYY**CCWWLLLLPPPPHHQQRRRRIIMMTTTTNNKKSSSSVVVVAAAADDEEGGGG",
+        ("TTG", "ATT", "ATC", "ATA", "ATG", "GTG")),
+    6: ("Ciliate, Dasycladacean and Hexamita Nuclear",
+        "FFLLSSSSYYQQCC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+        ("ATG",)),
+    11: ("Bacterial, Archaeal and Plant Plastid",
+         "FFLLSSSSYY**CC*WLLLLPPPPHHQQRRRRIIIMTTTTNNKKSSRRVVVVAAAADDEEGGGG",
+         ("TTG", "CTG", "ATT", "ATC", "ATA", "ATG", "GTG")),
+}
+
+THREE_LETTER = {
+    "A": "Ala", "R": "Arg", "N": "Asn", "D": "Asp", "C": "Cys", "Q": "Gln", "E": "Glu",
+    "G": "Gly", "H": "His", "I": "Ile", "L": "Leu", "K": "Lys", "M": "Met", "F": "Phe",
+    "P": "Pro", "S": "Ser", "T": "Thr", "W": "Trp", "Y": "Tyr", "V": "Val", "*": "Stop",
+    "X": "Xaa",
+}
+
+NO_CODON = 64
+
+ORF_DTYPE = np.dtype([("start", np.int64), ("end", np.int64), ("strand", np.int8),
+                      ("frame", np.int8), ("length", np.int64)])
+
+_BASE_CODE = {"A": 0, "C": 1, "G": 2, "T": 3}
+
+
+def codon_index(codon):
+    """
+    Number 0..63 of a codon string (T or U).
+    """
+    codon = codon.upper().replace("U", "T")
+    return 16 * _BASE_CODE[codon[0]] + 4 * _BASE_CODE[codon[1]] + _BASE_CODE[codon[2]]
+
+
+def codon_names():
+    """
+    The 64 codons as DNA strings, in codon-number order.
+    """
+    return [a + b + c for a in "ACGT" for b in "ACGT" for c in "ACGT"]
+
+
+def codon_table(table=1):
+    """
+    (amino acids, start mask, stop mask) as 65-entry arrays indexed by codon
+    number; entry 64 (ambiguous codon) translates to 'X'.
+    """
+    if table not in GENETIC_CODES:
+        raise ValueError(f"Unknown genetic code {table}; known: {sorted(GENETIC_CODES)}.")
+    _, amino_acids, starts = GENETIC_CODES[table]
+    aa = np.full(NO_CODON + 1, ord("X"), dtype=np.uint8)
+    for k, (a, b, c) in enumerate((a, b, c) for a in "TCAG" for b in "TCAG" for c in "TCAG"):
+        aa[codon_index(a + b + c)] = ord(amino_acids[k])
+    is_start = np.zeros(NO_CODON + 1, dtype=bool)
+    is_start[[codon_index(c) for c in starts]] = True
+    return aa, is_start, aa == ord("*")
+
+
+def codon_codes(codes):
+    """
+    Codon number starting at every position of a base-code array (64 where
+    one of the three bases is not A/C/G/T).
+    """
+    codes = as_codes(codes)
+    if len(codes) < 3:
+        return np.zeros(0, dtype=np.intp)
+    c = codes.astype(np.intp)
+    out = c[:-2] * 16 + c[1:-1] * 4 + c[2:]
+    bad = (c[:-2] == INVALID) | (c[1:-1] == INVALID) | (c[2:] == INVALID)
+    out[bad] = NO_CODON
+    return out
+
+
+def reverse_complement_codes(codes):
+    codes = as_codes(codes)
+    rc = (3 - (codes & 3))[::-1].astype(np.uint8)
+    rc[(codes == INVALID)[::-1]] = INVALID
+    return rc
+
+
+def frame_codons(seq):
+    """
+    Codon numbers of the six frames, as a list in the order +1, +2, +3, -1, -2, -3.
+    Frame -1 starts at the last base of seq, read on the reverse complement.
+    """
+    codes = as_codes(seq)
+    frames = []
+    for strand in (codes, reverse_complement_codes(codes)):
+        every = codon_codes(strand)
+        frames.extend(every[f::3] for f in range(3))
+    return frames
+
+
+def translate(seq, frame=0, table=1, to_stop=False):
+    """
+    Protein of one forward frame (0, 1 or 2). With to_stop the protein ends
+    before the first stop codon, otherwise stops are written as '*'.
+    """
+    aa, _, stop = codon_table(table)
+    codons = codon_codes(seq)[frame::3]
+    if to_stop:
+        stops = np.flatnonzero(stop[codons])
+        if len(stops):
+            codons = codons[:stops[0]]
+    return aa[codons].tobytes().decode("ascii")
+
+
+def six_frames(seq, table=1):
+    """
+    {'+1': protein, ..., '-3': protein} of all six frames, stops as '*'.
+    """
+    aa, _, _ = codon_table(table)
+    labels = ("+1", "+2", "+3", "-1", "-2", "-3")
+    return {label: aa[codons].tobytes().decode("ascii") for label, codons in zip(labels, frame_codons(seq))}
+
+
+def find_orfs(seq, min_length=100, table=1, alt_starts=False):
+    """
+    Open reading frames on both strands as an ORF_DTYPE array sorted by start.
+
+    An ORF runs from the first start codon after a stop to the next stop codon
+    in the same frame (the stop included); length is the number of amino acids
+    and must be at least min_length. Only ATG is a start unless alt_starts, in
+    which case every start codon of the table is. start/end are 0-based,
+    end exclusive, on the forward strand for both strands.
+    """
+    _, is_start, is_stop = codon_table(table)
+    if not alt_starts:
+        is_start = np.zeros_like(is_start)
+        is_start[codon_index("ATG")] = True
+    n = len(as_codes(seq))
+    parts = []
+    for k, codons in enumerate(frame_codons(seq)):
+        m = len(codons)
+        stops = is_stop[codons]
+        # index of the next stop at or after every codon (m when there is none)
+        next_stop = np.where(stops, np.arange(m), m)
+        next_stop = np.minimum.accumulate(next_stop[::-1])[::-1]
+        starts = np.flatnonzero(is_start[codons])
+        ends = next_stop[starts]
+        complete = ends < m
+        starts, ends = starts[complete], ends[complete]
+        # the first start before each stop gives the longest ORF
+        ends, first = np.unique(ends, return_index=True)
+        starts = starts[first]
+        long_enough = ends - starts >= min_length
+        starts, ends = starts[long_enough], ends[long_enough]
+
+        frame = k % 3
+        lo, hi = frame + 3 * starts, frame + 3 * (ends + 1)
+        orfs = np.zeros(len(starts), dtype=ORF_DTYPE)
+        if k < 3:
+            orfs["start"], orfs["end"], orfs["strand"] = lo, hi, 1
+        else:
+            orfs["start"], orfs["end"], orfs["strand"] = n - hi, n - lo, -1
+        orfs["frame"] = frame + 1
+        orfs["length"] = ends - starts
+        parts.append(orfs)
+    orfs = np.concatenate(parts)
+    return orfs[np.lexsort((orfs["strand"], orfs["start"]))]
+
+
+def orf_proteins(seq, orfs, table=1):
+    """
+    Protein of every ORF (without the stop), in the order of `orfs`.
+    """
+    aa, _, _ = codon_table(table)
+    codes = as_codes(seq)
+    rc = reverse_complement_codes(codes)
+    n = len(codes)
+    proteins = []
+    for start, end, strand in zip(orfs["start"].tolist(), orfs["end"].tolist(), orfs["strand"].tolist()):
+        region = codes[start:end - 3] if strand > 0 else rc[n - end:n - start - 3]
+        proteins.append(aa[codon_codes(region)[::3]].tobytes().decode("ascii"))
+    return proteins
@@ -0,0 +1,54 @@
+import numpy as np
+
+
+def _as_bytes_array(seq):
+    if isinstance(seq, str):
+        seq = seq.encode("latin-1")
+    if isinstance(seq, (bytes, bytearray, memoryview)):
+        return np.frombuffer(seq, dtype=np.uint8)
+    return np.asarray(seq, dtype=np.uint8)
+
+
+def window_starts(length, window, step=1):
+    if window < 1 or step < 1:
+        raise ValueError("Window size and step must be positive.")
+    if length < window:
+        return np.zeros(0, dtype=np.int64)
+    return np.arange(0, length - window + 1, step, dtype=np.int64)
+
+
+def window_counts(seq, window, step=1, alphabet="ACGT", starts=None):
+    """
+    Count every symbol of `alphabet` in each sliding window of seq.
+    Uses one prefix sum per symbol, so the cost is O(n) whatever the window size.
+    `starts` gives explicit window starts instead of every step-th position.
+    Returns (starts, counts) with counts shaped (number of windows, len(alphabet)).
+    """
+    arr = _as_bytes_array(seq)
+    starts = window_starts(len(arr), window, step) if starts is None else np.asarray(starts, dtype=np.int64)
+    counts = np.zeros((len(starts), len(alphabet)), dtype=np.int64)
+    if len(starts) == 0:
+        return starts, counts
+
+    dtype = np.int32 if len(arr) < 2 ** 31 else np.int64
+    prefix = np.zeros(len(arr) + 1, dtype=dtype)
+    for k, symbol in enumerate(alphabet):
+        np.cumsum(arr == ord(symbol), dtype=dtype, out=prefix[1:])
+        counts[:, k] = prefix[starts + window] - prefix[starts]
+    return starts, counts
+
+
+def window_frequencies(seq, window, step=1, alphabet="ACGT"):
+    """
+    Relative frequency of each alphabet symbol per window.
+    """
+    starts, counts = window_counts(seq, window, step, alphabet)
+    return starts, counts / window
+
+
+def gc_percent_windows(seq, window, step=1, starts=None):
+    """
+    C+G percentage of every sliding window (or of the windows at `starts`).
+    """
+    starts, counts = window_counts(seq, window, step, "CG", starts)
+    return starts, 100 * counts.sum(axis=1) / window
@@ -7,27 +7,16 @@ import tkinter as tk
 from tkinter import filedialog, messagebox
 import matplotlib.pyplot as plt
 
-def read_fasta(path):
-    seq = ""
-    with open(path, "r") as f:
-        for line in f:
-            if not line.startswith(">"):
-                seq += line.strip().upper()
-    return seq
+from bioinf.fasta import read_fasta
+from bioinf.windows import window_frequencies
 
 def analyze_sequence(seq, window=30):
     if len(seq) < window:
         return [], {b: [] for b in "ACGT"}
 
-    positions = []
-    freqs = {b: [] for b in "ACGT"}
-    for i in range(len(seq) - window + 1):
-        w = seq[i:i+window]
-        total = len(w)
-        for b in "ACGT":
-            freqs[b].append(w.count(b)/total)
-        positions.append(i+1)
-    return positions, freqs
+    starts, freqs = window_frequencies(seq, window, alphabet="ACGT")
+    positions = starts + 1
+    return positions, {b: freqs[:, k] for k, b in enumerate("ACGT")}
 
 def choose_file():
     path = filedialog.askopenfilename(
@@ -41,7 +30,7 @@ def choose_file():
         messagebox.showerror("Error", "No valid DNA sequence found!")
         return
     positions, freqs = analyze_sequence(seq, 30)
-    if not positions:
+    if len(positions) == 0:
         messagebox.showinfo("Info", "Sequence shorter than 30 bases.")
         return
 
@@ -2,9 +2,16 @@
 # In order to achive the result one must verify each combination starting from the beggining of sequence S 
 # Example: ABAA we have AB, BA, AA, ABA
 
+from bioinf.packed import count_kmers, decode_kmers
+
 def find_existing_kmers(S):
     S = S.upper().strip()
 
+    if S and set(S) <= set("ACGT"):
+        di_counts = count_kmers(S, 2)
+        tri_counts = count_kmers(S, 3)
+        return decode_kmers(di_counts.nonzero()[0], 2), decode_kmers(tri_counts.nonzero()[0], 3)
+
     dinucs = set()
     trinucs = set()
 
@@ -0,0 +1,61 @@
+import os
+import sys
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from bioinf.faidx import FastaIndex
+from bioinf.kappa import kappa_ic_windows
+from bioinf.windows import gc_percent_windows
+
+FASTA_FILE = "C:/Users/msuru/Desktop/BIOINF/lab10/Promotori lista completa.fasta"
+OUTPUT_FOLDER = "ODS"
+WINDOW = 30
+MAX_PROMOTERS = 10  
+
+if not os.path.exists(OUTPUT_FOLDER):
+    os.makedirs(OUTPUT_FOLDER)
+
+promoters = FastaIndex(FASTA_FILE)
+selected_proms = [(name, promoters.fetch(name)) for name in promoters.names[:MAX_PROMOTERS]]
+
+centers = []
+
+for name, seq in selected_proms:
+    print(f"Processing: {name}")
+
+    _, cg_vals = gc_percent_windows(seq, WINDOW)
+    _, ic_vals = kappa_ic_windows(seq, WINDOW)
+
+    cx = sum(cg_vals) / len(cg_vals)
+    cy = sum(ic_vals) / len(ic_vals)
+    centers.append((name, cx, cy))
+
+    ods_path = os.path.join(OUTPUT_FOLDER, f"{name}_ODS.txt")
+    with open(ods_path, "w") as f:
+        f.write("CG%\tIC\n")
+        for x, y in zip(cg_vals, ic_vals):
+            f.write(f"{x:.3f}\t{y:.3f}\n")
+
+    plt.scatter(cg_vals, ic_vals, s=8)
+    plt.title(f"ODS — {name}")
+    plt.xlabel("C+G %")
+    plt.ylabel("Kappa IC")
+    plt.tight_layout()
+    plt.savefig(os.path.join(OUTPUT_FOLDER, f"{name}_plot.png"))
+    plt.close()
+
+plt.figure()
+
+for name, cx, cy in centers:
+    plt.scatter(cx, cy)
+    plt.text(cx + 0.2, cy + 0.2, name, fontsize=7)
+
+plt.title("Centers of Weight — 10 Promoters")
+plt.xlabel("C+G % (center)")
+plt.ylabel("Kappa IC (center)")
+plt.grid(True)
+plt.tight_layout()
+plt.savefig(os.path.join(OUTPUT_FOLDER, "centers_plot.png"))
+plt.show()
+
+print("\n✓ DONE! All ODS saved in the folder:", OUTPUT_FOLDER)
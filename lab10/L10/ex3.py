@@ -0,0 +1,51 @@
+import os
+import sys
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from bioinf.fasta import read_fasta
+from bioinf.kappa import kappa_ic_windows
+from bioinf.windows import gc_percent_windows
+
+FOLDER = "C:/Users/msuru/Desktop/BIOINF/lab10/influenza_fastas" 
+WINDOW = 30   
+
+
+def compute_stain(seq, window):
+    _, CG = gc_percent_windows(seq, window)
+    _, IC = kappa_ic_windows(seq, window)
+    return CG, IC
+
+centers = []
+
+for filename in os.listdir(FOLDER):
+    if not filename.endswith(".fasta"):
+        continue
+
+    path = os.path.join(FOLDER, filename)
+    seq = read_fasta(path)
+
+    print(f"Processing {filename} (length {len(seq)} bp)")
+
+    cg_vals, ic_vals = compute_stain(seq, WINDOW)
+    cx = sum(cg_vals) / len(cg_vals)
+    cy = sum(ic_vals) / len(ic_vals)
+    centers.append((filename, cx, cy))
+
+    plt.scatter(cg_vals, ic_vals, s=5)
+    plt.title(f"Digital Stain — {filename}")
+    plt.xlabel("C+G %")
+    plt.ylabel("Kappa IC")
+    plt.show()
+
+plt.figure()
+
+for name, cx, cy in centers:
+    plt.scatter(cx, cy)
+    plt.text(cx + 0.3, cy + 0.3, name, fontsize=8)
+
+plt.title("Centers of Digital Stains (10 Influenza Genomes)")
+plt.xlabel("C+G % (center)")
+plt.ylabel("Kappa IC (center)")
+plt.grid(True)
+plt.show()
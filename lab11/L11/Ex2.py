@@ -0,0 +1,212 @@
+import os
+import sys
+import time
+import tkinter as tk
+from tkinter import filedialog, ttk
+import matplotlib.pyplot as plt
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from bioinf.batch_align import window_scores
+from bioinf.seeds import find_hsps, hsp_density
+from bioinf.windows import window_starts
+
+def read_fasta_first_sequence(path):
+    seq = []
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith(">"):
+                continue
+            seq.append(line.upper())
+    return "".join(seq)
+
+def smith_waterman_alignment(s1, s2, match=2, mismatch=-1, gap=-2):
+    n = len(s1)
+    m = len(s2)
+    H = [[0] * (m + 1) for _ in range(n + 1)]
+    max_score = 0
+    max_pos = (0, 0)
+
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+
+            if s1[i-1] == s2[j-1]:
+                diag = H[i-1][j-1] + match
+            else:
+                diag = H[i-1][j-1] + mismatch
+
+            delete = H[i-1][j] + gap
+            insert = H[i][j-1] + gap
+
+            H[i][j] = max(0, diag, delete, insert)
+
+            if H[i][j] > max_score:
+                max_score = H[i][j]
+                max_pos = (i, j)
+
+    aligned1 = []
+    aligned2 = []
+    i, j = max_pos
+
+    while i > 0 and j > 0 and H[i][j] != 0:
+        current = H[i][j]
+        diag = H[i-1][j-1]
+        up = H[i-1][j]
+        left = H[i][j-1]
+
+        if current == diag + (match if s1[i-1] == s2[j-1] else mismatch):
+            aligned1.append(s1[i-1])
+            aligned2.append(s2[j-1])
+            i -= 1
+            j -= 1
+        elif current == up + gap:
+            aligned1.append(s1[i-1])
+            aligned2.append('-')
+            i -= 1
+        elif current == left + gap:
+            aligned1.append('-')
+            aligned2.append(s2[j-1])
+            j -= 1
+        else:
+            break
+
+    aligned1.reverse()
+    aligned2.reverse()
+    return "".join(aligned1), "".join(aligned2), max_score
+
+def choose_files_window():
+    root = tk.Tk()
+    root.title("Select Influenza & COVID-19 FASTA Files")
+    root.geometry("600x220")
+
+    influenza_var = tk.StringVar()
+    covid_var = tk.StringVar()
+
+    def choose_influenza():
+        path = filedialog.askopenfilename(
+            title="Select Influenza Genome FASTA",
+            filetypes=[("FASTA files", "*.fasta *.fa *.fna *.ffn *.faa"), ("All files", "*.*")]
+        )
+        if path:
+            influenza_var.set(path)
+
+    def choose_covid():
+        path = filedialog.askopenfilename(
+            title="Select COVID-19 Genome FASTA",
+            filetypes=[("FASTA files", "*.fasta *.fa *.fna *.ffn *.faa"), ("All files", "*.*")]
+        )
+        if path:
+            covid_var.set(path)
+
+    frame = ttk.Frame(root, padding=15)
+    frame.pack(fill="both", expand=True)
+
+    ttk.Label(frame, text="Influenza genome FASTA:").pack(anchor="w")
+    ttk.Entry(frame, textvariable=influenza_var, width=70).pack()
+    ttk.Button(frame, text="Browse...", command=choose_influenza).pack()
+
+    ttk.Label(frame, text="\nCOVID-19 genome FASTA:").pack(anchor="w")
+    ttk.Entry(frame, textvariable=covid_var, width=70).pack()
+    ttk.Button(frame, text="Browse...", command=choose_covid).pack()
+
+    def done():
+        if influenza_var.get() and covid_var.get():
+            root.destroy()
+
+    ttk.Button(frame, text="Confirm", command=done).pack(pady=12)
+
+    root.mainloop()
+    return influenza_var.get(), covid_var.get()
+
+
+def main():
+
+    influenza_file, covid_file = choose_files_window()
+
+    print("\nReading genomes...\n")
+
+    influenza = read_fasta_first_sequence(influenza_file)
+    covid = read_fasta_first_sequence(covid_file)
+
+    print("Influenza length:", len(influenza))
+    print("COVID-19 length:", len(covid))
+
+    window_size = 200
+    step = 50
+
+    n1 = len(window_starts(len(influenza), window_size, step))
+    n2 = len(window_starts(len(covid), window_size, step))
+
+    print("\nWindows (Influenza):", n1)
+    print("Windows (COVID-19):", n2)
+
+    print("\nComputing similarity matrix...\n")
+    t0 = time.perf_counter()
+    match = 2
+    mismatch = -1
+    gap = -2
+
+    starts1, starts2, scores = window_scores(influenza, covid, window_size, step, match, mismatch, gap, workers=None)
+    similarity = scores / (match * window_size)
+
+    best_i, best_j = np.unravel_index(np.argmax(scores), scores.shape)
+    best_score = int(scores[best_i, best_j])
+
+    print(f"Similarity matrix done in {time.perf_counter() - t0:.1f} s")
+    print("Best local score:", best_score)
+
+    plt.figure(figsize=(8, 6))
+    plt.imshow(similarity, cmap="magma", aspect="auto", origin="lower")
+    plt.colorbar(label="Normalized Local Alignment Score")
+    plt.xlabel("COVID-19 windows")
+    plt.ylabel("Influenza windows")
+    plt.title("Influenza vs COVID-19 – Local Alignment Similarity (Windowed)")
+    plt.tight_layout()
+    plt.show()
+
+    t0 = time.perf_counter()
+    hsps = find_hsps(influenza, covid, k=11, match=match, mismatch=mismatch, gap=gap)
+    density = hsp_density(hsps, len(influenza), len(covid), window_size, step)
+    print(f"\nSeed-and-extend: {len(hsps)} HSPs in {time.perf_counter() - t0:.2f} s")
+    for h in hsps[:5]:
+        print(f"  influenza {h.query_start}-{h.query_end}  COVID {h.target_start}-{h.target_end}  score {h.score}")
+
+    plt.figure(figsize=(8, 6))
+    plt.imshow(density / (match * window_size), cmap="magma", aspect="auto", origin="lower")
+    plt.colorbar(label="HSP score per window (normalized)")
+    plt.xlabel("COVID-19 windows")
+    plt.ylabel("Influenza windows")
+    plt.title("Influenza vs COVID-19 – HSP Density (Seed-and-Extend)")
+    plt.tight_layout()
+    plt.show()
+
+    start1, start2 = int(starts1[best_i]), int(starts2[best_j])
+    w1 = influenza[start1:start1 + window_size]
+    w2 = covid[start2:start2 + window_size]
+
+    aligned1, aligned2, true_score = smith_waterman_alignment(w1, w2)
+
+    match_line = ""
+    matches = 0
+    for a, b in zip(aligned1, aligned2):
+        if a == b and a != "-":
+            match_line += "|"
+            matches += 1
+        else:
+            match_line += " "
+
+    identity = matches / len(aligned1) * 100 if aligned1 else 0
+
+    print("\nBest Local Alignment Between Windows:")
+    print("Influenza start:", start1)
+    print("COVID start    :", start2)
+    print("Score          :", true_score)
+    print("\n" + aligned1)
+    print(match_line)
+    print(aligned2)
+    print(f"\nIdentity: {identity:.2f}%\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from bioinf.identity import match_line, score_pairs
+
+seq1 = "AAATTAAA"
+seq2 = "AAACCCAAA"
+
+if len(seq1) != len(seq2):
+    print("ERROR: Sequences are not aligned (different lengths)")
+    print("Length seq1 =", len(seq1))
+    print("Length seq2 =", len(seq2))
+    exit()
+
+scores = score_pairs([(seq1, seq2)])
+identity_score = scores["identity"][0]
+mismatch_penalty_score = scores["mismatch_penalty"][0]
+weighted_score = scores["weighted"][0]
+gap_identity_score = scores["gap_identity"][0]
+
+print(seq1)
+print(match_line(seq1, seq2))
+print(seq2)
+
+print("\nSimilarity scores:")
+print(f"1) Identity (%)              = {identity_score:.2f}")
+print(f"2) Mismatch penalty score    = {mismatch_penalty_score:.2f}")
+print(f"3) Weighted similarity score = {weighted_score:.2f}")
+print(f"4) Identity without gaps (%) = {gap_identity_score:.2f}")
@@ -0,0 +1,192 @@
+import tkinter as tk
+from tkinter import filedialog
+import matplotlib.pyplot as plt
+import math
+import numpy as np
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from bioinf.fasta import read_fasta
+from bioinf.motifs import Motif, MotifLibrary, load_motifs
+from bioinf.pwm import find_hits_lookahead, scan, threshold_for_pvalue
+
+motifs = [
+    "GTCATTACTA",
+    "ACACAATAGA",
+    "GCGAGGGGTG",
+    "GGGGGGGGGG",
+    "TTTTTTTTTT",
+    "AATCCAAAGA",
+    "AAGAACATAA",
+    "AGGGTTCAGG",
+    "CTATTGTCTT",
+]
+
+S = "CAGGTTGGAAACGTAATCAGCGATTACGCATGACGTAA"
+
+bases = ["A", "C", "G", "T"]
+
+L = len(motifs[0])
+N = len(motifs)
+background = 0.25
+pseudocount = 1
+
+# 1) Count matrix
+count = {b: [0]*L for b in bases}
+
+for m in motifs:
+    for i, ch in enumerate(m):
+        count[ch][i] += 1
+
+
+# 2) Weight matrix
+pwm = {b: [0]*L for b in bases}
+for i in range(L):
+    col_total = sum(count[b][i] for b in bases) + 4*pseudocount  # N + 4
+    for b in bases:
+        pwm[b][i] = (count[b][i] + pseudocount) / col_total
+
+
+# 3) Relative frequencies matrix
+
+freq = {b: [count[b][i]/N for i in range(L)] for b in bases}
+
+
+# 4) Log-likelihood matrix: ln(pwm / 0.25)
+
+ll = {b: [math.log(pwm[b][i] / background) for i in range(L)] for b in bases}
+
+def print_matrix(title, mat, decimals=3):
+    print("\n" + title)
+    header = "pos  " + "  ".join(str(i+1).rjust(5) for i in range(L))
+    print(header)
+    for b in bases:
+        row = b + "   " + "  ".join(f"{mat[b][i]:>{5}.{decimals}f}" for i in range(L))
+        print(row)
+
+print_matrix("1) COUNT matrix", count, decimals=0)
+print_matrix("2) WEIGHT matrix (PWM probabilities, with +1 pseudocount)", pwm, decimals=3)
+print_matrix("3) RELATIVE FREQUENCIES matrix (count/N)", freq, decimals=3)
+print_matrix("4) LOG-LIKELIHOODS matrix ln(pwm/0.25)", ll, decimals=3)
+
+
+# 5) Scan S with sliding windows of length 10
+
+print("\n5) Sliding window scores (window length = 10):")
+scores = []
+for start in range(len(S) - L + 1):
+    window = S[start:start+L]
+    score = 0.0
+    for i, ch in enumerate(window):
+        score += ll[ch][i]
+    scores.append((start+1, window, score))
+
+# print all scores
+for pos, w, sc in scores:
+    print(f"pos {pos:2d}: {w}   score = {sc:.3f}")
+
+# best hit
+best = max(scores, key=lambda x: x[2])
+print("\nBest window:")
+print(f"pos {best[0]}: {best[1]}   score = {best[2]:.3f}")
+
+# show windows that look "motif-like" 
+print("\nWindows with positive score:")
+for pos, w, sc in scores:
+    if sc > 0:
+        print(f"pos {pos:2d}: {w}   score = {sc:.3f}")
+
+
+#Scan genome
+LL = np.array([ll[b] for b in bases])
+P_VALUE = 1e-4
+THRESHOLD = threshold_for_pvalue(LL, P_VALUE)
+
+def scan_genome(sequence, matrix):
+    # forward and reverse strand scores per window start, NaN where the window has a non-ACGT base
+    return scan(sequence, matrix)
+
+#Plot signal
+def plot_signal(forward, reverse, genome_name):
+    positions = np.arange(1, len(forward) + 1)
+    plt.figure()
+    plt.plot(positions, forward, label="+ strand")
+    plt.plot(positions, reverse, label="- strand", alpha=0.7)
+    plt.axhline(0)
+    plt.axhline(THRESHOLD, color="red", linestyle="--", label=f"p = {P_VALUE:g}")
+    plt.xlabel("Genome position")
+    plt.ylabel("Log-likelihood score")
+    plt.title(f"Motif signal: {genome_name}")
+    plt.legend()
+    plt.show()
+
+#Button action
+def select_fasta_files():
+    filepaths = filedialog.askopenfilenames(
+        title="Select influenza FASTA files",
+        filetypes=[("FASTA files", "*.fasta *.fa *.txt")]
+    )
+
+    for path in filepaths:
+        sequence = read_fasta(path)
+        forward, reverse = scan_genome(sequence, LL)
+        genome_name = path.split("/")[-1]
+        positions, strands, hit_scores, stats = find_hits_lookahead(sequence, LL, THRESHOLD)
+        print(f"\n{genome_name}: {len(positions)} hits with score >= {THRESHOLD:.3f} (p <= {P_VALUE:g})")
+        print(f"  {stats['pruned']} of {stats['windows']} windows pruned early, "
+              f"{stats['evaluated']} of {stats['full']} positions scored")
+        for pos, strand, sc in zip(positions, strands, hit_scores):
+            print(f"  pos {pos + 1:5d} ({strand})   score = {sc:.3f}")
+        plot_signal(forward, reverse, genome_name)
+
+#Library button action
+def scan_with_library():
+    library_paths = filedialog.askopenfilenames(
+        title="Select motif library files (JASPAR or MEME)",
+        filetypes=[("Motif files", "*.jaspar *.pfm *.meme *.txt"), ("All files", "*.*")]
+    )
+    if not library_paths:
+        return
+    filepaths = filedialog.askopenfilenames(
+        title="Select FASTA files",
+        filetypes=[("FASTA files", "*.fasta *.fa *.txt")]
+    )
+    if not filepaths:
+        return
+
+    # the lab motif is scanned together with the library
+    library = MotifLibrary([Motif("lab12", "lab12", LL)] + load_motifs(list(library_paths)), pvalue=P_VALUE)
+    records = ((path.split("/")[-1], read_fasta(path)) for path in filepaths)
+    hits, names = library.scan_records(records)
+    out_path = os.path.join(os.path.dirname(filepaths[0]), "motif_hits.tsv")
+    library.write_hits(hits, names, out_path)
+    print(f"\n{len(hits)} hits of {len(library.motifs)} motifs in {len(names)} genomes (p <= {P_VALUE:g})")
+    print(f"Hit table saved to {out_path}")
+
+#Tkinter window
+root = tk.Tk()
+root.title("Influenza Motif Scanner")
+root.geometry("300x200")
+
+btn = tk.Button(
+    root,
+    text="Select FASTA files",
+    command=select_fasta_files,
+    font=("Arial", 12),
+    padx=10,
+    pady=10
+)
+btn.pack(expand=True)
+
+btn_library = tk.Button(
+    root,
+    text="Scan with motif library",
+    command=scan_with_library,
+    font=("Arial", 12),
+    padx=10,
+    pady=10
+)
+btn_library.pack(expand=True)
+
+root.mainloop()
@@ -5,9 +5,14 @@
 # 3. Show the percentage for each combination in the output of your implementation.
 
 import itertools
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from bioinf.packed import count_kmers
+
 def calculate_percentages():
     S = seq_entry.get().strip().upper()
     S = "".join([s for s in S if s in "ACGT"])
@@ -20,14 +25,9 @@ def calculate_percentages():
     results = []
 
     di_combos = [''.join(p) for p in itertools.product(bases, repeat=2)]
-    di_counts = {combo: 0 for combo in di_combos}
+    di_counts = dict(zip(di_combos, count_kmers(S, 2).tolist()))
     total_di = len(S) - 1 if len(S) > 1 else 0
 
-    for i in range(total_di):
-        dinuc = S[i:i+2]
-        if dinuc in di_counts:
-            di_counts[dinuc] += 1
-
     results.append("Dinucleotide Percentages:\n")
     results.append(f"{'Dinuc':<6}{'Count':>8}{'Percent':>12}")
     results.append("-" * 30)
@@ -38,14 +38,9 @@ def calculate_percentages():
 
 
     tri_combos = [''.join(p) for p in itertools.product(bases, repeat=3)]
-    tri_counts = {combo: 0 for combo in tri_combos}
+    tri_counts = dict(zip(tri_combos, count_kmers(S, 3).tolist()))
     total_tri = len(S) - 2 if len(S) > 2 else 0
 
-    for i in range(total_tri):
-        trinuc = S[i:i+3]
-        if trinuc in tri_counts:
-            tri_counts[trinuc] += 1
-
     results.append("\n\nTrinucleotide Percentages:\n")
     results.append(f"{'Trinuc':<6}{'Count':>8}{'Percent':>12}")
     results.append("-" * 30)
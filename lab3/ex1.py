@@ -7,6 +7,11 @@
 # Implement an application that calculates the melting temperature of a DNA sequence using one of these formulas or both. Input = a string of DNA, Output = temperature in celsius
 
 import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from bioinf.tm import tm_nn
 
 def calculate_tm_basic(dna_sequence):
     dna_sequence = dna_sequence.upper()
@@ -27,13 +32,19 @@ def calculate_tm_advanced(dna_sequence, na_conc=0.05):
     tm = 81.5 + 16.6 * math.log10(na_conc) + 0.41 * gc_content - (600 / length)
     return tm
 
+def calculate_tm_nn(dna_sequence, na_conc=0.05, mg_conc=0.0, dntp_conc=0.0):
+    # nearest-neighbor (SantaLucia) model; concentrations in M as above, bioinf.tm takes mM
+    return tm_nn(dna_sequence.upper(), na=na_conc * 1000, mg=mg_conc * 1000, dntp=dntp_conc * 1000)
+
 if __name__ == "__main__":
     dna = input("Enter a DNA sequence: ").strip()
 
     tm_basic = calculate_tm_basic(dna)
     tm_advanced = calculate_tm_advanced(dna)
+    tm_nearest = calculate_tm_nn(dna)
 
     print(f"\nDNA Sequence: {dna}")
     print(f"Length: {len(dna)} bases")
     print(f"Basic Formula Tm: {tm_basic:.2f} °C")
     print(f"Advanced Formula Tm: {tm_advanced:.2f} °C")
+    print(f"Nearest-Neighbor Tm: {tm_nearest:.2f} °C")
@@ -1,19 +1,18 @@
 #design an app that uses the sliding window method in order to read the tm over the sequence S. 
 # use a sliding window f 8 positions and choose a FASTA file as input
 
+import os
+import sys
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
 import math
 import matplotlib.pyplot as plt
 
-
-def read_fasta(filename):
-    seq = ""
-    with open(filename, 'r') as f:
-        for line in f:
-            if not line.startswith(">"):
-                seq += line.strip().upper()
-    return seq
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from bioinf.fasta import read_fasta
+from bioinf.primers import design_primers
+from bioinf.tm import tm_windows
+from bioinf.windows import window_counts
 
 
 def tm_basic(seq):
@@ -32,14 +31,20 @@ def tm_advanced(seq, na_conc=0.05):
     return 81.5 + 16.6 * math.log10(na_conc) + 0.41 * gc_content - (600 / length)
 
 
-def sliding_window_tm(sequence, window_size=8, na_conc=0.05):
-    results = []
-    for i in range(len(sequence) - window_size + 1):
-        window = sequence[i:i + window_size]
-        tm_b = tm_basic(window)
-        tm_a = tm_advanced(window, na_conc)
-        results.append((i + 1, window, tm_b, tm_a))
-    return results
+def sliding_window_tm(sequence, window_size=8, na_conc=0.05, mg_conc=0.0):
+    starts, counts = window_counts(sequence, window_size, alphabet="ACGT")
+    a, c, g, t = counts.T
+    tm_b = 4 * (g + c) + 2 * (a + t)
+    gc_content = (g + c) / window_size * 100
+    tm_a = 81.5 + 16.6 * math.log10(na_conc) + 0.41 * gc_content - (600 / window_size)
+    _, tm_n = tm_windows(sequence, [window_size], na=na_conc * 1000, mg=mg_conc * 1000)
+    return [(i + 1, sequence[i:i + window_size], b, adv, nn)
+            for i, b, adv, nn in zip(starts.tolist(), tm_b.tolist(), tm_a.tolist(), tm_n[0].tolist())]
+
+
+def tm_map(sequence, lengths=range(18, 31), na_conc=0.05, mg_conc=0.0):
+    # nearest-neighbor Tm of every window of every candidate primer length, one row per length
+    return tm_windows(sequence, lengths, na=na_conc * 1000, mg=mg_conc * 1000)
 
 
 class TMApp:
@@ -68,20 +73,29 @@ class TMApp:
         self.na_entry.insert(0, "0.05")
         self.na_entry.grid(row=0, column=4, padx=5)
 
-        ttk.Button(frame, text="Run", command=self.run_analysis).grid(row=0, column=5, padx=10)
+        ttk.Label(frame, text="[Mg2+] (M):").grid(row=0, column=5)
+        self.mg_entry = ttk.Entry(frame, width=7)
+        self.mg_entry.insert(0, "0")
+        self.mg_entry.grid(row=0, column=6, padx=5)
+
+        ttk.Button(frame, text="Run", command=self.run_analysis).grid(row=0, column=7, padx=10)
 
-        self.tree = ttk.Treeview(root, columns=("pos", "window", "tm_basic", "tm_adv"), show="headings", height=15)
+        self.tree = ttk.Treeview(root, columns=("pos", "window", "tm_basic", "tm_adv", "tm_nn"), show="headings", height=15)
         self.tree.heading("pos", text="Position")
         self.tree.heading("window", text="Window")
         self.tree.heading("tm_basic", text="Tm (Basic °C)")
         self.tree.heading("tm_adv", text="Tm (Advanced °C)")
+        self.tree.heading("tm_nn", text="Tm (Nearest-Neighbor °C)")
         self.tree.column("pos", width=80)
         self.tree.column("window", width=150)
         self.tree.column("tm_basic", width=120)
         self.tree.column("tm_adv", width=130)
+        self.tree.column("tm_nn", width=170)
         self.tree.pack(pady=10, fill=tk.BOTH, expand=True)
 
         ttk.Button(root, text="Show Graph", command=self.show_plot).pack(pady=5)
+        ttk.Button(root, text="Show Primer Tm Map (18-30 nt)", command=self.show_tm_map).pack(pady=5)
+        ttk.Button(root, text="Design Primers", command=self.show_primers).pack(pady=5)
 
     def load_fasta(self):
         file_path = filedialog.askopenfilename(filetypes=[("FASTA files", "*.fasta *.fa *.txt")])
@@ -102,17 +116,18 @@ class TMApp:
         try:
             window_size = int(self.window_entry.get())
             na_conc = float(self.na_entry.get())
+            mg_conc = float(self.mg_entry.get())
         except ValueError:
-            messagebox.showerror("Input Error", "Invalid window size or Na+ concentration.")
+            messagebox.showerror("Input Error", "Invalid window size or salt concentration.")
             return
 
-        results = sliding_window_tm(self.sequence, window_size, na_conc)
+        results = sliding_window_tm(self.sequence, window_size, na_conc, mg_conc)
 
         for row in self.tree.get_children():
             self.tree.delete(row)
 
-        for pos, window, tm_b, tm_a in results:
-            self.tree.insert("", tk.END, values=(pos, window, f"{tm_b:.2f}", f"{tm_a:.2f}"))
+        for pos, window, tm_b, tm_a, tm_n in results:
+            self.tree.insert("", tk.END, values=(pos, window, f"{tm_b:.2f}", f"{tm_a:.2f}", f"{tm_n:.2f}"))
 
         self.results = results
 
@@ -124,10 +139,12 @@ class TMApp:
         positions = [r[0] for r in self.results]
         tm_b_vals = [r[2] for r in self.results]
         tm_a_vals = [r[3] for r in self.results]
+        tm_n_vals = [r[4] for r in self.results]
 
         plt.figure(figsize=(10, 5))
         plt.plot(positions, tm_b_vals, label="Basic Tm (°C)", linestyle="--")
         plt.plot(positions, tm_a_vals, label="Advanced Tm (°C)")
+        plt.plot(positions, tm_n_vals, label="Nearest-Neighbor Tm (°C)")
         plt.title("Sliding Window Tm Profile")
         plt.xlabel("Position in Sequence")
         plt.ylabel("Melting Temperature (°C)")
@@ -136,6 +153,62 @@ class TMApp:
         plt.tight_layout()
         plt.show()
 
+    def show_tm_map(self):
+        if not self.sequence:
+            messagebox.showwarning("No Sequence", "Please load a FASTA file first.")
+            return
+
+        try:
+            na_conc = float(self.na_entry.get())
+            mg_conc = float(self.mg_entry.get())
+        except ValueError:
+            messagebox.showerror("Input Error", "Invalid salt concentration.")
+            return
+
+        lengths, tm = tm_map(self.sequence, range(18, 31), na_conc, mg_conc)
+
+        plt.figure(figsize=(10, 5))
+        plt.imshow(tm, aspect="auto", interpolation="nearest", cmap="coolwarm",
+                   extent=(0.5, tm.shape[1] + 0.5, lengths[-1] + 0.5, lengths[0] - 0.5))
+        plt.colorbar(label="Nearest-Neighbor Tm (°C)")
+        plt.title("Primer Tm Map")
+        plt.xlabel("Primer start in Sequence")
+        plt.ylabel("Primer length (nt)")
+        plt.tight_layout()
+        plt.show()
+
+    def show_primers(self):
+        if not self.sequence:
+            messagebox.showwarning("No Sequence", "Please load a FASTA file first.")
+            return
+
+        try:
+            na_conc = float(self.na_entry.get())
+            mg_conc = float(self.mg_entry.get())
+        except ValueError:
+            messagebox.showerror("Input Error", "Invalid salt concentration.")
+            return
+
+        pairs = design_primers(self.sequence, na=na_conc * 1000, mg=mg_conc * 1000)
+        if not pairs:
+            messagebox.showinfo("Primer Design", "No primer pair passed the filters.")
+            return
+
+        lines = []
+        for rank, pair in enumerate(pairs, start=1):
+            lines.append(f"{rank}. {pair.left} ({pair.left_tm:.1f} °C) / {pair.right} ({pair.right_tm:.1f} °C), "
+                         f"product {pair.product} bp at {pair.left_start + 1}-{pair.right_end}")
+
+        window = tk.Toplevel(self.root)
+        window.title(f"Primer Design - {len(pairs)} ranked pairs")
+        text = tk.Text(window, width=110, height=min(len(lines), 25) + 1, wrap="none")
+        scroll = ttk.Scrollbar(window, orient="vertical", command=text.yview)
+        text.configure(yscrollcommand=scroll.set)
+        scroll.pack(side="right", fill="y")
+        text.pack(side="left", fill="both", expand=True)
+        text.insert("1.0", "\n".join(lines))
+        text.configure(state="disabled")
+
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -0,0 +1,26 @@
+#Implement an application that converts the coding region of a gene into an amino acid sequence. Use the genetic code from from below
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from bioinf.translate import THREE_LETTER, find_orfs, orf_proteins, six_frames, translate
+
+def translate_gene(rna_sequence, table=1):
+    rna_sequence = rna_sequence.upper().replace(" ", "").replace("\n", "")
+
+    # codons are looked up as numbers 0-63 in the genetic code table; translation ends at the first stop
+    protein = translate(rna_sequence, table=table, to_stop=True)
+    return ''.join(THREE_LETTER.get(aa, '?') for aa in protein)
+
+rna = "AUGGCCAUGGCGCCCAGAACUGAGAUCAAUAGUACCCGUAUUAACGGGUGA"
+protein = translate_gene(rna)
+print("Amino acid sequence:", protein)
+
+for frame, frame_protein in six_frames(rna).items():
+    print(f"Frame {frame}: {frame_protein}")
+
+orfs = find_orfs(rna, min_length=5)
+for orf, orf_protein in zip(orfs, orf_proteins(rna, orfs)):
+    strand = "+" if orf["strand"] > 0 else "-"
+    print(f"ORF {orf['start'] + 1}-{orf['end']} ({strand}): {orf_protein}")
@@ -0,0 +1,76 @@
+#download from NCBI the FASTA files containing the COVID-19 genome and the influenza genome. use AI to compare the codon frequencies between the two. 
+#a) make a chart that shows the top 10 most frequent codons for COVID-19. 
+#b)make a chart that shows the top 10 most frequent codons for influenza 
+#c)compare the two results and show the most frequent codons between the two d)show in the output of the console top 3 amino acids for each genome
+
+import os
+import sys
+import matplotlib.pyplot as plt
+from collections import Counter
+import matplotlib
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from bioinf.codons import cai, merge, profile_files, relative_adaptiveness, stack, usage_distance, write_tables
+from bioinf.translate import THREE_LETTER, codon_names, codon_table
+
+RNA_CODONS = [codon.replace('T', 'U') for codon in codon_names()]
+AMINO_ACIDS = codon_table(1)[0]
+
+def codon_frequency(usage, frame=0):
+    # usage holds the 64 codon counts of each reading frame, counted while the file was streamed
+    return Counter({codon: count for codon, count in zip(RNA_CODONS, usage.counts[frame].tolist()) if count})
+
+def amino_acid_frequency(codon_counts):
+    aa_counts = Counter()
+    for codon, count in codon_counts.items():
+        aa = THREE_LETTER[chr(AMINO_ACIDS[RNA_CODONS.index(codon)])]
+        if aa != 'Stop':
+            aa_counts[aa] += count
+    return aa_counts
+
+def plot_top_codons(codon_counts, title, savefile=None):
+
+    top_codons = codon_counts.most_common(10)
+    codons, freqs = zip(*top_codons)
+    plt.bar(codons, freqs)
+    plt.title(title)
+    plt.xlabel("Codon")
+    plt.ylabel("Frequency")
+    plt.tight_layout()
+    if savefile:
+        plt.savefig(savefile)
+    else:
+        plt.show()
+
+if __name__ == "__main__":
+    lab_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+    fasta_paths = sys.argv[1:] or [os.path.join(lab_dir, "covid_genome.fasta"),
+                                   os.path.join(lab_dir, "influenza_genome.fasta")]
+
+    usages = profile_files(fasta_paths, workers=None)
+    all_codons = [codon_frequency(usage) for usage in usages]
+
+    for usage, codons in zip(usages, all_codons):
+        name = os.path.splitext(usage.name)[0]
+        plot_top_codons(codons, f"Top 10 Codons - {name}", f"{name}_codons.png")
+        plt.show()
+
+    common_codons = set.intersection(*[set(codon for codon, _ in codons.most_common(10)) for codons in all_codons])
+    print("Common frequent codons:", common_codons)
+
+    for usage, codons in zip(usages, all_codons):
+        print(f"\nTop 3 amino acids - {usage.name}:")
+        for aa, count in amino_acid_frequency(codons).most_common(3):
+            print(f"{aa}: {count}")
+
+    counts = stack(usages)
+    weights = relative_adaptiveness(merge(usages).counts[0])
+    print("\nCAI against the pooled codon usage:")
+    for usage, value in zip(usages, cai(counts, weights).tolist()):
+        print(f"{usage.name}: {value:.3f}")
+
+    print("\nCodon usage distance matrix:")
+    print(usage_distance(counts).round(4))
+
+    write_tables(usages, "codon_usage")
+    print("\nRSCU, amino acid, CAI and distance tables saved to codon_usage_*.tsv")
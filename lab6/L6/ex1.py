@@ -5,9 +5,14 @@
 #3. Store these samples in an array.
 #4. Simulate the migration of these DNA segments on the electrophoresis gel, based on their molecular weights - however, their length should be sufficient for this exercise (show a visual representation).
 
+import os
 import random
+import sys
 import matplotlib.pyplot as plt
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from bioinf.gel import GelModel, band_rows, ladder_bands, lane_bands, render_gel
+
 master_seq = "TGCTCGTCTATACTTTCACAATCTTGACCTGCACGGCAAAGAGACGCTTCTTGTGGAGCTCGACAACGCAACAACGCGACGGATCTACGTCACAGCGAGTATAGTGAAAACGAAGTTGCTGACGGCGGAAGCGACATAGGGATCTGTCAGTTGTCATTCGCGAAAAACATCCGTCCCCGAGGGGGACAGTCACTGACGCGGTTTTGTAGAAGCCTAGGGGAACAGGTTAGTTTGAGTAGCTTAAGAATGTAAATTCTGGGATTATAGTGTAGTAATCTCTAATTAACGGTGACGGTTTTAAGACAGGTCTTCGCAAAATCAAGCGGGGTGATTTCAACAGATTTTGCTGATGGTTTAGGCGTACAATGCCCTGAAGAATAATTAAGAAAATAGCACTCCTCGTCGCCTAGAATTACCTACCGGCGTCCACCATACCTTCGATTATCGCGCCCACTCTCCCATTAGTCGGCACAGGTGGATGTGTTGCGATAGCCCGCTAAGATATTCTAAGGCGTAACGCAGATGAATATTCTACAGAGTTGCCATAGGCGTTGAACGCTTCACGGACGATAGGAATTTGCGTATAGAGCGGGTCATCGAAGGGTTATACACTCGTAGTTAACATCTAGCCCGGCTCTATCAGTACACCAGTGCCTTGAATGACATACTCATCATTAAACTTTCTCAACAGTCAAACGACCAAGTGCATTTCCAAGGAGTGCGATGGAGATTCATTCTCTCGCCAGCACTGTAATAGGCACTAAAAGAGTGATGATAATCATGAGTGCCGTGCTAAGACGGTGTCGGAACAAAGCGGTCTTACGGTCAGTCGTATTTCCTCTCGAGTCCCGTCCAGTTGAGCGTATCACTCCCAGTGTACTAGCAAGCCGAGAAGGCTGTGCTTGGAGTCAATCGGATGTAGGATGGTCTCCAGACACCGGGCCACCACTCTTCACGCCTAAAGCATAAACGTCGAGCAGTCATGAAAGTCTTAGTACCGGACGTGCCGTTTCACTGCGAATATTACCTGAAGCTGTACCGTTATTGCGGAGCAAAGATGCAGTGCTGCTCTTATCATATTTGTATTGACGACAGCCGCCTTCGCGGTTTCCTCAGACACTTAAGAATAAGGGCTTATTGTAGGCAGAGGCACGCCCTTTTAGTGGCTGCGGCAAAATATCTTCGGATCCCCTTGTCTAACCAAATTAATCGAATTCTCTCATTTAAGACCCTAATATGTCATCATTAGTGTTTAAATGCCACCCCGAAAATACCGCCTAGAAATGTCTATGATTGGTCCACTAAAGTTGATTAAAACGACTGCTAAATCCGCGTGATAGGGCATTTGAAGTTTAATTTTGTATCGCAAGGTACTCCCGATCTTAATGGATGGCCGGAAGTGGTACGGATGCAATAAGCGCGGGTGAGAGGGTAATTAGGCGCGTTCACCTACGCTACGCTAACGGGCGATTCTATAAGAATGCACATTGCGTCGATTCATAAGATGTCTCGACCGCATGCGCAACTTGTGAAGTGTCTACTATCCCTAAGCGCATATCTCGCACAGTAACCCCCGAATATGTCGGCATCTGATGTTACCCGGGTTGAGTTAGTGTTGAGCTCACGGAACTTATTGTATGAGTAGAGATTTGTAAGAGCTGTTAGTTAGCTCGCTCAGCTAATAGTTGCCCACACAACGTCAAAATTAGAGAACGGTCGTAACATTATCGGTGGTTCTCTAACTACTATCAGTACCCACGACTCGACTCTGCCGCAGCTACGTATCGCCTGAAAGCCAGTCAGCGTTAAGGAGTGCTCTGACCAGGACAACACGCGTAGTGAGAGTTACATGTTCGTTGGGCTCTTCCGACTCGGACCTGAGTTGGCCAACGACCCACTTGAGGTCTGAGCCCCGGTGATGAGAAGTATGCATCTCGTTCCCGCAGCTTGCCAGCACTTTCAGAATCATGGCGTGCATGGTAGAATGACTCTTATAACGGACTTCGACATGGCAATATCCCCCCCTTTCAACTTCTAGAGGAGAAAAGTATTGACATGAGCGCTCCCGGCACAACGGCCAAAGAAGTCTCCAATTTCTTATTTCCGAATGACATGCGTCTCCTTGCGGGTAAATCGCCGACCGCAAAACTTAGGAGCCAGGGGGAACAGATAGGTCTAATTAGCTTAAGGGAGTAAATCCTGGGATCGTTCAGTTGTAACCATATACTTACGCTGGGGCTTCTCCGGCGGATTTTTACTGTCACCAACCACGAGATTTGAAGTAAACCAATTGAGCACATAGCCGCGCTATCCGACAATCTCCAAATTATAACATACCGTTCCATGAAGGCCAGAATTACTTACCGGCCCTTTCCATGCGTGCGCCATACCCCCCCACTCCCCCGCTTATCCGTCCGAGGGGAGAGTGTGCGATCCTCCGTTAAGATATTCTTACGTATGACGTAGCTATGTATTTTGCAGAGGTAGCGAACGCGTTGAA"
 seq_length = len(master_seq)
 print(f"DNA sequence length: {seq_length} bp")
@@ -26,19 +31,21 @@ for i in range(num_fragments):
 
 print("Fragment lengths (bp):", fragment_lengths)
 
-K = 1000
-migration_distances = [K / length for length in fragment_lengths]
+# log-linear mobility over a 100 bp - 10 kb gel; band brightness follows DNA mass
+model = GelModel.from_range(100, 10000)
+ladder = ladder_bands(model)
+sample = lane_bands(fragment_lengths, model)
+image, columns = render_gel([ladder, sample], model)
 
 plt.figure(figsize=(6, 8))
-lane = 1
-for i, dist in enumerate(migration_distances):
-    plt.plot([lane - 0.4, lane + 0.4], [dist, dist], color='blue', linewidth=8)
-    plt.text(lane + 0.5, dist, f"{fragment_lengths[i]} bp", va='center')
+plt.imshow(image, cmap="gray", aspect="auto")
+for band, row in zip(sample, band_rows(sample, model, image.shape[0])):
+    label = f"{band['size']:.0f} bp" if band['fragments'] == 1 else f"~{band['size']:.0f} bp ({band['fragments']} fragments)"
+    plt.text(image.shape[1] + 3, row, label, va='center', fontsize=8)
 
-plt.gca().invert_yaxis()
 plt.title("Simulated Gel Electrophoresis")
-plt.xlabel("Lane")
-plt.ylabel("Migration Distance (arbitrary units)")
-plt.xlim(0, 2)
-plt.ylim(0, max(migration_distances) + 2)
+plt.xticks([(c.start + c.stop) / 2 for c in columns], ["Ladder", "Sample"])
+plt.yticks(band_rows(ladder, model, image.shape[0]), [f"{size:.0f}" for size in ladder["size"]], fontsize=7)
+plt.ylabel("Ladder size (bp)")
+plt.xlim(0, image.shape[1] + 120)
 plt.show()
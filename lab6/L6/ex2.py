@@ -1,50 +1,26 @@
 import os
+import sys
 import glob
-from collections import defaultdict
 import numpy as np
 import matplotlib.pyplot as plt
-from Bio import SeqIO
 
-FASTA_DIR = "C:/Users/msuru/Desktop/BIOINF/lab6/influenza_fastas"
-OUTPUT_DIR = "C:/Users/msuru/Desktop/BIOINF/lab6/gel_outputs" 
-ENZYME_SITE = "GAATTC"         
-K = 1000.0
-ALPHA = 1.0
-MAX_LANE_WIDTH = 0.6
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from bioinf.digest import Digester, fragment_lengths, load_enzymes
+from bioinf.fasta import read_fasta
+from bioinf.gel import GelModel, band_rows, ladder_bands, lane_bands, render_gel
+
+LAB_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+FASTA_DIR = os.path.join(LAB_DIR, "influenza_fastas")
+OUTPUT_DIR = os.path.join(LAB_DIR, "gel_outputs")
+ENZYME = load_enzymes()["EcoRI"]
 
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 os.makedirs(os.path.join(OUTPUT_DIR, "separate_gels"), exist_ok=True)
 
-def read_and_concatenate_fasta(fasta_path):
-
-    seqs = []
-    for rec in SeqIO.parse(fasta_path, "fasta"):
-        seqs.append(str(rec.seq).upper())
-    concatenated = "".join(seqs)
-    return concatenated
-
-def digest_sequence(seq, site):
-
-    if len(site) == 0:
-        raise ValueError("Enzyme site must be non-empty.")
-    parts = seq.split(site)
-    lengths = [len(p) for p in parts if len(p) > 0]
-    return lengths
+def digest_sequence(seq, enzyme):
 
-def simulate_migration(lengths, K=K, alpha=ALPHA):
-    return [K / (l ** alpha) for l in lengths]
-
-def plot_single_lane(ax, fragment_lengths, migrations, lane_center_x=1.0, color='tab:blue', label=None):
-    x0 = lane_center_x - MAX_LANE_WIDTH
-    x1 = lane_center_x + MAX_LANE_WIDTH
-    pairs = sorted(zip(fragment_lengths, migrations), key=lambda p: p[1])
-    for (length, dist) in pairs:
-        ax.hlines(y=dist, xmin=x0, xmax=x1, linewidth=8, color=color, alpha=0.8)
-        ax.text(x1 + 0.08, dist, f"{length} bp", va='center', fontsize=7)
-
-    if label:
-        ax.text(lane_center_x, ax.get_ylim()[1] + 0.1 * (ax.get_ylim()[1] - ax.get_ylim()[0]),
-                label, ha='center', va='bottom', fontsize=8, rotation=90)
+    cuts = Digester([enzyme]).cut_sites(seq)[enzyme.name]
+    return fragment_lengths(len(seq), cuts).tolist()
 
 fasta_paths = sorted(glob.glob(os.path.join(FASTA_DIR, "*.fasta")) + glob.glob(os.path.join(FASTA_DIR, "*.fa")))
 if len(fasta_paths) == 0:
@@ -57,16 +33,14 @@ for p in fasta_paths:
 results = []
 for path in fasta_paths:
     name = os.path.basename(path)
-    seq = read_and_concatenate_fasta(path)
+    seq = read_fasta(path)
     seq_len = len(seq)
-    frag_lengths = digest_sequence(seq, ENZYME_SITE)
-    migrations = simulate_migration(frag_lengths, K=K, alpha=ALPHA)
+    frag_lengths = digest_sequence(seq, ENZYME)
 
     results.append({
         "filename": name,
         "seq_len": seq_len,
         "fragment_lengths": frag_lengths,
-        "migrations": migrations,
         "n_fragments": len(frag_lengths)
     })
 
@@ -77,45 +51,38 @@ for r in results:
 
 print(f"\nGenome with the most fragments: {most['filename']} ({most['n_fragments']} fragments)")
 
+if sum(r['n_fragments'] for r in results) == 0:
+    raise RuntimeError("No fragments computed (unexpected). Check your sequences or enzyme site.")
+
+# log-linear mobility from 100 bp up to the longest fragment; the whole gel is rendered as one image
+longest = max(l for r in results for l in r['fragment_lengths'])
+model = GelModel.from_range(100, max(longest, 10000) * 1.2)
+ladder = ladder_bands(model)
+lanes = [lane_bands(r['fragment_lengths'], model) for r in results]
+image, columns = render_gel([ladder] + lanes, model)
+ladder_rows = band_rows(ladder, model, image.shape[0])
+ladder_labels = [f"{size:.0f}" for size in ladder["size"]]
+
 fig_width = max(6, len(results) * 0.8)
 fig, ax = plt.subplots(figsize=(fig_width, 8))
-
-all_migrations = [m for r in results for m in r['migrations']]
-if len(all_migrations) == 0:
-    raise RuntimeError("No fragments computed (unexpected). Check your sequences or enzyme site.")
-y_min = 0
-y_max = max(all_migrations) * 1.15
-
-for i, r in enumerate(results):
-    lane_x = i + 1
-    color = plt.cm.tab10(i % 10)
-    plot_single_lane(ax, r['fragment_lengths'], r['migrations'], lane_center_x=lane_x, color=color, label=r['filename'])
-
-ax.set_xlim(0.5, len(results) + 0.5)
-ax.set_ylim(y_max, y_min)
-ax.invert_yaxis()
-ax.set_xticks([i+1 for i in range(len(results))])
-ax.set_xticklabels([os.path.splitext(r['filename'])[0] for r in results], rotation=90, fontsize=8)
-ax.set_ylabel("Migration distance (arb. units)")
+ax.imshow(image, cmap="gray", aspect="auto")
+ax.set_xticks([(c.start + c.stop) / 2 for c in columns])
+ax.set_xticklabels(["Ladder"] + [os.path.splitext(r['filename'])[0] for r in results], rotation=90, fontsize=8)
+ax.set_yticks(ladder_rows)
+ax.set_yticklabels(ladder_labels, fontsize=7)
+ax.set_ylabel("Ladder size (bp)")
 ax.set_title(f"Simulated EcoRI (GAATTC) digestion - Combined gel for {len(results)} genomes")
 plt.tight_layout()
 combined_path = os.path.join(OUTPUT_DIR, "combined_gel.png")
 plt.savefig(combined_path, dpi=300)
 print(f"Saved combined gel to: {combined_path}")
 plt.show()
-for r in results:
-    fig, ax = plt.subplots(figsize=(3, 6))
-    ax.set_ylim(y_max, y_min)
-    ax.invert_yaxis()
-    plot_single_lane(ax, r['fragment_lengths'], r['migrations'], lane_center_x=1.0, color='tab:blue', label=r['filename'])
-    ax.set_xlim(0.5, 1.5)
-    ax.set_xticks([])
-    ax.set_ylabel("Migration distance (arb. units)")
-    ax.set_title(r['filename'])
-    plt.tight_layout()
+
+# every genome as the ladder and its lane cut from the combined image, written straight from the array
+ladder_strip = image[:, :columns[0].stop + columns[0].start]
+for r, cols in zip(results, columns[1:]):
     outfn = os.path.join(OUTPUT_DIR, "separate_gels", f"{os.path.splitext(r['filename'])[0]}_gel.png")
-    plt.savefig(outfn, dpi=300)
-    plt.close(fig)
+    plt.imsave(outfn, np.hstack((ladder_strip, image[:, cols.start:cols.stop + columns[0].start])), cmap="gray", vmin=0, vmax=1)
 
 print(f"Saved separate gel images to: {os.path.join(OUTPUT_DIR, 'separate_gels')}")
 
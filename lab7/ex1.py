@@ -3,27 +3,19 @@
 # 3.Plot the sequence of the repetitions found.
 # 4. Download 10 influenza genoms. For each, plot the frequences of found repetitions.
 
+import os
+import sys
 import tkinter as tk
 from tkinter import filedialog
 import matplotlib.pyplot as plt
 
-def read_fasta(filepath):
-    with open(filepath, "r") as f:
-        lines = [line.strip() for line in f if not line.startswith(">")]
-    return "".join(lines).upper()
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from bioinf.suffix import SuffixIndex, open_index
+from bioinf.tandem import MICRO_MAX_PERIOD, find_tandem_repeats, repeat_units
 
 def find_repeats(seq, min_len=6, max_len=10):
-    repeats = {}
-    for length in range(min_len, max_len + 1):
-        seen = {}
-        for i in range(len(seq) - length + 1):
-            subseq = seq[i:i + length]
-            seen.setdefault(subseq, 0)
-            seen[subseq] += 1
-        for subseq, count in seen.items():
-            if count > 1:
-                repeats[subseq] = count
-    return repeats
+    index = seq if isinstance(seq, SuffixIndex) else SuffixIndex(seq)
+    return index.repeats(min_len, max_len)
 
 def plot_repeats_on_ax(repeats, genome_name, ax, top_n=20):
     if not repeats:
@@ -42,6 +34,23 @@ def plot_repeats_on_ax(repeats, genome_name, ax, top_n=20):
     ax.set_ylabel("Number of occurrences", fontsize=8)
     ax.set_xticklabels(subseqs, rotation=90, fontsize=8)
 
+def plot_tandem_map(hits, genome_name, ax):
+    if len(hits) == 0:
+        ax.text(0.5, 0.5, "No tandem repeats", ha='center', va='center')
+        ax.set_title(genome_name)
+        ax.axis("off")
+        return
+
+    micro = hits["period"] <= MICRO_MAX_PERIOD
+    for mask, color, label in ((micro, "tab:blue", "microsatellite"), (~micro, "tab:red", "minisatellite")):
+        if mask.any():
+            ax.hlines(hits["period"][mask], hits["start"][mask], hits["end"][mask],
+                      colors=color, linewidth=4, label=label)
+    ax.set_title(f"Tandem repeat map — {genome_name}", fontsize=10)
+    ax.set_xlabel("Position (bp)", fontsize=8)
+    ax.set_ylabel("Period (bp)", fontsize=8)
+    ax.legend(fontsize=8)
+
 if __name__ == "__main__":
     root = tk.Tk()
     root.withdraw()
@@ -57,6 +66,7 @@ if __name__ == "__main__":
     print(f"Selected {len(fasta_paths)} genome files")
 
     all_repeats = []
+    all_tandems = []
     genome_names = []
 
     for path in fasta_paths:
@@ -64,14 +74,25 @@ if __name__ == "__main__":
         genome_names.append(genome_name)
 
         print(f"\nProcessing {genome_name}...")
-        dna = read_fasta(path)
-        repeats = find_repeats(dna)
+        # suffix array + LCP, saved next to the FASTA and reused on the next run
+        index = open_index(path)
+        repeats = find_repeats(index)
         all_repeats.append(repeats)
 
         print(f"  Found {len(repeats)} repeated subsequences")
         for subseq, count in sorted(repeats.items(), key=lambda x: x[1], reverse=True)[:10]:
             print(f"    {subseq} -> {count} times")
 
+        longest = sorted(index.maximal_repeats(11), key=lambda r: len(r[0]), reverse=True)[:3]
+        for subseq, positions in longest:
+            print(f"    maximal repeat of {len(subseq)} bases at {(positions + 1).tolist()}")
+
+        tandems = find_tandem_repeats(index.text)
+        all_tandems.append(tandems)
+        print(f"  Found {len(tandems)} tandem repeats")
+        for hit, unit in zip(tandems[:10], repeat_units(index.text, tandems[:10])):
+            print(f"    {hit['start'] + 1}-{hit['end']}: ({unit}) x {hit['copies']:.1f}, purity {hit['purity']:.2f}")
+
     num_genomes = len(all_repeats)
     cols = 2
     rows = (num_genomes + cols - 1) // cols
@@ -85,5 +106,16 @@ if __name__ == "__main__":
     for j in range(i+1, len(axes)):
         axes[j].axis("off")
 
+    plt.tight_layout()
+
+    fig, axes = plt.subplots(rows, cols, figsize=(12, 4*rows))
+    axes = axes.flatten()
+
+    for i, tandems in enumerate(all_tandems):
+        plot_tandem_map(tandems, genome_names[i], axes[i])
+
+    for j in range(i+1, len(axes)):
+        axes[j].axis("off")
+
     plt.tight_layout()
     plt.show()
@@ -1,6 +1,11 @@
 #Ex2  Implement a software application to detect the positions of these transposable elements (start, end) within the created DNA sequence.
 
+import os
 import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+from bioinf.ahocorasick import AhoCorasick
 
 dna = "".join(random.choice("ACGT") for _ in range(300))
 TEs = ["AAAACCCCTTTT", "GGGTTAGGGT", "CCCTAACCC", "TTAGGTTAA"]
@@ -20,16 +25,9 @@ for te, pos in insert_positions:
     print(te, pos)
 
 def find_transposons(sequence, transposons):
-    results = []
-    for te in transposons:
-        start = 0
-        while True:
-            idx = sequence.find(te, start)
-            if idx == -1:
-                break
-            results.append((te, idx, idx + len(te)))
-            start = idx + 1
-    return results
+    # grouped per transposon, in library order, as the str.find loop reported them
+    order = {te: k for k, te in reversed(list(enumerate(transposons)))}
+    return sorted(AhoCorasick(transposons).find_all(sequence), key=lambda hit: order[hit[0]])
 
 detections = find_transposons(dna, TEs)
 
@@ -1,6 +1,12 @@
 #. Take an arbitrary DNA sequence from the NCBI (National Center for Biotechnology), between 1000 and 3000 nucleotides (letters). 
 # 2. Use 5 restriction enzymes (enzyme name, recognized sequence, cleavage site):   	
 
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from bioinf.digest import Digester, Enzyme
+
 enzymes = [
     {"name": "EcoRI", "recognition": "GAATTC", "cut_index": 1},
     {"name": "BamHI", "recognition": "GGATCC", "cut_index": 1},
@@ -18,23 +24,12 @@ ATGCCTGCAGGTCGACTCTAGAGGATCCCCGGGTACCGAGCTGAATTCACTGGCCGTCG
 TTTTACAACGTCGTGACTGGGAAAACCCTGGCGTTACCCAACTTAATCGCCTTGCAGCAC
 """.replace("\n", "")
 
-def find_cuts(dna, recognition, cut_index):
-    positions = []
-    start = 0
-    while True:
-        idx = dna.find(recognition, start)
-        if idx == -1:
-            break
-        positions.append(idx + cut_index)
-        start = idx + 1
-    return positions
-
 def digest(dna, enzymes):
-    cut_sites = {}
-    for enzyme in enzymes:
-        cuts = find_cuts(dna, enzyme["recognition"], enzyme["cut_index"])
-        cut_sites[enzyme["name"]] = cuts
-    return cut_sites
+    digester = Digester([
+        Enzyme(e["name"], e["recognition"], e["cut_index"], len(e["recognition"]) - e["cut_index"])
+        for e in enzymes
+    ])
+    return {name: cuts.tolist() for name, cuts in digester.cut_sites(dna).items()}
 
 def fragment_sizes(dna, cut_positions):
     cuts = sorted(cut_positions)